@@ -0,0 +1,84 @@
+from fastapi import Request
+
+from app.models.archived_order_item_model import ArchivedOrderItemModel
+from app.models.archived_order_model import ArchivedOrderModel
+from app.models.client_model import ClientModel
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_image_model import ProductImageModel
+from app.models.product_model import ProductModel
+from app.services.async_services import (
+    AsyncOrderService,
+    AsyncProductImportService,
+    AsyncProductService,
+    AsyncUserService
+)
+from app.services.auth_service import AuthService
+from app.services.jwt_service import JWTService
+from app.services.order_archive_service import OrderArchiveService
+from app.services.order_service import OrderService
+from app.services.password_service import PasswordService
+from app.services.principal_cache_service import principal_cache
+from app.services.product_cache_service import product_cache
+from app.services.product_import_service import ProductImportService
+from app.services.token_version_service import token_versions
+from app.services.product_service import ProductService
+from app.services.user_service import UserService
+
+
+class ServiceContainer:
+    """Application-wide service instances, built once per process.
+
+    The services keep no per-request state (the session is always passed
+    in), so a single instance of each can be shared by every worker thread.
+    """
+
+    def __init__(self):
+        self.principal_cache = principal_cache
+        self.token_versions = token_versions
+        self.product_cache = product_cache
+        self.jwt_service = JWTService()
+        self.password_service = PasswordService()
+        self.user_service = UserService(
+            ClientModel,
+            principal_cache=self.principal_cache,
+            token_version_service=self.token_versions
+        )
+        self.product_service = ProductService(
+            ProductModel,
+            ProductImageModel,
+            OrderItemModel,
+            product_cache=self.product_cache
+        )
+        self.product_import_service = ProductImportService(ProductModel, ProductImageModel)
+        self.order_service = OrderService(
+            OrderModel,
+            OrderItemModel,
+            self.product_service,
+            self.user_service,
+            ArchivedOrderModel,
+            ArchivedOrderItemModel
+        )
+        self.order_archive_service = OrderArchiveService(
+            OrderModel,
+            OrderItemModel,
+            ArchivedOrderModel,
+            ArchivedOrderItemModel
+        )
+        self.auth_service = AuthService(
+            user_service=self.user_service,
+            jwt_service=self.jwt_service,
+            password_service=self.password_service,
+            token_version_service=self.token_versions
+        )
+        self.async_user_service = AsyncUserService(self.user_service)
+        self.async_product_service = AsyncProductService(self.product_service)
+        self.async_product_import_service = AsyncProductImportService(self.product_import_service)
+        self.async_order_service = AsyncOrderService(self.order_service)
+
+    def shutdown(self) -> None:
+        self.password_service.shutdown()
+
+
+def get_container(request: Request) -> ServiceContainer:
+    return request.app.state.services
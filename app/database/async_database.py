@@ -0,0 +1,78 @@
+import os
+import threading
+from typing import Optional
+from fastapi import Depends, Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.database.database import DATABASE_URL, REPLICA_URLS
+from app.database.pool import pool_options
+from app.database.replica import ReplicaRouter
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+_engine: Optional[AsyncEngine] = None
+_replica_engines: list[AsyncEngine] = []
+_engine_lock = threading.Lock()
+AsyncSessionLocal = async_sessionmaker(class_=AsyncSession, autoflush=False)
+AsyncReplicaSessions = [async_sessionmaker(class_=AsyncSession, autoflush=False) for _ in REPLICA_URLS]
+async_replica_router = ReplicaRouter(AsyncReplicaSessions)
+
+
+def _create_engine(database_url: str) -> AsyncEngine:
+    options = pool_options(database_url)
+    if "pool_size" in options:
+        options["poolclass"] = AsyncAdaptedQueuePool
+    return create_async_engine(database_url, **options)
+
+
+def get_async_engine() -> AsyncEngine:
+    # Built on first use so the sync stack never needs an async driver installed.
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            database_url = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+            _engine = _create_engine(database_url)
+            AsyncSessionLocal.configure(bind=_engine)
+            for replica_url, sessions in zip(REPLICA_URLS, AsyncReplicaSessions):
+                replica_engine = _create_engine(to_async_url(replica_url))
+                sessions.configure(bind=replica_engine)
+                _replica_engines.append(replica_engine)
+        return _engine
+
+
+async def dispose_async_engine() -> None:
+    global _engine
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+    while _replica_engines:
+        await _replica_engines.pop().dispose()
+
+
+async def get_async_db():
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db(request: Request, db: AsyncSession = Depends(get_async_db)):
+    if not async_replica_router.use_replica(request):
+        yield db
+        return
+
+    get_async_engine()
+    async with async_replica_router.replica_session() as replica:
+        yield replica
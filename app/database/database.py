@@ -1,20 +1,51 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from fastapi import Depends, Request
+from sqlalchemy import DDL, event
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from dotenv import load_dotenv
 import os
+from app.database.pool import PoolMetrics, create_pooled_engine
+from app.database.replica import ReplicaRouter, replica_urls
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+REPLICA_URLS = replica_urls()
 
-engine = create_engine(DATABASE_URL)
+pool_metrics = PoolMetrics()
+engine = create_pooled_engine(DATABASE_URL, pool_metrics)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
+replica_engines = [create_pooled_engine(url, PoolMetrics()) for url in REPLICA_URLS]
+replica_router = ReplicaRouter([
+    sessionmaker(bind=replica_engine, autocommit=False, autoflush=False)
+    for replica_engine in replica_engines
+])
+
 Base = declarative_base()
 
+# The trigram search indexes need pg_trgm; alembic installs it as well.
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_read_db(request: Request, db: Session = Depends(get_db)):
+    # The primary session only connects on first use, so handing out a
+    # replica instead costs nothing on the primary pool.
+    if not replica_router.use_replica(request):
+        yield db
+        return
+
+    replica = replica_router.replica_session()
+    try:
+        yield replica
+    finally:
+        replica.close()
@@ -0,0 +1,78 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    def __init__(self, capture_statements: bool = False):
+        self.statements = 0
+        self.duration_ms = 0.0
+        self.captured: Optional[List[str]] = [] if capture_statements else None
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.statements += 1
+        self.duration_ms += duration_ms
+        if self.captured is not None:
+            self.captured.append(statement)
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(capture_statements: bool = False) -> Iterator[QueryStats]:
+    """Counts the statements executed in the current context.
+
+    The stats object travels with the context, so work done through
+    ``run_in_threadpool`` and ``AsyncSession.run_sync`` is counted too.
+    """
+    stats = QueryStats(capture_statements)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[QueryStats]:
+    """Counts every statement run on ``engine``, whichever thread runs it."""
+    stats = QueryStats(capture_statements=True)
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["count_queries_started_at"] = time.perf_counter()
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("count_queries_started_at", time.perf_counter())
+        stats.record(statement, (time.perf_counter() - started) * 1000)
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+        event.remove(engine, "after_cursor_execute", after)
+
+
+# Listening on the Engine class covers the primary, the replicas and the
+# sync side of the async engines; outside a tracked request this is a no-op.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None and context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started = getattr(context, "_query_started_at", None)
+    if stats is not None and started is not None:
+        stats.record(statement, (time.perf_counter() - started) * 1000)
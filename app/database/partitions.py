@@ -0,0 +1,111 @@
+"""Monthly range partitions of tb_orders and tb_order_items (PostgreSQL).
+
+Orders are partitioned on ``created_at`` and their items on the copy of it
+kept in ``order_created_at``, so an order and its items always live in
+partitions for the same month. Partitions have to exist before rows for
+their month arrive; create them ahead of time with
+
+    python -m app.database.partitions --months-ahead 3
+
+from cron, or let the application do it at startup (ORDER_PARTITIONING).
+"""
+import argparse
+import datetime
+import os
+from typing import Iterator, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+ORDER_PARTITIONING = os.getenv("ORDER_PARTITIONING", "false").lower() == "true"
+PARTITION_MONTHS_AHEAD = int(os.getenv("ORDER_PARTITION_MONTHS_AHEAD", "3"))
+# Most months an order listing walks one by one before reading the rest in
+# a single statement.
+PARTITION_WALK_MONTHS = int(os.getenv("ORDER_PARTITION_WALK_MONTHS", "12"))
+
+# Partitioned table -> the column it is partitioned on.
+PARTITIONED_TABLES = (
+    ("tb_orders", "created_at"),
+    ("tb_order_items", "order_created_at"),
+)
+
+
+def month_start(moment: datetime.datetime) -> datetime.datetime:
+    """First instant of the (UTC) month ``moment`` falls in."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(datetime.timezone.utc)
+    return datetime.datetime(moment.year, moment.month, 1, tzinfo=datetime.timezone.utc)
+
+
+def add_months(month: datetime.datetime, count: int) -> datetime.datetime:
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def month_windows(newest: datetime.datetime, oldest: datetime.datetime) -> Iterator[Tuple[datetime.datetime, datetime.datetime]]:
+    """``[start, end)`` of every month from ``newest``'s back to ``oldest``'s."""
+    month = month_start(newest)
+    last = month_start(oldest)
+    while month >= last:
+        yield month, add_months(month, 1)
+        month = add_months(month, -1)
+
+
+def partition_name(table: str, month: datetime.datetime) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def is_partitioned(connection: Connection, table: str = "tb_orders") -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return connection.execute(
+        text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"),
+        {"table": table}
+    ).first() is not None
+
+
+def create_month_partitions(connection: Connection, first: datetime.datetime, last: datetime.datetime) -> List[str]:
+    """Creates the partitions of every month from ``first``'s to ``last``'s.
+
+    Existing partitions are left alone, so this is safe to run repeatedly.
+    """
+    created = []
+    for start, end in reversed(list(month_windows(last, first))):
+        for table, _ in PARTITIONED_TABLES:
+            name = partition_name(table, start)
+            connection.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            created.append(name)
+    return created
+
+
+def ensure_future_partitions(
+    connection: Connection,
+    months_ahead: int = PARTITION_MONTHS_AHEAD,
+    today: Optional[datetime.datetime] = None
+) -> List[str]:
+    """Makes sure partitions exist from this month to ``months_ahead`` months on."""
+    if not is_partitioned(connection):
+        return []
+    today = today or datetime.datetime.now(datetime.timezone.utc)
+    return create_month_partitions(connection, today, add_months(month_start(today), months_ahead))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Create upcoming monthly order partitions.")
+    parser.add_argument("--months-ahead", type=int, default=PARTITION_MONTHS_AHEAD)
+    args = parser.parse_args()
+
+    from app.database.database import engine
+
+    with engine.begin() as connection:
+        if not is_partitioned(connection):
+            print("tb_orders is not partitioned; nothing to do.")
+            return
+        for name in ensure_future_partitions(connection, args.months_ahead):
+            print(name)
+
+
+if __name__ == "__main__":
+    main()
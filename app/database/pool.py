@@ -0,0 +1,102 @@
+import logging
+import os
+import threading
+import time
+from typing import Optional
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import Pool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    def __init__(self, warn_threshold_ms: Optional[float] = None):
+        if warn_threshold_ms is None:
+            warn_threshold_ms = float(os.getenv("DB_POOL_WAIT_WARN_MS", "100"))
+        self.warn_threshold_ms = warn_threshold_ms
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def record_checkout(self, wait_ms: float, pool: QueuePool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            slow = wait_ms > self.warn_threshold_ms
+            if slow:
+                self.slow_checkouts += 1
+
+        if slow:
+            logger.warning(
+                "Slow DB pool checkout: waited %.1f ms (threshold %.1f ms). %s",
+                wait_ms, self.warn_threshold_ms, pool.status()
+            )
+
+    def snapshot(self, pool: Pool) -> dict:
+        queue_pool = isinstance(pool, QueuePool)
+        with self._lock:
+            checkouts = self.checkouts
+            return {
+                "pool_size": pool.size() if queue_pool else 0,
+                "checked_out": pool.checkedout() if queue_pool else 0,
+                "idle": pool.checkedin() if queue_pool else 0,
+                "overflow": max(0, pool.overflow()) if queue_pool else 0,
+                "checkouts": checkouts,
+                "slow_checkouts": self.slow_checkouts,
+                "avg_wait_ms": self.total_wait_ms / checkouts if checkouts else 0.0,
+                "max_wait_ms": self.max_wait_ms,
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that reports how long each checkout waited for a connection."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        # _do_get is where QueuePool blocks on an exhausted pool (or opens an
+        # overflow connection), so timing it yields the checkout wait.
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_checkout((time.perf_counter() - started) * 1000, self)
+
+
+def pool_options(database_url: str) -> dict:
+    url = make_url(database_url)
+    options = {
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    }
+
+    # In-memory SQLite needs its single shared connection; leave its pool alone.
+    if url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:"):
+        options.update({
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+            "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", "10")),
+            "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        })
+    return options
+
+
+def create_pooled_engine(database_url: str, metrics: PoolMetrics, **kwargs) -> Engine:
+    options = pool_options(database_url)
+    if "pool_size" in options:
+        options["poolclass"] = TimedQueuePool
+
+    options.update(kwargs)
+    engine = create_engine(database_url, **options)
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.metrics = metrics
+    return engine
@@ -0,0 +1,97 @@
+import hashlib
+import itertools
+import os
+import threading
+from typing import Any, Callable, List, Sequence
+from fastapi import Request
+from app.utils.ttl_cache import TTLCache
+
+
+# Set in the info of every replica session; see is_replica_session.
+REPLICA_SESSION = "replica_session"
+
+
+def replica_urls(raw: str = None) -> List[str]:
+    if raw is None:
+        raw = os.getenv("DATABASE_REPLICA_URLS", "")
+    return [url.strip() for url in raw.split(",") if url.strip()]
+
+
+def is_replica_session(db) -> bool:
+    """Whether ``db`` reads from a replica, which may lag the primary."""
+    return db.info.get(REPLICA_SESSION) is True
+
+
+class ReplicaRouter:
+    """Sends read-only requests to replicas, round-robin.
+
+    A client that wrote within the last ``read_your_writes_seconds`` keeps
+    reading from the primary, so it never sees a replica that has not caught
+    up with its own write yet. Clients are identified by their bearer token,
+    or by address for anonymous requests.
+    """
+
+    def __init__(
+        self,
+        session_factories: Sequence[Callable[[], Any]],
+        read_your_writes_seconds: float = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5")),
+        max_clients: int = int(os.getenv("READ_YOUR_WRITES_MAX_CLIENTS", "10000"))
+    ):
+        self.session_factories = list(session_factories)
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.recent_writers = TTLCache(max_size=max_clients, ttl_seconds=read_your_writes_seconds)
+        self._next_replica = itertools.cycle(range(len(self.session_factories)))
+        self._lock = threading.Lock()
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.session_factories)
+
+    @staticmethod
+    def client_key(request: Request) -> str:
+        authorization = request.headers.get("authorization")
+        if authorization:
+            return "token:" + hashlib.sha256(authorization.encode()).hexdigest()
+        host = request.client.host if request.client else "unknown"
+        return "addr:" + host
+
+    def pin_to_primary(self, request: Request) -> None:
+        if self.enabled:
+            self.recent_writers.set(self.client_key(request), True)
+
+    def record_write(self, request: Request) -> None:
+        if not self.enabled:
+            return
+        self.pin_to_primary(request)
+        with self._lock:
+            self.writes += 1
+
+    def use_replica(self, request: Request) -> bool:
+        use_replica = self.enabled and self.recent_writers.get(self.client_key(request)) is None
+        with self._lock:
+            if use_replica:
+                self.replica_reads += 1
+            else:
+                self.primary_reads += 1
+        return use_replica
+
+    def replica_session(self):
+        with self._lock:
+            index = next(self._next_replica)
+        session = self.session_factories[index]()
+        session.info[REPLICA_SESSION] = True
+        return session
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "replicas": len(self.session_factories),
+                "read_your_writes_seconds": self.read_your_writes_seconds,
+                "pinned_clients": self.recent_writers.stats()["size"],
+                "replica_reads": self.replica_reads,
+                "primary_reads": self.primary_reads,
+                "writes": self.writes,
+            }
@@ -0,0 +1,25 @@
+import os
+from fastapi import Depends, Request
+from app.database.async_database import async_replica_router, get_async_db, get_async_read_db
+from app.database.database import get_db, get_read_db, replica_router
+
+USE_ASYNC_DB = os.getenv("ASYNC_DB", "false").lower() == "true"
+
+# Routers depend on get_session; with the sync stack it is get_db itself, so
+# overriding get_db (as the test suite does) keeps working unchanged.
+get_session = get_async_db if USE_ASYNC_DB else get_db
+
+# Read-only endpoints depend on get_read_session, which hands out a replica
+# session when DATABASE_REPLICA_URLS is set; writes go through
+# get_write_session so the client is pinned to the primary for a while.
+get_read_session = get_async_read_db if USE_ASYNC_DB else get_read_db
+session_router = async_replica_router if USE_ASYNC_DB else replica_router
+
+
+async def get_write_session(request: Request, db=Depends(get_session)):
+    # Pinned before the handler runs as well, since the exit code of a
+    # dependency may only run once the response is already on its way; the
+    # second pin starts the window from the end of the write.
+    session_router.record_write(request)
+    yield db
+    session_router.pin_to_primary(request)
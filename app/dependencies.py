@@ -1,15 +1,20 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database.database import get_db
+from app.database.session import get_session
 from app.models.client_model import ClientModel
 from app.enums.role_enum import RoleEnum
-from app.services.jwt_service import JWTService
+from app.container import ServiceContainer, get_container
+from app.schemas.principal_schema import Principal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
-jwt_service = JWTService()
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession | Session = Depends(get_session),
+    container: ServiceContainer = Depends(get_container)
+):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -17,7 +22,7 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     )
     
     try:
-        payload = jwt_service.decode_token(token)
+        payload = container.jwt_service.decode_token(token)
         user_email: str = payload.get("sub")
         if user_email is None:
             raise credentials_exception
@@ -26,14 +31,26 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     except Exception:
         raise credentials_exception
 
-    user = db.query(ClientModel).filter(ClientModel.email == user_email).first()
+    principal = await container.auth_service.get_stateless_principal(db, payload)
+    if principal is not None:
+        return principal
+
+    principal_cache = container.principal_cache
+    cached_user = principal_cache.get(user_email)
+    if cached_user is not None:
+        return cached_user
+
+    generation = principal_cache.generation
+    user = await container.async_user_service.get_user_by_email(db, user_email)
     if user is None:
         raise credentials_exception
+
+    principal_cache.set(user_email, user, payload.get("exp"), generation)
     return user
 
-def admin_required(
-    current_user: ClientModel = Depends(get_current_user),
-) -> ClientModel:
+async def admin_required(
+    current_user: ClientModel | Principal = Depends(get_current_user),
+) -> ClientModel | Principal:
     if current_user.role != RoleEnum.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -51,4 +51,15 @@ internal_server_error_response = {
             }
         }
     }
-}
\ No newline at end of file
+}
+
+service_unavailable_response = {
+    503: {
+        "description": "Password hashing capacity exhausted; retry after the Retry-After delay.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Password hashing capacity exhausted. Please retry shortly."}
+            }
+        }
+    }
+}
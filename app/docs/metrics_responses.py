@@ -0,0 +1,21 @@
+forbidden_response = {
+    403: {
+        "description": "Forbidden: only administrators can read metrics.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Access restricted to administrators."}
+            }
+        }
+    }
+}
+
+internal_server_error_response = {
+    500: {
+        "description": "Internal server error.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Internal server error."}
+            }
+        }
+    }
+}
@@ -40,9 +40,66 @@ internal_server_error_response = {
     }
 }
 
+not_modified_response = {
+    304: {
+        "description": "Not modified: the `If-None-Match` ETag is still current. The body is empty.",
+        "headers": {
+                "ETag": {
+                    "description": "Version of the returned representation; send it back as If-None-Match.",
+                    "schema": {"type": "string"}
+                },
+                "Cache-Control": {
+                    "description": "`private, no-cache` by default: clients must revalidate before reusing a copy.",
+                    "schema": {"type": "string"}
+                }
+        }
+    }
+}
+
+order_detail_responses = {
+    200: {
+        "description": "Successful response with the order.",
+        "headers": {
+            "ETag": {
+                "description": "Version of the returned representation; send it back as If-None-Match.",
+                "schema": {"type": "string"}
+            },
+            "Cache-Control": {
+                "description": "`private, no-cache` by default: clients must revalidate before reusing a copy.",
+                "schema": {"type": "string"}
+            }
+        }
+    }
+}
+
+invalid_cursor_response = {
+    400: {
+        "description": "Invalid pagination cursor.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Invalid pagination cursor."}
+            }
+        }
+    }
+}
+
 order_list_responses = {
     200: {
         "description": "Successful response with list of orders.",
+        "headers": {
+            "X-Next-Cursor": {
+                "description": "Cursor for the next page; absent on the last page.",
+                "schema": {"type": "string"}
+            },
+            "ETag": {
+                "description": "Version of the returned representation; send it back as If-None-Match.",
+                "schema": {"type": "string"}
+            },
+            "Cache-Control": {
+                "description": "`private, no-cache` by default: clients must revalidate before reusing a copy.",
+                "schema": {"type": "string"}
+            }
+        },
         "content": {
             "application/json": {
                 "examples": {
@@ -199,3 +256,67 @@ order_list_responses = {
         }
     }
 }
+
+order_history_responses = {
+    200: {
+        "description": "Successful response with the order history.",
+        "headers": order_list_responses[200]["headers"],
+        "content": {
+            "application/json": {
+                "example": [
+                    {
+                        "id": 1,
+                        "client_id": 1,
+                        "status": "completed",
+                        "payment_method": "credit_card",
+                        "payment_status": "paid",
+                        "total_amount": 12000,
+                        "created_at": "2025-05-25T15:30:00Z",
+                        "order_items": [
+                            {
+                                "id": 1,
+                                "product_id": 101,
+                                "quantity": 3,
+                                "price_at_moment": 4000,
+                                "product": {
+                                    "id": 101,
+                                    "name": "Men's Cotton T-Shirt",
+                                    "bar_code": "7891234567890",
+                                    "category": "T-Shirts",
+                                    "image_path": "/images/products/mens_cotton_tshirt_1.jpg"
+                                }
+                            }
+                        ]
+                    }
+                ]
+            }
+        }
+    }
+}
+
+order_bulk_delete_responses = {
+    200: {
+        "description": "Matching orders deleted, in batches.",
+        "content": {
+            "application/json": {
+                "example": {"deleted": 2500, "restocked": 300, "batches": 3, "done": True}
+            }
+        }
+    },
+    400: {
+        "description": "No filter given.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "At least one filter is required to delete orders in bulk."}
+            }
+        }
+    },
+    403: {
+        "description": "Access restricted to administrators.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Access restricted to administrators."}
+            }
+        }
+    }
+}
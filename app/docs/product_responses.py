@@ -55,9 +55,108 @@ internal_server_error_response = {
     }
 }
 
+unsupported_import_format_response = {
+    415: {
+        "description": "The body is neither CSV nor NDJSON.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Unsupported import format. Send text/csv or application/x-ndjson."}
+            }
+        }
+    }
+}
+
+product_import_request_body = {
+    "required": True,
+    "content": {
+        "text/csv": {
+            "schema": {"type": "string"},
+            "example": (
+                "name,sale_price,description,stock,bar_code,category,expiration_date,images\n"
+                "Summer Floral Dress,129.90,Light dress,18,1002003004001,Dresses,,"
+                "/images/dress_front.jpg|/images/dress_back.jpg\n"
+            )
+        },
+        "application/x-ndjson": {
+            "schema": {"type": "string"},
+            "example": (
+                '{"name": "Summer Floral Dress", "sale_price": 129.90, "description": "Light dress", '
+                '"stock": 18, "bar_code": "1002003004001", "category": "Dresses", '
+                '"images": ["/images/dress_front.jpg", "/images/dress_back.jpg"]}\n'
+            )
+        }
+    }
+}
+
+invalid_cursor_response = {
+    400: {
+        "description": "Invalid pagination parameters.",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "InvalidCursor": {
+                        "summary": "Malformed cursor or cursor for another sort order",
+                        "value": {"detail": "Invalid pagination cursor."}
+                    },
+                    "CursorWithSkip": {
+                        "summary": "Cursor combined with skip",
+                        "value": {"detail": "Use either skip or cursor, not both."}
+                    }
+                }
+            }
+        }
+    }
+}
+
+not_modified_response = {
+    304: {
+        "description": "Not modified: the `If-None-Match` ETag is still current. The body is empty.",
+        "headers": {
+                "ETag": {
+                    "description": "Version of the returned representation; send it back as If-None-Match.",
+                    "schema": {"type": "string"}
+                },
+                "Cache-Control": {
+                    "description": "`private, no-cache` by default: clients must revalidate before reusing a copy.",
+                    "schema": {"type": "string"}
+                }
+        }
+    }
+}
+
+product_detail_responses = {
+    200: {
+        "description": "Successful response with the product.",
+        "headers": {
+            "ETag": {
+                "description": "Version of the returned representation; send it back as If-None-Match.",
+                "schema": {"type": "string"}
+            },
+            "Cache-Control": {
+                "description": "`private, no-cache` by default: clients must revalidate before reusing a copy.",
+                "schema": {"type": "string"}
+            }
+        }
+    }
+}
+
 product_list_responses = {
     200: {
         "description": "Successful response with list of products.",
+        "headers": {
+            "X-Next-Cursor": {
+                "description": "Cursor for the next page; absent on the last page.",
+                "schema": {"type": "string"}
+            },
+            "ETag": {
+                "description": "Version of the returned representation; send it back as If-None-Match.",
+                "schema": {"type": "string"}
+            },
+            "Cache-Control": {
+                "description": "`private, no-cache` by default: clients must revalidate before reusing a copy.",
+                "schema": {"type": "string"}
+            }
+        },
         "content": {
             "application/json": {
                 "examples": {
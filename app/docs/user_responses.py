@@ -40,6 +40,17 @@ internal_server_error_response = {
     }
 }
 
+service_unavailable_response = {
+    503: {
+        "description": "Password hashing capacity exhausted; retry after the Retry-After delay.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Password hashing capacity exhausted. Please retry shortly."}
+            }
+        }
+    }
+}
+
 user_list_responses = {
     200: {
         "description": "Successful response with list of users.",
@@ -0,0 +1,5 @@
+from enum import Enum
+
+class ImportFormatEnum(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
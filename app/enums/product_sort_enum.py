@@ -0,0 +1,6 @@
+from enum import Enum
+
+class ProductSortEnum(str, Enum):
+    ID = "id"
+    NAME = "name"
+    SALE_PRICE = "sale_price"
@@ -0,0 +1,5 @@
+from enum import Enum
+
+class StockReservationEnum(str, Enum):
+    LOCK = "lock"
+    CONDITIONAL = "conditional"
@@ -0,0 +1,58 @@
+import logging
+import os
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database.instrumentation import QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryTimingMiddleware:
+    """Counts SQL statements and database time for every HTTP request.
+
+    Adds a ``Server-Timing`` header with the database and total time, and
+    logs a warning for requests that run more statements than the budget.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        statement_budget: int = int(os.getenv("SQL_STATEMENT_BUDGET", "20")),
+        server_timing: bool = os.getenv("SQL_SERVER_TIMING", "true").lower() == "true"
+    ):
+        self.app = app
+        self.statement_budget = statement_budget
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start" and self.server_timing:
+                    total_ms = (time.perf_counter() - started) * 1000
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", self.server_timing_header(stats, total_ms))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                if stats.statements > self.statement_budget:
+                    logger.warning(
+                        "SQL statement budget exceeded: %s %s ran %d statements (budget %d) in %.1f ms",
+                        scope["method"], scope["path"], stats.statements,
+                        self.statement_budget, stats.duration_ms
+                    )
+
+    @staticmethod
+    def server_timing_header(stats: QueryStats, total_ms: float) -> str:
+        return (
+            f'db;dur={stats.duration_ms:.2f};desc="{stats.statements} queries", '
+            f"app;dur={total_ms:.2f}"
+        )
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, DateTime, Integer, ForeignKey, Numeric, String
+from sqlalchemy.orm import relationship
+from app.database.database import Base
+
+class ArchivedOrderItemModel(Base):
+    __tablename__ = "tb_order_items_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    order_id = Column(Integer, ForeignKey("tb_orders_archive.id"), index=True, nullable=False)
+    product_id = Column(Integer, ForeignKey("tb_products.id"), index=True, nullable=False)
+    quantity = Column(Integer, nullable=False)
+    price_at_moment = Column(Numeric(10, 2), nullable=False)
+    order_created_at = Column(DateTime(timezone=True), nullable=False)
+    # Product snapshot, copied from tb_order_items.
+    product_name = Column(String(120), nullable=True)
+    product_bar_code = Column(String(80), nullable=True)
+    product_category = Column(String(50), nullable=True)
+    product_image_path = Column(String(255), nullable=True)
+
+    order = relationship("ArchivedOrderModel", back_populates="order_items")
+    product = relationship("ProductModel")
+
+    @property
+    def product_snapshot(self) -> dict:
+        return {
+            "id": self.product_id,
+            "name": self.product_name,
+            "bar_code": self.product_bar_code,
+            "category": self.product_category,
+            "image_path": self.product_image_path,
+        }
@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Integer, ForeignKey, Enum as SqlEnum, Numeric, DateTime, Index
+from sqlalchemy.orm import relationship
+from app.database.database import Base
+from app.enums.order_status_enum import OrderStatusEnum
+from app.enums.payment_method_enum import PaymentMethodEnum
+from app.enums.payment_status_enum import PaymentStatusEnum
+
+class ArchivedOrderModel(Base):
+    """Completed and canceled orders moved out of tb_orders by the archival job.
+
+    Same columns and ids as tb_orders, so an archived order serializes (and
+    paginates) exactly like a live one.
+    """
+    __tablename__ = "tb_orders_archive"
+    __table_args__ = (
+        Index("ix_tb_orders_archive_client_id_created_at", "client_id", "created_at", "id"),
+        Index("ix_tb_orders_archive_created_at", "created_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    client_id = Column(Integer, ForeignKey("tb_clients.id"), nullable=False)
+    status = Column(
+        SqlEnum(OrderStatusEnum, name="order_status_enum", native_enum=False, validate_strings=True),
+        nullable=False
+    )
+    payment_method = Column(
+        SqlEnum(PaymentMethodEnum, name="order_payment_method_enum", native_enum=False, validate_strings=True),
+        nullable=True
+    )
+    payment_status = Column(
+        SqlEnum(PaymentStatusEnum, name="payment_status_enum", native_enum=False, validate_strings=True),
+        nullable=False
+    )
+    total_amount = Column(Numeric(10, 2), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    version = Column(Integer, nullable=False)
+
+    client = relationship("ClientModel")
+    order_items = relationship("ArchivedOrderItemModel", back_populates="order")
@@ -1,9 +1,14 @@
 from sqlalchemy import Column, Integer, String, Enum as SqlEnum
 from app.database.database import Base
 from app.enums.role_enum import RoleEnum
+from app.utils.search import trigram_index
 
 class ClientModel(Base):
     __tablename__ = "tb_clients"
+    __table_args__ = (
+        trigram_index("ix_tb_clients_name_trgm", "name"),
+        trigram_index("ix_tb_clients_email_trgm", "email"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(120), index=True, nullable=False)
@@ -16,3 +21,5 @@ class ClientModel(Base):
         default=RoleEnum.USER.value,
         nullable=False
     )
+    # Carried by stateless access tokens as "ver"; bumped to revoke them.
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
@@ -1,15 +1,35 @@
-from sqlalchemy import Column, Integer, ForeignKey, Numeric
+from sqlalchemy import Column, DateTime, Integer, ForeignKey, Numeric, String
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from app.database.database import Base
 
 class OrderItemModel(Base):
     __tablename__ = "tb_order_items"
 
     id = Column(Integer, primary_key=True, index=True)
-    order_id = Column(Integer, ForeignKey("tb_orders.id"), nullable=False)
-    product_id = Column(Integer, ForeignKey("tb_products.id"), nullable=False)
+    order_id = Column(Integer, ForeignKey("tb_orders.id"), index=True, nullable=False)
+    product_id = Column(Integer, ForeignKey("tb_products.id"), index=True, nullable=False)
     quantity = Column(Integer, nullable=False, default=1)
     price_at_moment = Column(Numeric(10, 2), nullable=False)
+    # Copy of the order's created_at: tb_order_items is partitioned on it,
+    # so an order's items share the month partition of the order.
+    order_created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # What the product looked like when it was bought, so order history
+    # reads never touch tb_products and survive later product edits.
+    product_name = Column(String(120), nullable=True)
+    product_bar_code = Column(String(80), nullable=True)
+    product_category = Column(String(50), nullable=True)
+    product_image_path = Column(String(255), nullable=True)
 
     order = relationship("OrderModel", back_populates="order_items")
-    product = relationship("ProductModel")
\ No newline at end of file
+    product = relationship("ProductModel")
+
+    @property
+    def product_snapshot(self) -> dict:
+        return {
+            "id": self.product_id,
+            "name": self.product_name,
+            "bar_code": self.product_bar_code,
+            "category": self.product_category,
+            "image_path": self.product_image_path,
+        }
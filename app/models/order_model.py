@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Enum as SqlEnum, Numeric, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, Enum as SqlEnum, Numeric, DateTime, Index, literal_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.database import Base
@@ -8,6 +8,14 @@ from app.enums.payment_status_enum import PaymentStatusEnum
 
 class OrderModel(Base):
     __tablename__ = "tb_orders"
+    # Every listing is ordered by (created_at, id), newest first; ending
+    # each index with those columns lets a page be read off the index in
+    # order and stop after LIMIT rows.
+    __table_args__ = (
+        Index("ix_tb_orders_client_id_created_at", "client_id", "created_at", "id"),
+        Index("ix_tb_orders_status_created_at", "status", "created_at", "id"),
+        Index("ix_tb_orders_created_at", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(Integer, ForeignKey("tb_clients.id"), nullable=False)
@@ -26,7 +34,15 @@ class OrderModel(Base):
         nullable=False
     )
     total_amount = Column(Numeric(10, 2), nullable=False, default=0.00)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # Bumped by every UPDATE of the row; part of the ETag of order responses.
+    version = Column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("tb_orders.version") + 1
+    )
 
     client = relationship("ClientModel")
     order_items = relationship("OrderItemModel", back_populates="order", cascade="all, delete-orphan")
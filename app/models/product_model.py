@@ -1,11 +1,17 @@
-from sqlalchemy import Column, Integer, Numeric, String, Date
+from sqlalchemy import Column, Integer, Numeric, String, Date, literal_column
 from sqlalchemy.orm import relationship
 from app.database.database import Base
 from app.models.product_image_model import ProductImageModel
+from app.utils.search import trigram_index
 
 class ProductModel(Base):
     __tablename__ = "tb_products"
-    
+    __table_args__ = (
+        trigram_index("ix_tb_products_name_trgm", "name"),
+        trigram_index("ix_tb_products_description_trgm", "description"),
+        trigram_index("ix_tb_products_category_trgm", "category"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(120), unique=True, index=True, nullable=False)
     sale_price = Column(Numeric(10, 2), index=True, nullable=False)
@@ -14,4 +20,12 @@ class ProductModel(Base):
     bar_code = Column(String(80), unique=True, nullable=False)
     category = Column(String(50), nullable=False)
     expiration_date = Column(Date, nullable=True)
+    # Bumped by every UPDATE of the row; the ETag of product responses.
+    version = Column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("tb_products.version") + 1
+    )
     images = relationship("ProductImageModel",backref="product",cascade="all, delete-orphan")
\ No newline at end of file
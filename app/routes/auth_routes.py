@@ -1,23 +1,25 @@
 from fastapi import APIRouter, Depends, status, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.client_model import ClientModel
 from app.schemas.auth_schema import LoginSchema
 from app.schemas.user_schema import UserCreate, UserResponse
 from app.schemas.token_schema import RefreshToken, TokenSchema
 from app.services.auth_service import AuthService
-from app.services.jwt_service import JWTService
-from app.services.user_service import UserService
-from app.database.database import get_db
+from app.database.session import get_session, get_write_session
+from app.container import ServiceContainer, get_container
 
-from app.docs.auth_responses import unauthorized_responses, internal_server_error_response, conflict_response
+from app.docs.auth_responses import (
+    unauthorized_responses,
+    internal_server_error_response,
+    conflict_response,
+    service_unavailable_response
+)
 
 router = APIRouter(prefix="/api/v1/auth", tags=["auth"])
 
-def get_auth_service() -> AuthService:
-    jwt_service = JWTService()
-    user_service = UserService(client_model=ClientModel)
-    return AuthService(user_service=user_service, jwt_service=jwt_service)
+def get_auth_service(container: ServiceContainer = Depends(get_container)) -> AuthService:
+    return container.auth_service
 
 @router.post(
     "/register",
@@ -32,15 +34,16 @@ def get_auth_service() -> AuthService:
     responses={
         **conflict_response,
         **internal_server_error_response,
+        **service_unavailable_response,
     }
 )
-def register(
+async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession | Session = Depends(get_write_session),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     try:
-        return auth_service.register(db, user_data)
+        return await auth_service.register(db, user_data)
     except HTTPException:
         raise
     except Exception:
@@ -61,15 +64,16 @@ def register(
     responses={
         **unauthorized_responses,
         **internal_server_error_response,
+        **service_unavailable_response,
     }
 )
-def login(
+async def login(
     login_data: LoginSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession | Session = Depends(get_session),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     try:
-        return auth_service.login(db, login_data.email, login_data.password)
+        return await auth_service.login(db, login_data.email, login_data.password)
     except HTTPException:
         raise
     except Exception:
@@ -92,12 +96,13 @@ def login(
         **internal_server_error_response,
     }
 )
-def refresh_token(
+async def refresh_token(
     data: RefreshToken,
+    db: AsyncSession | Session = Depends(get_session),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     try:
-        new_access_token = auth_service.refresh_token(data.refresh_token)
+        new_access_token = await auth_service.refresh_token(db, data.refresh_token)
         return TokenSchema(access_token=new_access_token)
     except HTTPException:
         raise
@@ -0,0 +1,132 @@
+from fastapi import APIRouter, Depends
+
+from app.container import ServiceContainer, get_container
+from app.database.database import engine, pool_metrics
+from app.database.session import session_router
+from app.dependencies import admin_required
+from app.docs.metrics_responses import forbidden_response, internal_server_error_response
+from app.models.client_model import ClientModel
+from app.schemas.metrics_schema import (
+    CacheStatsResponse,
+    DBPoolStatsResponse,
+    DBRoutingStatsResponse,
+    PasswordPoolStatsResponse
+)
+
+router = APIRouter(prefix="/api/v1/metrics", tags=["metrics"])
+
+@router.get(
+    "/principal-cache",
+    response_model=CacheStatsResponse,
+    summary="Principal cache statistics",
+    description=(
+        "Returns size and hit/miss counters of the authenticated principal cache. "
+        "Every hit is a user lookup that did not reach the database. "
+        "Only administrators can access this endpoint."
+    ),
+    responses={
+        **forbidden_response,
+        **internal_server_error_response
+    }
+)
+def principal_cache_stats(
+    container: ServiceContainer = Depends(get_container),
+    current_user: ClientModel = Depends(admin_required),
+):
+    return container.principal_cache.stats()
+
+@router.get(
+    "/product-cache",
+    response_model=CacheStatsResponse,
+    summary="Product cache statistics",
+    description=(
+        "Returns size and hit/miss counters of the product cache used by the product detail endpoint. "
+        "Every hit is a product that was served without querying the database. "
+        "Only administrators can access this endpoint."
+    ),
+    responses={
+        **forbidden_response,
+        **internal_server_error_response
+    }
+)
+def product_cache_stats(
+    container: ServiceContainer = Depends(get_container),
+    current_user: ClientModel = Depends(admin_required),
+):
+    return container.product_cache.stats()
+
+@router.get(
+    "/password-hashing",
+    response_model=PasswordPoolStatsResponse,
+    summary="Password hashing pool statistics",
+    description=(
+        "Returns queue depth and throughput counters of the bcrypt worker pool. "
+        "Only administrators can access this endpoint."
+    ),
+    responses={
+        **forbidden_response,
+        **internal_server_error_response
+    }
+)
+def password_hashing_stats(
+    container: ServiceContainer = Depends(get_container),
+    current_user: ClientModel = Depends(admin_required),
+):
+    return container.password_service.stats()
+
+@router.get(
+    "/token-cache",
+    response_model=CacheStatsResponse,
+    summary="Verified token cache statistics",
+    description=(
+        "Returns size and hit/miss counters of the verified access token cache. "
+        "Every hit is a token whose signature and claims were not checked again. "
+        "Only administrators can access this endpoint."
+    ),
+    responses={
+        **forbidden_response,
+        **internal_server_error_response
+    }
+)
+def token_cache_stats(
+    container: ServiceContainer = Depends(get_container),
+    current_user: ClientModel = Depends(admin_required),
+):
+    return container.jwt_service.token_cache.stats()
+
+@router.get(
+    "/db-pool",
+    response_model=DBPoolStatsResponse,
+    summary="Database connection pool statistics",
+    description=(
+        "Returns checked-out, idle and overflow connections of the primary database pool, "
+        "together with checkout wait times. Only administrators can access this endpoint."
+    ),
+    responses={
+        **forbidden_response,
+        **internal_server_error_response
+    }
+)
+def db_pool_stats(
+    current_user: ClientModel = Depends(admin_required),
+):
+    return pool_metrics.snapshot(engine.pool)
+
+@router.get(
+    "/db-routing",
+    response_model=DBRoutingStatsResponse,
+    summary="Read replica routing statistics",
+    description=(
+        "Returns how many read-only requests were served by replicas or by the primary, "
+        "and how many clients are pinned to the primary after a recent write. "
+        "Only administrators can access this endpoint."
+    ),
+    responses={
+        **forbidden_response,
+        **internal_server_error_response
+    }
+)
+def db_routing_stats(
+    current_user: ClientModel = Depends(admin_required),
+):
+    return session_router.stats()
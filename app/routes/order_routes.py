@@ -1,51 +1,43 @@
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database.database import get_db
-from app.dependencies import get_current_user
+from app.container import ServiceContainer, get_container
+from app.database.session import get_read_session, get_write_session
+from app.dependencies import admin_required, get_current_user
 from app.models.client_model import ClientModel
-from app.models.order_item_model import OrderItemModel
-from app.models.order_model import OrderModel
-from app.models.product_model import ProductModel
-from app.schemas.order_schema import OrderCreate, OrderResponse, OrderUpdate
+from app.schemas.order_schema import (
+    OrderBulkDeleteReport,
+    OrderCreate,
+    OrderHistoryResponse,
+    OrderResponse,
+    OrderUpdate,
+)
+from app.services.async_services import AsyncOrderService
 from app.services.order_service import OrderService
-from app.services.product_service import ProductService
 from app.enums.order_status_enum import OrderStatusEnum
+from app.utils.etag import Tagged, conditional_response
+from app.utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 from app.docs.order_responses import (
     order_not_found_response,
     order_conflict_response,
+    order_detail_responses,
     order_list_responses,
+    order_history_responses,
+    order_bulk_delete_responses,
+    invalid_cursor_response,
+    not_modified_response,
     internal_server_error_response,
 )
-from app.services.user_service import UserService
 
 router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
 
-def get_order_service() -> OrderService:
-    user_service = UserService(ClientModel)
-    product_service = ProductService(ProductModel, None)
-    return OrderService(OrderModel, OrderItemModel, product_service, user_service)
+def get_order_service(container: ServiceContainer = Depends(get_container)) -> AsyncOrderService:
+    return container.async_order_service
 
-@router.get(
-    "/",
-    response_model=List[OrderResponse],
-    summary="Retrieve a list of orders",
-    description=(
-        "Retrieve orders filtered by optional parameters such as date range, category, "
-        "order ID, status, and client ID. If no filter is provided, returns all orders "
-        "paginated by default."
-    ),
-    responses={
-        **order_list_responses,
-        **order_not_found_response,
-        **internal_server_error_response,
-    }
-)
-def list_orders(
-    db: Session = Depends(get_db),
-    service: OrderService = Depends(get_order_service),
+def order_filters(
     start_date: Optional[datetime] = Query(
         None, description="Start date (inclusive) to filter orders by their creation date, format: YYYY-MM-DDTHH:MM:SS"
     ),
@@ -64,19 +56,105 @@ def list_orders(
     client_id: Optional[int] = Query(
         None, description="Filter orders by client ID"
     ),
-    current_user: ClientModel = Depends(get_current_user),
-):
-    return service.list_orders(
-        db=db,
+    limit: int = Query(
+        20,
+        ge=1,
+        le=100,
+        description="Maximum number of orders to return. Must be between 1 and 100."
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from the `X-Next-Cursor` header of the previous page."
+    ),
+    include_archived: bool = Query(
+        False,
+        description="Also return completed and canceled orders moved to the archive."
+    ),
+) -> dict:
+    return dict(
         start_date=start_date,
         end_date=end_date,
         category=category,
         order_id=order_id,
         status=status,
         client_id=client_id,
-        current_user=current_user
+        limit=limit,
+        cursor=cursor,
+        include_archived=include_archived
     )
 
+def order_page(response: Response, tagged: Tagged, limit: int):
+    if tagged.body is not None:
+        cursor_for_next_page = next_cursor(tagged.body, limit, OrderService.CURSOR_SORT_KEY)
+        if cursor_for_next_page:
+            response.headers[NEXT_CURSOR_HEADER] = cursor_for_next_page
+    return conditional_response(response, tagged)
+
+@router.get(
+    "/",
+    response_model=List[OrderResponse],
+    summary="Retrieve a list of orders",
+    description=(
+        "Retrieve orders filtered by optional parameters such as date range, category, "
+        "order ID, status, and client ID. Orders are returned newest first, at most `limit` "
+        "per page; pass the `X-Next-Cursor` response header back as `cursor` to fetch the "
+        "next page. Old completed and canceled orders are archived and only listed with "
+        "`include_archived=true`. Send the `ETag` of a previous response as `If-None-Match` "
+        "to get a 304 when nothing changed."
+    ),
+    responses={
+        **order_list_responses,
+        **invalid_cursor_response,
+        **not_modified_response,
+        **order_not_found_response,
+        **internal_server_error_response,
+    }
+)
+async def list_orders(
+    response: Response,
+    db: AsyncSession | Session = Depends(get_read_session),
+    service: AsyncOrderService = Depends(get_order_service),
+    filters: dict = Depends(order_filters),
+    if_none_match: Optional[str] = Header(
+        None,
+        description="ETag of a previously fetched list. Returns 304 Not Modified if it is still current."
+    ),
+    current_user: ClientModel = Depends(get_current_user),
+):
+    tagged = await service.list_orders(db, current_user, if_none_match=if_none_match, **filters)
+    return order_page(response, tagged, filters["limit"])
+
+@router.get(
+    "/history",
+    response_model=List[OrderHistoryResponse],
+    summary="Retrieve order history",
+    description=(
+        "Same filters and pagination as the order list, but each item carries the product "
+        "as it was when the order was placed (name, bar code, category and first image) "
+        "instead of the current product, so the products table is not read. The category "
+        "filter matches the category at purchase time."
+    ),
+    responses={
+        **order_history_responses,
+        **invalid_cursor_response,
+        **not_modified_response,
+        **internal_server_error_response,
+    }
+)
+async def list_order_history(
+    response: Response,
+    db: AsyncSession | Session = Depends(get_read_session),
+    service: AsyncOrderService = Depends(get_order_service),
+    filters: dict = Depends(order_filters),
+    if_none_match: Optional[str] = Header(
+        None,
+        description="ETag of a previously fetched list. Returns 304 Not Modified if it is still current."
+    ),
+    current_user: ClientModel = Depends(get_current_user),
+):
+    tagged = await service.list_order_history(db, current_user, if_none_match=if_none_match, **filters)
+    return order_page(response, tagged, filters["limit"])
+
 @router.post(
     "/",
     response_model=OrderResponse,
@@ -91,32 +169,43 @@ def list_orders(
         **internal_server_error_response,
     }
 )
-def create_order(
+async def create_order(
     order: OrderCreate,
-    db: Session = Depends(get_db),
-    service: OrderService = Depends(get_order_service),
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncOrderService = Depends(get_order_service),
     current_user: ClientModel = Depends(get_current_user),
 ):
-    return service.create_order(db, order, current_user)
+    return await service.create_order(db, order, current_user)
 
 
 @router.get(
     "/{order_id}",
     response_model=OrderResponse,
     summary="Get order by ID",
-    description="Retrieve a order by its unique identifier.",
+    description=(
+        "Retrieve a order by its unique identifier. Send the `ETag` of a previous response "
+        "as `If-None-Match` to get a 304 when neither the order nor its products changed."
+    ),
     responses={
+        **order_detail_responses,
+        **not_modified_response,
         **order_not_found_response,
         **internal_server_error_response
     }
 )
-def get_order_by_id(
+async def get_order_by_id(
+    response: Response,
     order_id: int,
-    db: Session = Depends(get_db),
-    service: OrderService = Depends(get_order_service),
+    if_none_match: Optional[str] = Header(
+        None,
+        description="ETag of a previously fetched copy. Returns 304 Not Modified if it is still current."
+    ),
+    db: AsyncSession | Session = Depends(get_read_session),
+    service: AsyncOrderService = Depends(get_order_service),
     current_user: ClientModel = Depends(get_current_user),
 ):
-    return service.get_order_by_id(db, order_id)
+    tagged = await service.get_order_by_id(db, order_id, current_user, if_none_match=if_none_match)
+    return conditional_response(response, tagged)
 
 @router.put(
     "/{order_id}",
@@ -132,14 +221,14 @@ def get_order_by_id(
         **internal_server_error_response,
     }
 )
-def update_order(
+async def update_order(
     order_id: int,
     order_data: OrderUpdate,
-    db: Session = Depends(get_db),
-    service: OrderService = Depends(get_order_service),
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncOrderService = Depends(get_order_service),
     current_user: ClientModel = Depends(get_current_user),
 ):
-    return service.update_order(db, order_id, order_data, current_user)
+    return await service.update_order(db, order_id, order_data, current_user)
 
 
 @router.delete(
@@ -155,10 +244,64 @@ def update_order(
         **internal_server_error_response,
     }
 )
-def delete_order(
+async def delete_order(
     order_id: int,
-    db: Session = Depends(get_db),
-    service: OrderService = Depends(get_order_service),
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncOrderService = Depends(get_order_service),
     current_user: ClientModel = Depends(get_current_user),
 ):
-    return service.delete_order(db, order_id, current_user)
+    return await service.delete_order(db, order_id, current_user)
+
+@router.delete(
+    "/",
+    response_model=OrderBulkDeleteReport,
+    summary="Bulk delete orders",
+    description=(
+        "Delete every order matching the filters, at least one of which is required. "
+        "Orders are deleted in batches of `batch_size`, each committed on its own, and the "
+        "stock of orders that were neither completed nor canceled is restored. Pass "
+        "`max_batches` to bound the request; `done` is false while matching orders remain. "
+        "Only admin users can perform this operation."
+    ),
+    responses={
+        **order_bulk_delete_responses,
+        **internal_server_error_response,
+    }
+)
+async def delete_orders(
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncOrderService = Depends(get_order_service),
+    start_date: Optional[datetime] = Query(
+        None, description="Start date (inclusive) of the orders' creation date, format: YYYY-MM-DDTHH:MM:SS"
+    ),
+    end_date: Optional[datetime] = Query(
+        None, description="End date (inclusive) of the orders' creation date, format: YYYY-MM-DDTHH:MM:SS"
+    ),
+    status: Optional[OrderStatusEnum] = Query(
+        None, description="Delete only orders with this status"
+    ),
+    client_id: Optional[int] = Query(
+        None, description="Delete only the orders of this client"
+    ),
+    batch_size: int = Query(
+        1000,
+        ge=1,
+        le=10000,
+        description="Orders deleted per transaction. Must be between 1 and 10000."
+    ),
+    max_batches: Optional[int] = Query(
+        None,
+        ge=1,
+        description="Stop after this many batches. All matching orders are deleted by default."
+    ),
+    current_user: ClientModel = Depends(admin_required),
+):
+    return await service.delete_orders(
+        db,
+        batch_size,
+        max_batches=max_batches,
+        start_date=start_date,
+        end_date=end_date,
+        status=status,
+        client_id=client_id
+    )
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Header, Query, Request, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.product_image_model import ProductImageModel
-from app.models.product_model import ProductModel
-from app.schemas.product_schema import ProductCreate, ProductResponse, ProductUpdate
-from app.services.product_service import ProductService
+from app.enums.import_format_enum import ImportFormatEnum
+from app.enums.product_sort_enum import ProductSortEnum
+from app.schemas.product_schema import ProductCreate, ProductImportReport, ProductResponse, ProductUpdate
+from app.services.async_services import AsyncProductImportService, AsyncProductService
 from app.services.file_service import FileService
-from app.database.database import get_db
+from app.database.session import get_read_session, get_write_session
+from app.container import ServiceContainer, get_container
+from app.utils.etag import conditional_response
+from app.utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 
 from app.dependencies import get_current_user, admin_required
 from app.models.client_model import ClientModel
@@ -15,13 +20,21 @@ from app.docs.product_responses import (
     product_not_found_response,
     product_conflict_response,
     internal_server_error_response,
-    product_list_responses
+    invalid_cursor_response,
+    not_modified_response,
+    product_list_responses,
+    product_detail_responses,
+    product_import_request_body,
+    unsupported_import_format_response
 )
 
 router = APIRouter(prefix="/api/v1/products", tags=["products"])
 
-def get_product_service() -> ProductService:
-    return ProductService(ProductModel, ProductImageModel)
+def get_product_service(container: ServiceContainer = Depends(get_container)) -> AsyncProductService:
+    return container.async_product_service
+
+def get_product_import_service(container: ServiceContainer = Depends(get_container)) -> AsyncProductImportService:
+    return container.async_product_import_service
 
 def get_file_service() -> FileService:
     return FileService()
@@ -32,15 +45,21 @@ def get_file_service() -> FileService:
     summary="List products",
     description=(
         "Returns a list of all registered products. Accessible by any authenticated user. "
-        "Supports optional filters by stock availability, category, minimum price, and maximum price, "
-        "as well as pagination using skip and limit."
+        "Supports a text search and optional filters by stock availability, category, minimum price, and maximum price. "
+        "Results are ordered by `sort_by` and then by ID. For pagination, pass the `X-Next-Cursor` "
+        "response header back as `cursor` to fetch the next page; `skip` and `limit` remain supported, "
+        "but `skip` gets slower on deep pages. "
+        "Send the `ETag` of a previous response as `If-None-Match` to get a 304 when nothing changed."
     ),
     responses={
         **product_list_responses,
+        **not_modified_response,
+        **invalid_cursor_response,
         **internal_server_error_response
     }
 )
-def list_products(
+async def list_products(
+    response: Response,
     skip: int = Query(
         0,
         ge=0,
@@ -51,13 +70,28 @@ def list_products(
         le=100,
         description="Maximum number of records to return. Must be between 1 and 100."
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Opaque cursor from the `X-Next-Cursor` header of the previous page. "
+            "Must be used with the same `sort_by` and cannot be combined with skip."
+        )
+    ),
+    sort_by: ProductSortEnum = Query(
+        ProductSortEnum.ID,
+        description="Field used to order the results. Ties are broken by product ID."
+    ),
     stock: Optional[bool] = Query(
         None,
         description="Filter products by stock availability. Use `true` for in stock, `false` for out of stock, or omit to ignore this filter."
     ),
     category: Optional[str] = Query(
         None,
-        description="Filter products by exact category name (case-sensitive)."
+        description="Filter products whose category contains this text (case-insensitive)."
+    ),
+    search: Optional[str] = Query(
+        None,
+        description="Case-insensitive search across product name, description and category."
     ),
     min_price: Optional[float] = Query(
         None,
@@ -67,20 +101,34 @@ def list_products(
         None,
         description="Filter products with sale price less than or equal to this value."
     ),
-    db: Session = Depends(get_db),
-    service: ProductService = Depends(get_product_service),
+    if_none_match: Optional[str] = Header(
+        None,
+        description="ETag of a previously fetched page. Returns 304 Not Modified if it is still current."
+    ),
+    db: AsyncSession | Session = Depends(get_read_session),
+    service: AsyncProductService = Depends(get_product_service),
     current_user: ClientModel = Depends(get_current_user),
 ):
-    return service.list_products(
+    tagged = await service.list_products(
         db,
+        if_none_match=if_none_match,
         skip=skip,
         limit=limit,
         stock=stock,
         category=category,
         min_price=min_price,
-        max_price=max_price
+        max_price=max_price,
+        cursor=cursor,
+        sort_by=sort_by,
+        search=search
     )
 
+    if tagged.body is not None:
+        cursor_for_next_page = next_cursor(tagged.body, limit, sort_by.value)
+        if cursor_for_next_page:
+            response.headers[NEXT_CURSOR_HEADER] = cursor_for_next_page
+    return conditional_response(response, tagged)
+
 @router.post(
     "/",
     response_model=ProductResponse,
@@ -96,7 +144,7 @@ def list_products(
         **internal_server_error_response
     }
 )
-def create_product(
+async def create_product(
     name: str = Form(...),
     sale_price: float = Form(...),
     description: str = Form(...),
@@ -104,12 +152,12 @@ def create_product(
     bar_code: str = Form(...),
     category: str = Form(...),
     images: List[UploadFile] = File(...),
-    db: Session = Depends(get_db),
-    service: ProductService = Depends(get_product_service),
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncProductService = Depends(get_product_service),
     file_service: FileService = Depends(get_file_service),
     current_user: ClientModel = Depends(admin_required),
 ):
-    image_paths = file_service.save_images(images, category, name)
+    image_paths = await run_in_threadpool(file_service.save_images, images, category, name)
 
     product_data = ProductCreate(
         name=name,
@@ -120,25 +168,68 @@ def create_product(
         category=category
     )
 
-    return service.create_product(db, product_data, image_paths)
+    return await service.create_product(db, product_data, image_paths)
+
+@router.post(
+    "/import",
+    response_model=ProductImportReport,
+    summary="Bulk import products",
+    description=(
+        "Create many products from a CSV (`text/csv`, with a header row) or NDJSON "
+        "(`application/x-ndjson`) body. The body is read as it streams in and rows are "
+        "validated and inserted in chunks. Images are referenced by path: a `|`-separated "
+        "`images` column in CSV, or an `images` array in NDJSON. Invalid rows and rows whose "
+        "name or bar code already exists are skipped and listed in the report; every other row "
+        "is created. Only admin users can perform this operation."
+    ),
+    openapi_extra={"requestBody": product_import_request_body},
+    responses={
+        **unsupported_import_format_response,
+        **internal_server_error_response
+    }
+)
+async def import_products(
+    request: Request,
+    import_format: Optional[ImportFormatEnum] = Query(
+        None,
+        alias="format",
+        description="Format of the body. Defaults to the one given by the Content-Type header."
+    ),
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncProductImportService = Depends(get_product_import_service),
+    current_user: ClientModel = Depends(admin_required),
+):
+    import_format = import_format or service.format_for(request.headers.get("content-type"))
+    return await service.import_products(db, request.stream(), import_format)
 
 @router.get(
     "/{product_id}",
     response_model=ProductResponse,
     summary="Get product by ID",
-    description="Retrieve detailed information about a product by its unique ID.",
+    description=(
+        "Retrieve detailed information about a product by its unique ID. "
+        "Send the `ETag` of a previous response as `If-None-Match` to get a 304 when the product did not change."
+    ),
     responses={
+        **product_detail_responses,
+        **not_modified_response,
         **product_not_found_response,
         **internal_server_error_response
     }
 )
-def get_product_by_id(
+async def get_product_by_id(
+    response: Response,
     product_id: int,
-    db: Session = Depends(get_db),
-    service: ProductService = Depends(get_product_service),
+    if_none_match: Optional[str] = Header(
+        None,
+        description="ETag of a previously fetched copy. Returns 304 Not Modified if it is still current."
+    ),
+    db: AsyncSession | Session = Depends(get_read_session),
+    service: AsyncProductService = Depends(get_product_service),
     current_user: ClientModel = Depends(get_current_user),
 ):
-    return service.get_product_by_id(db, product_id)
+    tagged = await service.get_product_by_id(db, product_id, if_none_match=if_none_match)
+    return conditional_response(response, tagged)
 
 @router.put(
     "/{product_id}",
@@ -155,7 +246,7 @@ def get_product_by_id(
         **internal_server_error_response
     }
 )
-def update_product(
+async def update_product(
     product_id: int,
     name: str = Form(...),
     sale_price: float = Form(...),
@@ -164,8 +255,8 @@ def update_product(
     bar_code: str = Form(...),
     category: str = Form(...),
     images: List[UploadFile] = File(...),
-    db: Session = Depends(get_db),
-    service: ProductService = Depends(get_product_service),
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncProductService = Depends(get_product_service),
     file_service: FileService = Depends(get_file_service),
     current_user: ClientModel = Depends(admin_required),
 ):
@@ -178,9 +269,9 @@ def update_product(
         category=category,
     )
 
-    new_image_paths = file_service.save_images(images, category, name)
+    new_image_paths = await run_in_threadpool(file_service.save_images, images, category, name)
 
-    updated_product = service.update_product(
+    updated_product = await service.update_product(
         db=db,
         product_id=product_id,
         product_data=product_update,
@@ -200,10 +291,11 @@ def update_product(
         **internal_server_error_response
     }
 )
-def delete_product(
+async def delete_product(
     product_id: int,
-    db: Session = Depends(get_db),
-    service: ProductService = Depends(get_product_service),
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncProductService = Depends(get_product_service),
+    file_service: FileService = Depends(get_file_service),
     current_user: ClientModel = Depends(admin_required),
 ):
-    service.delete_product(db, product_id)
+    await service.delete_product(db, product_id, file_service=file_service)
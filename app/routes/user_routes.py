@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, Query, status
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.dependencies import admin_required, get_current_user
@@ -7,17 +8,23 @@ from app.docs.user_responses import (
     user_not_found_response,
     user_conflict_response,
     internal_server_error_response,
+    service_unavailable_response,
     user_list_responses
 )
 from app.schemas.user_schema import UserCreate, UserUpdate, UserResponse
-from app.services.user_service import UserService
-from app.database.database import get_db
+from app.services.password_service import PasswordService
+from app.services.async_services import AsyncUserService
+from app.database.session import get_read_session, get_write_session
+from app.container import ServiceContainer, get_container
 from app.models.client_model import ClientModel
 
 router = APIRouter(prefix="/api/v1/users", tags=["users"])
 
-def get_user_service() -> UserService:
-    return UserService(ClientModel)
+def get_user_service(container: ServiceContainer = Depends(get_container)) -> AsyncUserService:
+    return container.async_user_service
+
+def get_password_service(container: ServiceContainer = Depends(get_container)) -> PasswordService:
+    return container.password_service
 
 @router.get(
     "/",
@@ -25,23 +32,24 @@ def get_user_service() -> UserService:
     summary="List users",
     description=(
         "Returns a list of all registered users. Only administrators can access this endpoint. "
-        "Supports optional filters by name and email, as well as pagination using skip and limit."
+        "Supports optional filters by name and email, a search across both, as well as pagination using skip and limit."
     ),
     responses={
         **user_list_responses,
         **internal_server_error_response
     }
 )
-def list_users(
+async def list_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, le=100),
     name: Optional[str] = Query(None, description="Filter by user name"),
     email: Optional[str] = Query(None, description="Filter by user email"),
-    db: Session = Depends(get_db),
-    service: UserService = Depends(get_user_service),
+    search: Optional[str] = Query(None, description="Case-insensitive search across user name and email"),
+    db: AsyncSession | Session = Depends(get_read_session),
+    service: AsyncUserService = Depends(get_user_service),
     current_user: ClientModel = Depends(admin_required),
 ):
-    return service.list_users(db, skip=skip, limit=limit, name=name, email=email)
+    return await service.list_users(db, skip=skip, limit=limit, name=name, email=email, search=search)
 
 @router.post(
     "/",
@@ -54,16 +62,21 @@ def list_users(
     ),
     responses={
         **user_conflict_response,
-        **internal_server_error_response
+        **internal_server_error_response,
+        **service_unavailable_response
     }
 )
-def create_user(
+async def create_user(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
-    service: UserService = Depends(get_user_service),
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncUserService = Depends(get_user_service),
+    password_service: PasswordService = Depends(get_password_service),
     current_user: ClientModel = Depends(admin_required),
 ):
-    return service.create_user(db, user_data)
+    # Checked before hashing, so rejected requests never take a hash pool slot.
+    await service.validate_new_user(db, user_data)
+    hashed_password = await password_service.hash_password(user_data.password)
+    return await service.create_user(db, user_data, hashed_password=hashed_password)
 
 @router.get(
     "/{user_id}",
@@ -77,13 +90,13 @@ def create_user(
         **internal_server_error_response
     }
 )
-def get_user_by_id(
+async def get_user_by_id(
     user_id: int,
-    db: Session = Depends(get_db),
-    service: UserService = Depends(get_user_service),
+    db: AsyncSession | Session = Depends(get_read_session),
+    service: AsyncUserService = Depends(get_user_service),
     current_user: ClientModel = Depends(get_current_user),
 ):
-    return service.get_user_by_id(db, user_id, current_user)
+    return await service.get_user_by_id(db, user_id, current_user)
 
 @router.put(
     "/{user_id}",
@@ -96,17 +109,27 @@ def get_user_by_id(
     responses={
         **user_not_found_response,
         **user_conflict_response,
-        **internal_server_error_response
+        **internal_server_error_response,
+        **service_unavailable_response
     }
 )
-def update_user(
+async def update_user(
     user_id: int,
     user_data: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession | Session = Depends(get_write_session),
     current_user: ClientModel = Depends(get_current_user),
-    service: UserService = Depends(get_user_service)
+    service: AsyncUserService = Depends(get_user_service),
+    password_service: PasswordService = Depends(get_password_service)
 ):
-    return service.update_user(db, user_id, user_data, current_user)
+    hashed_password = None
+    if user_data.password is not None:
+        # Same gate as create_user: no hash for a request that will fail.
+        await service.validate_user_update(db, user_id, user_data, current_user)
+        hashed_password = await password_service.hash_password(user_data.password)
+
+    return await service.update_user(
+        db, user_id, user_data, current_user, hashed_password=hashed_password
+    )
 
 @router.delete(
     "/{user_id}",
@@ -121,10 +144,10 @@ def update_user(
         **internal_server_error_response
     }
 )
-def delete_user(
+async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
-    service: UserService = Depends(get_user_service),
+    db: AsyncSession | Session = Depends(get_write_session),
+    service: AsyncUserService = Depends(get_user_service),
     current_user: ClientModel = Depends(admin_required),
 ):
-    service.delete_user(db, user_id, current_user)
+    await service.delete_user(db, user_id, current_user)
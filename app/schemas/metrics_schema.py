@@ -0,0 +1,171 @@
+from pydantic import BaseModel, Field
+
+class CacheStatsResponse(BaseModel):
+    size: int = Field(
+        ...,
+        title="Size",
+        description="Number of entries currently held by the cache",
+        example=42
+    )
+    max_size: int = Field(
+        ...,
+        title="Max Size",
+        description="Maximum number of entries the cache can hold",
+        example=1024
+    )
+    hits: int = Field(
+        ...,
+        title="Hits",
+        description="Lookups answered from the cache",
+        example=9500
+    )
+    misses: int = Field(
+        ...,
+        title="Misses",
+        description="Lookups that had to fall back to the database",
+        example=500
+    )
+    hit_rate: float = Field(
+        ...,
+        title="Hit Rate",
+        description="Fraction of lookups answered from the cache",
+        example=0.95
+    )
+
+class PasswordPoolStatsResponse(BaseModel):
+    executor: str = Field(
+        ...,
+        title="Executor",
+        description="Kind of executor running bcrypt (process or thread)",
+        example="process"
+    )
+    workers: int = Field(
+        ...,
+        title="Workers",
+        description="Number of hashing workers",
+        example=4
+    )
+    max_pending: int = Field(
+        ...,
+        title="Max Pending",
+        description="Pending operations allowed before requests are rejected with 503",
+        example=64
+    )
+    pending: int = Field(
+        ...,
+        title="Pending",
+        description="Operations currently running or waiting for a worker",
+        example=6
+    )
+    queued: int = Field(
+        ...,
+        title="Queued",
+        description="Operations waiting for a free worker",
+        example=2
+    )
+    completed: int = Field(
+        ...,
+        title="Completed",
+        description="Operations finished successfully since startup",
+        example=1250
+    )
+    failed: int = Field(
+        ...,
+        title="Failed",
+        description="Operations that raised or were cancelled since startup",
+        example=0
+    )
+    rejected: int = Field(
+        ...,
+        title="Rejected",
+        description="Operations rejected because the pool was saturated",
+        example=3
+    )
+
+class DBPoolStatsResponse(BaseModel):
+    pool_size: int = Field(
+        ...,
+        title="Pool Size",
+        description="Number of persistent connections kept by the pool",
+        example=5
+    )
+    checked_out: int = Field(
+        ...,
+        title="Checked Out",
+        description="Connections currently in use by requests",
+        example=3
+    )
+    idle: int = Field(
+        ...,
+        title="Idle",
+        description="Connections sitting in the pool ready to be used",
+        example=2
+    )
+    overflow: int = Field(
+        ...,
+        title="Overflow",
+        description="Connections opened beyond the pool size",
+        example=0
+    )
+    checkouts: int = Field(
+        ...,
+        title="Checkouts",
+        description="Connections handed out since startup",
+        example=15230
+    )
+    slow_checkouts: int = Field(
+        ...,
+        title="Slow Checkouts",
+        description="Checkouts that waited longer than the warning threshold",
+        example=4
+    )
+    avg_wait_ms: float = Field(
+        ...,
+        title="Average Wait (ms)",
+        description="Average time spent waiting for a connection",
+        example=0.08
+    )
+    max_wait_ms: float = Field(
+        ...,
+        title="Max Wait (ms)",
+        description="Longest time spent waiting for a connection",
+        example=212.5
+    )
+
+class DBRoutingStatsResponse(BaseModel):
+    replicas: int = Field(
+        ...,
+        title="Replicas",
+        description="Number of read replicas configured in DATABASE_REPLICA_URLS",
+        example=2
+    )
+    read_your_writes_seconds: float = Field(
+        ...,
+        title="Read-Your-Writes Window (s)",
+        description="How long a client keeps reading from the primary after a write",
+        example=5.0
+    )
+    pinned_clients: int = Field(
+        ...,
+        title="Pinned Clients",
+        description="Clients currently pinned to the primary after a recent write",
+        example=12
+    )
+    replica_reads: int = Field(
+        ...,
+        title="Replica Reads",
+        description="Read-only requests served by a replica",
+        example=48210
+    )
+    primary_reads: int = Field(
+        ...,
+        title="Primary Reads",
+        description="Read-only requests served by the primary",
+        example=1530
+    )
+    writes: int = Field(
+        ...,
+        title="Writes",
+        description="Write requests seen since startup",
+        example=860
+    )
@@ -64,6 +64,55 @@ class OrderItemResponse(OrderItemBase):
     class Config:
         orm_mode = True
 
+class ProductSnapshot(BaseModel):
+    id: int = Field(
+        ...,
+        title="Product ID",
+        description="Unique identifier of the product",
+        example=18
+    )
+    name: Optional[str] = Field(
+        None,
+        title="Name",
+        description="Product name when the order was placed",
+        example="Basic Cotton T-Shirt"
+    )
+    bar_code: Optional[str] = Field(
+        None,
+        title="Bar Code",
+        description="Product bar code when the order was placed",
+        example="7891234567890"
+    )
+    category: Optional[str] = Field(
+        None,
+        title="Category",
+        description="Product category when the order was placed",
+        example="T-Shirts"
+    )
+    image_path: Optional[str] = Field(
+        None,
+        title="Image Path",
+        description="Path of the product's first image when the order was placed",
+        example="/images/products/basic_cotton_tshirt_1.jpg"
+    )
+
+class OrderHistoryItemResponse(OrderItemBase):
+    id: int = Field(
+        ...,
+        title="Order Item ID",
+        description="Unique identifier of the order item",
+        example=1
+    )
+    product: ProductSnapshot = Field(
+        ...,
+        validation_alias="product_snapshot",
+        title="Product Snapshot",
+        description="Product as it was when the order was placed"
+    )
+
+    class Config:
+        orm_mode = True
+
 class OrderBase(BaseModel):
     client_id: Optional[int] = Field(
         None,
@@ -223,3 +272,45 @@ class OrderResponse(OrderBase):
                 ]
             }
         }
+
+class OrderHistoryResponse(OrderBase):
+    id: int = Field(
+        ...,
+        title="Order ID",
+        description="Unique identifier of the order",
+        example=101
+    )
+    order_items: List[OrderHistoryItemResponse] = Field(
+        ...,
+        title="Order Items",
+        description="Items of the order, with the products as they were when it was placed"
+    )
+
+    class Config:
+        orm_mode = True
+
+class OrderBulkDeleteReport(BaseModel):
+    deleted: int = Field(
+        ...,
+        title="Deleted",
+        description="Number of orders deleted",
+        example=2500
+    )
+    restocked: int = Field(
+        ...,
+        title="Restocked",
+        description="Number of deleted orders whose items were returned to stock",
+        example=300
+    )
+    batches: int = Field(
+        ...,
+        title="Batches",
+        description="Number of batches committed",
+        example=3
+    )
+    done: bool = Field(
+        ...,
+        title="Done",
+        description="Whether no matching order is left; repeat the request otherwise",
+        example=True
+    )
@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+from app.enums.role_enum import RoleEnum
+
+class Principal(BaseModel):
+    id: int = Field(
+        ...,
+        title="User ID",
+        description="Unique identifier of the authenticated user",
+        example=1
+    )
+    email: str = Field(
+        ...,
+        title="Email address",
+        description="Email address carried in the token subject",
+        example="john@example.com"
+    )
+    role: RoleEnum = Field(
+        ...,
+        title="Role",
+        description="Role carried in the access token",
+        example="user"
+    )
+
+    model_config = {
+        "frozen": True
+    }
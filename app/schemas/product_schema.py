@@ -146,3 +146,48 @@ class ProductResponse(ProductBase):
     model_config = {
         "from_attributes": True
     }
+
+class ProductImportError(BaseModel):
+    line: int = Field(
+        ...,
+        title="Line",
+        description="Line of the import body where the rejected row starts",
+        example=42
+    )
+    bar_code: Optional[str] = Field(
+        None,
+        title="Bar Code",
+        description="Bar code of the rejected row, when it could be read",
+        example="1002003004001"
+    )
+    errors: List[str] = Field(
+        ...,
+        title="Errors",
+        description="Reasons the row was rejected",
+        example=["sale_price: Input should be a valid number, unable to parse string as a number"]
+    )
+
+class ProductImportReport(BaseModel):
+    imported: int = Field(
+        ...,
+        title="Imported",
+        description="Number of products created",
+        example=99998
+    )
+    failed: int = Field(
+        ...,
+        title="Failed",
+        description="Number of rows rejected",
+        example=2
+    )
+    errors: List[ProductImportError] = Field(
+        [],
+        title="Errors",
+        description="Rejected rows in body order, up to the configured limit"
+    )
+    errors_truncated: bool = Field(
+        False,
+        title="Errors Truncated",
+        description="Whether more rows failed than are listed in errors",
+        example=False
+    )
@@ -0,0 +1,270 @@
+import logging
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.enums.import_format_enum import ImportFormatEnum
+from app.schemas.order_schema import OrderHistoryResponse, OrderResponse
+from app.schemas.product_schema import ProductResponse
+from app.services.file_service import FileService
+from app.services.order_service import OrderService
+from app.services.product_cache_service import ProductCacheService
+from app.services.product_import_service import ProductImportService
+from app.services.product_service import ProductService
+from app.services.token_version_service import TokenVersionService
+from app.services.user_service import UserService
+from app.utils.etag import Tagged, entity_tag, etag_matches
+from app.utils.streaming import iter_records
+
+logger = logging.getLogger(__name__)
+
+PRODUCT = TypeAdapter(ProductResponse)
+PRODUCT_LIST = TypeAdapter(List[ProductResponse])
+PRODUCT_CHANGE = TypeAdapter(Tuple[ProductResponse, List[str]])
+ORDER = TypeAdapter(OrderResponse)
+ORDER_LIST = TypeAdapter(List[OrderResponse])
+ORDER_HISTORY_LIST = TypeAdapter(List[OrderHistoryResponse])
+
+
+def product_version(product) -> tuple:
+    return ("product", product.id, product.version)
+
+
+def order_version(order) -> tuple:
+    # Order responses embed their products, so a product change is an
+    # order change too.
+    return (
+        "order",
+        order.id,
+        order.version,
+        tuple(product_version(item.product) for item in order.order_items)
+    )
+
+
+def cached_product_etag(data: dict) -> str:
+    return entity_tag([("product", data["id"], data[ProductCacheService.VERSION_KEY])])
+
+
+def product_list_etag(products) -> str:
+    return entity_tag(product_version(product) for product in products)
+
+
+def order_etag(order) -> str:
+    return entity_tag([order_version(order)])
+
+
+def order_list_etag(orders) -> str:
+    return entity_tag(order_version(order) for order in orders)
+
+
+def order_history_etag(orders) -> str:
+    # Snapshots never change once written, so only the orders count.
+    return entity_tag(("order", order.id, order.version) for order in orders)
+
+
+class AsyncServiceAdapter:
+    """Awaitable facade over a sync service.
+
+    With an ``AsyncSession`` the service method runs through ``run_sync`` on
+    the async engine, so database I/O never occupies a worker thread. With a
+    plain ``Session`` it falls back to Starlette's threadpool. When a
+    response adapter is given, the result is serialized inside the same call
+    so lazy relationships are loaded while the session is still usable.
+
+    With an ``etag`` function the call returns a ``Tagged`` result; when the
+    tag matches ``if_none_match`` serialization is skipped altogether.
+    """
+
+    def __init__(self, service: Any):
+        self.service = service
+
+    async def _call(
+        self,
+        db: AsyncSession | Session,
+        method: str,
+        *args,
+        response: Optional[TypeAdapter] = None,
+        etag: Optional[Callable[[Any], str]] = None,
+        if_none_match: Optional[str] = None,
+        **kwargs
+    ):
+        def serialize(result):
+            if response is None or result is None:
+                return result
+            return response.validate_python(result, from_attributes=True)
+
+        def call(session: Session):
+            result = getattr(self.service, method)(session, *args, **kwargs)
+            if etag is None:
+                return serialize(result)
+            tag = etag(result)
+            if etag_matches(if_none_match, tag):
+                return Tagged(tag, None)
+            return Tagged(tag, serialize(result))
+
+        if isinstance(db, AsyncSession):
+            return await db.run_sync(call)
+        return await run_in_threadpool(call, db)
+
+
+class AsyncProductService(AsyncServiceAdapter):
+    service: ProductService
+
+    async def list_products(self, db, if_none_match: Optional[str] = None, **filters) -> Tagged:
+        return await self._call(
+            db, "list_products", response=PRODUCT_LIST,
+            etag=product_list_etag, if_none_match=if_none_match, **filters
+        )
+
+    async def get_product_by_id(self, db, product_id: int, if_none_match: Optional[str] = None) -> Tagged:
+        return await self._call(
+            db, "get_cached_product", product_id, response=PRODUCT,
+            etag=cached_product_etag, if_none_match=if_none_match
+        )
+
+    async def create_product(self, db, product_data, image_paths: List[str]):
+        return await self._call(db, "create_product", product_data, image_paths, response=PRODUCT)
+
+    async def update_product(
+        self,
+        db,
+        product_id: int,
+        product_data,
+        file_service: Optional[FileService] = None,
+        **kwargs
+    ):
+        product, stale_paths = await self._call(
+            db, "update_product", product_id, product_data,
+            response=PRODUCT_CHANGE, file_service=file_service, **kwargs
+        )
+        await self._delete_paths(file_service, stale_paths)
+        return product
+
+    async def delete_product(self, db, product_id: int, file_service: Optional[FileService] = None) -> None:
+        image_folders = await self._call(db, "delete_product", product_id)
+        await self._delete_paths(file_service, image_folders)
+
+    async def _delete_paths(self, file_service: Optional[FileService], paths: List[str]) -> None:
+        # The service has committed by now. Disk cleanup stays out of run_sync,
+        # which would otherwise block the event loop.
+        if file_service and paths:
+            await run_in_threadpool(file_service.delete_paths, paths)
+
+
+class AsyncProductImportService(AsyncServiceAdapter):
+    service: ProductImportService
+
+    def format_for(self, content_type: Optional[str]) -> ImportFormatEnum:
+        return self.service.format_for(content_type)
+
+    async def import_products(self, db, body: AsyncIterator[bytes], import_format: ImportFormatEnum) -> dict:
+        # Rows are split off the body as it arrives and written one chunk
+        # per call, so memory stays bounded by the chunk size.
+        product_import = self.service.start_import(import_format)
+        chunk = []
+        async for record in iter_records(body, quoted=import_format == ImportFormatEnum.CSV):
+            chunk.append(record)
+            if len(chunk) >= self.service.chunk_size:
+                await self._call(db, "import_chunk", product_import, chunk)
+                chunk = []
+        if chunk:
+            await self._call(db, "import_chunk", product_import, chunk)
+        return product_import.report()
+
+
+class AsyncOrderService(AsyncServiceAdapter):
+    service: OrderService
+
+    async def list_orders(self, db, current_user, if_none_match: Optional[str] = None, **filters) -> Tagged:
+        return await self._call(
+            db, "list_orders", current_user, response=ORDER_LIST,
+            etag=order_list_etag, if_none_match=if_none_match, **filters
+        )
+
+    async def list_order_history(self, db, current_user, if_none_match: Optional[str] = None, **filters) -> Tagged:
+        return await self._call(
+            db, "list_orders", current_user, response=ORDER_HISTORY_LIST,
+            etag=order_history_etag, if_none_match=if_none_match, from_snapshot=True, **filters
+        )
+
+    async def create_order(self, db, order_data, current_user):
+        return await self._call(db, "create_order", order_data, current_user, response=ORDER)
+
+    async def get_order_by_id(self, db, order_id: int, current_user, if_none_match: Optional[str] = None) -> Tagged:
+        return await self._call(
+            db, "get_order_by_id", order_id, current_user, response=ORDER,
+            etag=order_etag, if_none_match=if_none_match
+        )
+
+    async def update_order(self, db, order_id: int, order_data, current_user):
+        return await self._call(
+            db, "update_order", order_id, order_data, current_user, response=ORDER
+        )
+
+    async def delete_order(self, db, order_id: int, current_user) -> None:
+        await self._call(db, "delete_order", order_id, current_user)
+
+    async def delete_orders(
+        self, db, batch_size: int, max_batches: Optional[int] = None, **filters
+    ) -> dict:
+        # One transaction per batch, committed before the next one starts,
+        # so an interrupted run keeps what it already deleted.
+        report = {"deleted": 0, "restocked": 0, "batches": 0, "done": False}
+        while max_batches is None or report["batches"] < max_batches:
+            batch = await self._call(db, "delete_order_batch", batch_size, **filters)
+            if not batch["deleted"]:
+                break
+            report["deleted"] += batch["deleted"]
+            report["restocked"] += batch["restocked"]
+            report["batches"] += 1
+            logger.info(
+                "Bulk order deletion: batch %d deleted %d orders (%d so far)",
+                report["batches"], batch["deleted"], report["deleted"]
+            )
+        # Batches skip locked orders, so an empty one only means the rest
+        # is locked or gone; ask without locking which it is.
+        report["done"] = not await self._call(db, "has_orders_to_delete", **filters)
+        return report
+
+
+class AsyncUserService(AsyncServiceAdapter):
+    # Users have no relationships and are refreshed after every write, so
+    # the ORM instances can be returned as they are.
+    service: UserService
+
+    async def list_users(self, db, **filters):
+        return await self._call(db, "list_users", **filters)
+
+    async def get_user_by_id(self, db, user_id: int, current_user):
+        return await self._call(db, "get_user_by_id", user_id, current_user)
+
+    async def get_user_by_email(self, db, email: str):
+        return await self._call(db, "get_user_by_email", email)
+
+    async def validate_new_user(self, db, user_data) -> None:
+        await self._call(db, "validate_new_user", user_data)
+
+    async def validate_user_update(self, db, user_id: int, user_data, current_user) -> None:
+        await self._call(db, "validate_user_update", user_id, user_data, current_user)
+
+    async def create_user(self, db, user_data, **kwargs):
+        return await self._call(db, "create_user", user_data, **kwargs)
+
+    async def update_user(self, db, user_id: int, user_data, current_user, **kwargs):
+        return await self._call(db, "update_user", user_id, user_data, current_user, **kwargs)
+
+    async def delete_user(self, db, user_id: int, current_user) -> None:
+        await self._call(db, "delete_user", user_id, current_user)
+
+
+class AsyncTokenVersionService(AsyncServiceAdapter):
+    service: TokenVersionService
+
+    async def current(self, db, user_id: int) -> Optional[int]:
+        # Cache hits are answered without a trip to the database.
+        version = self.service.get_cached(user_id)
+        if version is None:
+            version = await self._call(db, "load", user_id)
+        return version
@@ -1,9 +1,17 @@
+import os
+from typing import Optional
 from fastapi import HTTPException, status
-from pytest import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.enums.role_enum import RoleEnum
 from app.models.client_model import ClientModel
+from app.schemas.principal_schema import Principal
 from app.schemas.token_schema import TokenSchema
 from app.schemas.user_schema import UserCreate
+from app.services.async_services import AsyncTokenVersionService, AsyncUserService
 from app.services.jwt_service import JWTService
+from app.services.password_service import PasswordService
+from app.services.token_version_service import TokenVersionService, token_versions
 from app.services.user_service import UserService
 import jwt
 
@@ -11,29 +19,67 @@ class AuthService:
     INVALID_CREDENTIALS = "Invalid email or password"
     INVALID_REFRESH_TOKEN = "Invalid refresh token"
     REFRESH_TOKEN_EXPIRED = "Refresh token expired"
+    TOKEN_REVOKED = "Token has been revoked"
+    STATELESS_CLAIMS = ("uid", "role", "ver")
     UNAUTHORIZED = status.HTTP_401_UNAUTHORIZED
 
-    def __init__(self, user_service: UserService, jwt_service: JWTService):
+    def __init__(
+        self,
+        user_service: UserService,
+        jwt_service: JWTService,
+        password_service: PasswordService,
+        token_version_service: TokenVersionService = token_versions,
+        stateless: bool = os.getenv("STATELESS_AUTH", "false").lower() == "true"
+    ):
         self.user_service = user_service
+        self.async_user_service = AsyncUserService(user_service)
         self.jwt_service = jwt_service
+        self.password_service = password_service
+        self.token_version_service = token_version_service
+        self.async_token_version_service = AsyncTokenVersionService(token_version_service)
+        self.stateless = stateless
 
-    def register(self, db: Session, data: UserCreate) -> ClientModel:
-        return self.user_service.create_user(db, data)
+    async def register(self, db: AsyncSession | Session, data: UserCreate) -> ClientModel:
+        # Duplicates are turned away before they take a slot in the hash pool.
+        await self.async_user_service.validate_new_user(db, data)
+        hashed_password = await self.password_service.hash_password(data.password)
+        return await self.async_user_service.create_user(
+            db, data, hashed_password=hashed_password
+        )
 
-    def login(self, db:Session, email: str, password: str) -> TokenSchema:
-        user = self.user_service.get_user_by_email(db, email)
-        if not user or not self.user_service.verify_password(password, user.password):
+    async def login(self, db: AsyncSession | Session, email: str, password: str) -> TokenSchema:
+        user = await self.async_user_service.get_user_by_email(db, email)
+        if not user or not await self.password_service.verify_password(password, user.password):
             raise HTTPException(
                 status_code=self.UNAUTHORIZED,
                 detail=self.INVALID_CREDENTIALS
             )
 
         token_data = {"sub": user.email}
+        if self.stateless:
+            token_data.update({
+                "uid": user.id,
+                "role": RoleEnum(user.role).value,
+                "ver": user.token_version,
+            })
         access_token = self.jwt_service.create_access_token(data=token_data)
 
         return TokenSchema(access_token=access_token)
 
-    def refresh_token(self, refresh_token: str) -> str:
+    async def get_stateless_principal(self, db: AsyncSession | Session, payload: dict) -> Optional[Principal]:
+        if not self.stateless or not all(claim in payload for claim in self.STATELESS_CLAIMS):
+            return None
+
+        if await self.async_token_version_service.current(db, payload["uid"]) != payload["ver"]:
+            raise HTTPException(
+                status_code=self.UNAUTHORIZED,
+                detail=self.TOKEN_REVOKED,
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+
+        return Principal(id=payload["uid"], email=payload["sub"], role=payload["role"])
+
+    async def refresh_token(self, db: AsyncSession | Session, refresh_token: str) -> str:
         try:
             payload = self.jwt_service.decode_token(refresh_token)
             email = payload.get("sub")
@@ -42,7 +88,11 @@ class AuthService:
                     status_code=self.UNAUTHORIZED,
                     detail=self.INVALID_REFRESH_TOKEN
                 )
-            return self.jwt_service.create_access_token({"sub": email})
+
+            token_data = {"sub": email}
+            if await self.get_stateless_principal(db, payload) is not None:
+                token_data.update({claim: payload[claim] for claim in self.STATELESS_CLAIMS})
+            return self.jwt_service.create_access_token(token_data)
         except jwt.ExpiredSignatureError:
             raise HTTPException(
                 status_code=self.UNAUTHORIZED,
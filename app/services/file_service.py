@@ -48,4 +48,14 @@ class FileService:
                 if path.exists() and path.is_file():
                     path.unlink()
             except Exception as error:
-                print(f"Error deleting file {file_path}: {error}")
\ No newline at end of file
+                print(f"Error deleting file {file_path}: {error}")
+
+    def delete_paths(self, paths: List[str]) -> None:
+        for path in map(Path, paths):
+            try:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                elif path.is_file():
+                    path.unlink()
+            except Exception as error:
+                print(f"Error deleting {path}: {error}")
@@ -1,7 +1,10 @@
+import hashlib
 import os
+import time
 import jwt
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
+from app.utils.ttl_cache import TTLCache
 
 class JWTService:
     INVALID_TOKEN_SUB = "Invalid token: 'sub' claim missing"
@@ -14,12 +17,24 @@ class JWTService:
         secret_key: str = os.getenv("SECRET_KEY", "secret-key"),
         algorithm: str = "HS256",
         access_token_expire_minutes: int = 30,
-        refresh_token_expire_days: int = 7
+        refresh_token_expire_days: int = 7,
+        token_cache_size: int = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "4096"))
     ):
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
+        # TTL is bounded per entry by the token exp, so the cache-wide
+        # ceiling only needs to cover the longest-lived token.
+        self.token_cache = TTLCache(
+            max_size=token_cache_size,
+            ttl_seconds=timedelta(days=refresh_token_expire_days).total_seconds()
+        )
+
+    @property
+    def key_id(self) -> str:
+        material = f"{self.algorithm}:{self.secret_key}".encode()
+        return hashlib.sha256(material).hexdigest()[:16]
 
     def _build_token(self, data: dict, expires_delta: timedelta) -> str:
         to_encode = data.copy()
@@ -47,6 +62,17 @@ class JWTService:
         )
 
     def decode_token(self, token: str) -> dict:
+        cache_key = (self.key_id, hashlib.sha256(token.encode()).digest())
+        cached_payload = self.token_cache.get(cache_key)
+        if cached_payload is not None:
+            if cached_payload["exp"] <= time.time():
+                self.token_cache.invalidate(cache_key)
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail=self.TOKEN_EXPIRED
+                )
+            return dict(cached_payload)
+
         try:
             payload = jwt.decode(
                 token,
@@ -58,11 +84,16 @@ class JWTService:
             if username is None:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=INVALID_TOKEN_SUB
+                    detail=self.INVALID_TOKEN_SUB
                 )
-            
-            return payload
-        
+
+            if "exp" in payload:
+                self.token_cache.set(cache_key, payload, payload["exp"] - time.time())
+
+            return dict(payload)
+
+        except HTTPException:
+            raise
         except jwt.ExpiredSignatureError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
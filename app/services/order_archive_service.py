@@ -0,0 +1,168 @@
+"""Moves old completed and canceled orders to the archive tables.
+
+Run it from cron:
+
+    python -m app.services.order_archive_service --older-than-months 12
+
+or let the application run it every ORDER_ARCHIVE_INTERVAL_SECONDS.
+"""
+import argparse
+import asyncio
+import datetime
+import logging
+import os
+import time
+from typing import Callable, Optional
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.database.partitions import add_months, month_start
+from app.enums.order_status_enum import OrderStatusEnum
+from app.models.archived_order_item_model import ArchivedOrderItemModel
+from app.models.archived_order_model import ArchivedOrderModel
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+
+logger = logging.getLogger(__name__)
+
+
+class OrderArchiveService:
+    """Archives orders in batches of ``batch_size``, one transaction each.
+
+    A batch copies its orders and their items with ``INSERT ... SELECT``,
+    deletes them from the live tables and commits, so locks are held on
+    those rows only, and only for one batch. The job sleeps
+    ``pause_seconds`` between batches to leave the database to live
+    traffic. Orders locked by a request are skipped and picked up by a
+    later run.
+    """
+
+    ARCHIVED_STATUSES = (OrderStatusEnum.COMPLETED, OrderStatusEnum.CANCELED)
+
+    def __init__(
+        self,
+        order_model: OrderModel,
+        order_items_model: OrderItemModel,
+        archived_order_model: ArchivedOrderModel,
+        archived_order_items_model: ArchivedOrderItemModel,
+        batch_size: int = int(os.getenv("ORDER_ARCHIVE_BATCH_SIZE", "10000")),
+        after_months: int = int(os.getenv("ORDER_ARCHIVE_AFTER_MONTHS", "12")),
+        pause_seconds: float = float(os.getenv("ORDER_ARCHIVE_PAUSE_SECONDS", "1"))
+    ):
+        self.order_model = order_model
+        self.order_items_model = order_items_model
+        self.archived_order_model = archived_order_model
+        self.archived_order_items_model = archived_order_items_model
+        self.batch_size = batch_size
+        self.after_months = after_months
+        self.pause_seconds = pause_seconds
+
+    def cutoff(self, now: Optional[datetime.datetime] = None) -> datetime.datetime:
+        # Whole months, so a partitioned table empties partition by partition.
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        return add_months(month_start(now), -self.after_months)
+
+    def archive_batch(self, db: Session, cutoff: datetime.datetime) -> int:
+        order_ids = db.scalars(
+            select(self.order_model.id)
+                .where(
+                    self.order_model.status.in_(self.ARCHIVED_STATUSES),
+                    self.order_model.created_at < cutoff
+                )
+                .order_by(self.order_model.created_at, self.order_model.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+        ).all()
+        if not order_ids:
+            db.rollback()
+            return 0
+
+        self._copy(db, self.order_model, self.archived_order_model, self.order_model.id.in_(order_ids))
+        self._copy(
+            db, self.order_items_model, self.archived_order_items_model,
+            self.order_items_model.order_id.in_(order_ids)
+        )
+        db.execute(
+            delete(self.order_items_model)
+                .where(self.order_items_model.order_id.in_(order_ids))
+                .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            delete(self.order_model)
+                .where(self.order_model.id.in_(order_ids))
+                .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return len(order_ids)
+
+    def archive(
+        self,
+        session_factory: Callable[[], Session],
+        cutoff: Optional[datetime.datetime] = None,
+        max_batches: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> int:
+        cutoff = cutoff or self.cutoff()
+        archived = batches = 0
+        while max_batches is None or batches < max_batches:
+            with session_factory() as db:
+                moved = self.archive_batch(db, cutoff)
+            archived += moved
+            batches += 1
+            if moved < self.batch_size:
+                break
+            sleep(self.pause_seconds)
+        return archived
+
+    async def run_periodically(self, session_factory: Callable[[], Session], interval_seconds: float) -> None:
+        while True:
+            try:
+                archived = await run_in_threadpool(self.archive, session_factory)
+                if archived:
+                    logger.info("Archived %d orders", archived)
+            except Exception:
+                logger.exception("Order archival failed; retrying in %s s", interval_seconds)
+            await asyncio.sleep(interval_seconds)
+
+    @staticmethod
+    def _copy(db: Session, source, target, condition) -> None:
+        columns = [column.name for column in target.__table__.columns]
+        db.execute(
+            insert(target).from_select(
+                columns,
+                select(*(source.__table__.c[name] for name in columns)).where(condition)
+            )
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move old completed and canceled orders to the archive tables.")
+    parser.add_argument("--older-than-months", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--pause-seconds", type=float, default=None)
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    from app.database.database import SessionLocal
+    from app.models.client_model import ClientModel  # noqa: F401 - registers the order mappers
+    from app.models.product_model import ProductModel  # noqa: F401
+
+    options = {
+        name: value
+        for name, value in (
+            ("after_months", args.older_than_months),
+            ("batch_size", args.batch_size),
+            ("pause_seconds", args.pause_seconds),
+        )
+        if value is not None
+    }
+    service = OrderArchiveService(
+        OrderModel, OrderItemModel, ArchivedOrderModel, ArchivedOrderItemModel, **options
+    )
+
+    print(f"Archived {service.archive(SessionLocal, max_batches=args.max_batches)} orders")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload
 from decimal import Decimal
 
+from app.database.partitions import ORDER_PARTITIONING, PARTITION_WALK_MONTHS, month_start, month_windows
 from app.enums.order_status_enum import OrderStatusEnum
+from app.models.archived_order_item_model import ArchivedOrderItemModel
+from app.models.archived_order_model import ArchivedOrderModel
 from app.models.client_model import ClientModel
 from app.models.order_item_model import OrderItemModel
 from app.models.order_model import OrderModel
@@ -13,6 +17,8 @@ from app.schemas.order_schema import OrderCreate, OrderItemCreate, OrderUpdate
 from app.services.product_service import ProductService
 from app.services.user_service import UserService
 from app.utils.db_exceptions import handle_db_exceptions
+from app.utils.pagination import INVALID_CURSOR, decode_cursor
+from app.utils.search import text_search
 
 
 class OrderService:
@@ -22,6 +28,11 @@ class OrderService:
     ONLY_PAYMENT_OR_CANCELLATION_ALLOWED = "Only payment method or cancellation is allowed for users."
     NO_PERMISSION_TO_DELETE_ORDER = "You do not have permission to delete this order."
     FORBIDDEN_ORDER_ACCESS = "You do not have permission to access this order."
+    BULK_DELETE_FILTER_REQUIRED = "At least one filter is required to delete orders in bulk."
+    CURSOR_SORT_KEY = "created_at"
+    # Stock went back when the order was cancelled, and stays sold once
+    # it completed: deleting either leaves the products alone.
+    STOCK_SETTLED_STATUSES = (OrderStatusEnum.COMPLETED, OrderStatusEnum.CANCELED)
 
     def __init__(
         self,
@@ -29,11 +40,47 @@ class OrderService:
         order_items_model: OrderItemModel,
         product_service: ProductService,
         user_service: UserService,
+        archived_order_model: ArchivedOrderModel = ArchivedOrderModel,
+        archived_order_items_model: ArchivedOrderItemModel = ArchivedOrderItemModel,
+        partitioned: bool = ORDER_PARTITIONING,
+        partition_walk_months: int = PARTITION_WALK_MONTHS
     ):
         self.order_model = order_model
         self.order_items_model = order_items_model
         self.product_service = product_service
         self.user_service = user_service
+        self.archived_order_model = archived_order_model
+        self.archived_order_items_model = archived_order_items_model
+        self.partitioned = partitioned
+        self.partition_walk_months = max(1, partition_walk_months)
+        # Order items with their product, and every product's images, so
+        # serializing an OrderResponse does not lazy-load row by row. A
+        # single order joins its items and products in one statement.
+        self.load_order_items = (
+            joinedload(self.order_model.order_items)
+                .joinedload(self.order_items_model.product)
+                .selectinload(ProductModel.images)
+        )
+        # A page of orders loads each level with its own IN query instead:
+        # joining a collection under LIMIT repeats every order once per
+        # item and forces the page into a subquery, while selectin costs
+        # one statement per level however many orders the page holds.
+        self.load_order_page = self._page_loader(self.order_model, self.order_items_model)
+        self.load_archived_order_page = self._page_loader(
+            self.archived_order_model, self.archived_order_items_model
+        )
+        # History pages read the product snapshot stored on each item, so
+        # the items are the only thing to load.
+        self.load_order_history = selectinload(self.order_model.order_items)
+        self.load_archived_order_history = selectinload(self.archived_order_model.order_items)
+
+    @staticmethod
+    def _page_loader(order_model, order_items_model):
+        return (
+            selectinload(order_model.order_items)
+                .selectinload(order_items_model.product)
+                .selectinload(ProductModel.images)
+        )
 
     @handle_db_exceptions
     def list_orders(
@@ -45,38 +92,152 @@ class OrderService:
         category: Optional[str] = None,
         order_id: Optional[int] = None,
         status: Optional[OrderStatusEnum] = None,
-        client_id: Optional[int] = None
+        client_id: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        include_archived: bool = False,
+        from_snapshot: bool = False
     ) -> List[OrderModel]:
-        query = db.query(self.order_model)
+        """Newest orders first, ``limit`` at a time.
+
+        With ``from_snapshot`` the items' products are not loaded: the
+        caller serializes the snapshot stored on each item instead, and
+        ``category`` matches the snapshot's category.
+        """
+        position = self._cursor_position(cursor) if cursor else None
+        if current_user.role != "ADMIN":
+            client_id = current_user.id
+        filters = dict(
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+            order_id=order_id,
+            status=status,
+            client_id=client_id,
+            position=position,
+            from_snapshot=from_snapshot
+        )
+
+        query = self._orders_query(db, self.order_model, self.order_items_model, **filters)
+        query = query.options(self.load_order_history if from_snapshot else self.load_order_page)
+        if self.partitioned and not start_date:
+            newest = [bound for bound in (end_date, position and position[0]) if bound]
+            orders = self._list_month_by_month(db, query, newest, limit)
+        else:
+            orders = query.limit(limit).all()
+
+        if include_archived:
+            # Archived orders keep their ids, so the two pages merge on the
+            # same (created_at, id) order and the cursor spans both tables.
+            archived = self._orders_query(
+                db, self.archived_order_model, self.archived_order_items_model, **filters
+            ).options(
+                self.load_archived_order_history if from_snapshot else self.load_archived_order_page
+            ).limit(limit).all()
+            orders = sorted(
+                orders + archived, key=lambda order: (order.created_at, order.id), reverse=True
+            )[:limit]
+        return orders
+
+    def _orders_query(
+        self,
+        db: Session,
+        order_model,
+        order_items_model,
+        start_date: Optional[datetime.datetime],
+        end_date: Optional[datetime.datetime],
+        category: Optional[str],
+        order_id: Optional[int],
+        status: Optional[OrderStatusEnum],
+        client_id: Optional[int],
+        position: Optional[tuple],
+        from_snapshot: bool
+    ):
+        sort_columns = (order_model.created_at, order_model.id)
 
         filters = []
 
         if start_date:
-            filters.append(self.order_model.created_at >= start_date)
+            filters.append(order_model.created_at >= start_date)
         if end_date:
-            filters.append(self.order_model.created_at <= end_date)
+            filters.append(order_model.created_at <= end_date)
         if order_id:
-            filters.append(self.order_model.id == order_id)
+            filters.append(order_model.id == order_id)
         if status:
-            filters.append(self.order_model.status == status)
-
-        if current_user.role != "ADMIN":
-            filters.append(self.order_model.client_id == current_user.id)
-        elif client_id:
-            filters.append(self.order_model.client_id == client_id)
+            filters.append(order_model.status == status)
+        if client_id:
+            filters.append(order_model.client_id == client_id)
 
         if category:
-            query = (
-                query.join(self.order_model.order_items)
-                    .join(self.order_items_model.product)
-                    .filter(ProductModel.category.ilike(f"%{category}%"))
-            )
-
-        if filters:
-            query = query.filter(*filters)
+            # EXISTS keeps one row per order, where joining the items would
+            # return an order once per matching item.
+            same_order = [order_items_model.order_id == order_model.id]
+            if self.partitioned and order_model is self.order_model:
+                # Lets each probe prune to the order's month partition.
+                same_order.append(order_items_model.order_created_at == order_model.created_at)
+            if from_snapshot:
+                matching_items = select(order_items_model.id).where(
+                    *same_order, text_search(category, order_items_model.product_category)
+                )
+            else:
+                matching_items = select(order_items_model.id)\
+                    .join(order_items_model.product)\
+                    .where(*same_order, text_search(category, ProductModel.category))
+            filters.append(matching_items.exists())
+
+        if position:
+            # Newest first: seek past the (created_at, id) of the last order
+            # of the previous page.
+            filters.append(tuple_(*sort_columns) < position)
+
+        return (
+            db.query(order_model)
+                .filter(*filters)
+                .order_by(*(column.desc() for column in sort_columns))
+        )
 
-        query = query.options(joinedload(self.order_model.order_items))
-        return query.all()
+    def _list_month_by_month(self, db: Session, query, newest: List[datetime.datetime], limit: int) -> List[OrderModel]:
+        # Without a lower date bound the page would be planned over every
+        # partition. One month at a time, newest first, each statement
+        # prunes to a single partition, and the walk stops once the page is
+        # full or the oldest matching order is reached. The bounds come from
+        # the page's own filters, so a client's listing only spans the
+        # months that client ordered in.
+        oldest, latest = query.with_entities(
+            func.min(self.order_model.created_at), func.max(self.order_model.created_at)
+        ).order_by(None).one()
+        if latest is None:
+            return []
+
+        orders = []
+        start_month = min(month_start(moment) for moment in [latest, *newest])
+        windows = list(month_windows(start_month, oldest))
+        for month, next_month in windows[:self.partition_walk_months]:
+            orders += query.filter(
+                self.order_model.created_at >= month,
+                self.order_model.created_at < next_month
+            ).limit(limit - len(orders)).all()
+            if len(orders) == limit:
+                return orders
+
+        if len(windows) > self.partition_walk_months:
+            # Sparse history (years between orders): rather than one
+            # statement per empty month, read what is left in one go.
+            orders += query.filter(
+                self.order_model.created_at >= month_start(oldest),
+                self.order_model.created_at < windows[self.partition_walk_months - 1][0]
+            ).limit(limit - len(orders)).all()
+        return orders
+
+    def _cursor_position(self, cursor: str) -> tuple:
+        last_created_at, last_id = decode_cursor(cursor, self.CURSOR_SORT_KEY)
+        try:
+            return (datetime.datetime.fromisoformat(last_created_at), last_id)
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=INVALID_CURSOR
+            )
 
     @handle_db_exceptions
     def create_order(
@@ -107,6 +268,7 @@ class OrderService:
 
         for item in order_items:
             item.order_id = new_order.id
+            item.order_created_at = new_order.created_at
             db.add(item)
 
         db.commit()
@@ -115,22 +277,33 @@ class OrderService:
 
 
     def _build_order_items(self, db: Session, items_data: List[OrderItemCreate]):
+        # One line per product: repeated products are merged, keeping the
+        # position of their first line.
+        quantities: Dict[int, int] = {}
+        for item in items_data:
+            quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+
+        products = self.product_service.reserve_stock(db, quantities)
+        image_paths = self.product_service.primary_image_paths(db, list(quantities))
+
         order_items = []
         total = Decimal('0.0')
 
-        for item in items_data:
-            product = self.product_service.validate_and_decrease_stock(
-                db, item.product_id, item.quantity
-            )
+        for product_id, quantity in quantities.items():
+            product = products[product_id]
             price = product.sale_price
-            subtotal = price * item.quantity
+            subtotal = price * quantity
             total += subtotal
 
             order_items.append(
                 self.order_items_model(
-                    product_id=item.product_id,
-                    quantity=item.quantity,
-                    price_at_moment=price
+                    product_id=product_id,
+                    quantity=quantity,
+                    price_at_moment=price,
+                    product_name=product.name,
+                    product_bar_code=product.bar_code,
+                    product_category=product.category,
+                    product_image_path=image_paths.get(product_id)
                 )
             )
 
@@ -143,6 +316,7 @@ class OrderService:
         current_user: ClientModel
     ) -> OrderModel:
         order = db.query(self.order_model)\
+              .options(self.load_order_items)\
               .filter(self.order_model.id == order_id).first()
     
         if not order:
@@ -151,7 +325,7 @@ class OrderService:
                 detail=self.ORDER_NOT_FOUND
             )
         
-        if current_user.role != "ADMIN" and order.user_id != current_user.id:
+        if current_user.role != "ADMIN" and order.client_id != current_user.id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=self.FORBIDDEN_ORDER_ACCESS
@@ -167,7 +341,7 @@ class OrderService:
         order_data: OrderUpdate,
         current_user
     ) -> OrderModel:
-        order = self.get_order_by_id(db, order_id)
+        order = self.get_order_by_id(db, order_id, current_user)
 
         if current_user.role != "ADMIN":
             self._validate_user_modification(order, order_data)
@@ -220,7 +394,14 @@ class OrderService:
     
     @handle_db_exceptions
     def delete_order(self, db: Session, order_id: int, current_user) -> None:
-        order = self.get_order_by_id(db, order_id)
+        # Only the order row: its items are deleted, never read.
+        order = db.query(self.order_model).filter(self.order_model.id == order_id).first()
+
+        if not order:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=self.ORDER_NOT_FOUND
+            )
 
         if current_user.role != "ADMIN" and order.client_id != current_user.id:
             raise HTTPException(
@@ -228,11 +409,88 @@ class OrderService:
                 detail=self.NO_PERMISSION_TO_DELETE_ORDER
             )
 
-        if order.status != OrderStatusEnum.COMPLETED:
+        if order.status not in self.STOCK_SETTLED_STATUSES:
             self.product_service.restore_product_stock(db, order)
 
-        for item in order.order_items:
-            db.delete(item)
+        self._delete_orders(db, [order.id])
+        db.commit()
 
-        db.delete(order)
-        db.commit()
\ No newline at end of file
+    @handle_db_exceptions
+    def delete_order_batch(
+        self,
+        db: Session,
+        batch_size: int,
+        start_date: Optional[datetime.datetime] = None,
+        end_date: Optional[datetime.datetime] = None,
+        status: Optional[OrderStatusEnum] = None,
+        client_id: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Deletes up to ``batch_size`` matching orders in one transaction.
+
+        Locked orders are skipped, so a batch never waits on a request that
+        is working on one of them. Returns how many orders were deleted and
+        how many of those had their stock restored. A short or empty batch
+        does not mean nothing else matches: see has_orders_to_delete.
+        """
+        orders = self._bulk_delete_query(db, start_date, end_date, status, client_id)\
+            .with_entities(self.order_model.id, self.order_model.status)\
+            .limit(batch_size)\
+            .with_for_update(skip_locked=True)\
+            .all()
+        if not orders:
+            db.rollback()
+            return {"deleted": 0, "restocked": 0}
+
+        restocked = [order.id for order in orders if order.status not in self.STOCK_SETTLED_STATUSES]
+        self.product_service.restore_stock_for_orders(db, restocked)
+        self._delete_orders(db, [order.id for order in orders])
+        db.commit()
+        return {"deleted": len(orders), "restocked": len(restocked)}
+
+    @handle_db_exceptions
+    def has_orders_to_delete(
+        self,
+        db: Session,
+        start_date: Optional[datetime.datetime] = None,
+        end_date: Optional[datetime.datetime] = None,
+        status: Optional[OrderStatusEnum] = None,
+        client_id: Optional[int] = None
+    ) -> bool:
+        """Whether any order matches, including ones a batch skipped as locked."""
+        return self._bulk_delete_query(db, start_date, end_date, status, client_id)\
+            .with_entities(self.order_model.id)\
+            .first() is not None
+
+    def _bulk_delete_query(self, db: Session, start_date, end_date, status, client_id):
+        self._require_bulk_delete_filter(start_date, end_date, status, client_id)
+        return self._orders_query(
+            db, self.order_model, self.order_items_model,
+            start_date=start_date,
+            end_date=end_date,
+            category=None,
+            order_id=None,
+            status=status,
+            client_id=client_id,
+            position=None,
+            from_snapshot=False
+        )
+
+    def _require_bulk_delete_filter(self, *filters) -> None:
+        if not any(filter_value is not None for filter_value in filters):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=self.BULK_DELETE_FILTER_REQUIRED
+            )
+
+    def _delete_orders(self, db: Session, order_ids: List[int]) -> None:
+        # Two set-based statements, items first for the foreign key.
+        db.execute(
+            delete(self.order_items_model)
+                .where(self.order_items_model.order_id.in_(order_ids))
+                .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            delete(self.order_model)
+                .where(self.order_model.id.in_(order_ids))
+                .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,100 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordService:
+    POOL_SATURATED = "Password hashing capacity exhausted. Please retry shortly."
+    PROCESS_EXECUTOR = "process"
+    THREAD_EXECUTOR = "thread"
+
+    def __init__(
+        self,
+        executor_kind: str = os.getenv("PASSWORD_HASH_EXECUTOR", "process"),
+        max_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1))),
+        max_pending: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64")),
+        executor: Optional[Executor] = None
+    ):
+        self.executor_kind = executor_kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.executor = executor or self._build_executor()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def _build_executor(self) -> Executor:
+        if self.executor_kind == self.THREAD_EXECUTOR:
+            return ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash"
+            )
+        # "spawn" keeps workers from inheriting the server's threads and locks.
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    async def hash_password(self, password: str) -> str:
+        return await self._submit(_hash_password, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(_verify_password, plain_password, hashed_password)
+
+    async def _submit(self, func, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=self.POOL_SATURATED,
+                    headers={"Retry-After": "1"}
+                )
+            self._pending += 1
+
+        succeeded = False
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.executor, func, *args)
+            succeeded = True
+            return result
+        finally:
+            with self._lock:
+                self._pending -= 1
+                if succeeded:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "executor": self.executor_kind,
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "queued": max(0, self._pending - self.max_workers),
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
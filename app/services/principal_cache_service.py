@@ -0,0 +1,52 @@
+import os
+import time
+from typing import Optional
+from sqlalchemy import inspect
+from app.models.client_model import ClientModel
+from app.utils.ttl_cache import TTLCache
+
+
+class PrincipalCacheService:
+    def __init__(
+        self,
+        max_size: int = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "1024")),
+        ttl_seconds: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+    ):
+        self.cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    @property
+    def generation(self) -> int:
+        return self.cache.generation
+
+    def get(self, subject: str) -> Optional[ClientModel]:
+        return self.cache.get(subject)
+
+    def set(
+        self,
+        subject: str,
+        user: ClientModel,
+        token_exp: Optional[float] = None,
+        generation: Optional[int] = None
+    ) -> None:
+        ttl = token_exp - time.time() if token_exp is not None else None
+        self.cache.set(subject, self._snapshot(user), ttl, generation)
+
+    def invalidate(self, *subjects: Optional[str]) -> None:
+        for subject in subjects:
+            if subject:
+                self.cache.invalidate(subject)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+    def _snapshot(self, user: ClientModel) -> ClientModel:
+        # Cache a transient copy so the entry never depends on the
+        # session that loaded it (expiry on commit, detached lazy loads).
+        columns = inspect(ClientModel).column_attrs
+        return ClientModel(**{attr.key: getattr(user, attr.key) for attr in columns})
+
+
+principal_cache = PrincipalCacheService()
@@ -0,0 +1,184 @@
+import json
+import os
+import threading
+from typing import Any, Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models.product_model import ProductModel
+from app.schemas.product_schema import ProductResponse
+from app.utils.ttl_cache import TTLCache
+
+PENDING_INVALIDATIONS = "product_cache_pending"
+
+
+class InProcessProductCacheBackend:
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    @property
+    def generation(self) -> Optional[int]:
+        return self.cache.generation
+
+    def get(self, product_id: int) -> Optional[dict]:
+        return self.cache.get(product_id)
+
+    def set(self, product_id: int, data: dict, generation: Optional[int] = None) -> None:
+        self.cache.set(product_id, data, generation=generation)
+
+    def delete(self, product_id: int) -> None:
+        self.cache.invalidate(product_id)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+class RedisProductCacheBackend:
+    """Products stored in a Redis-compatible server shared by every worker.
+
+    An invalidation deletes the key for all workers at once. Redis has no
+    generation check, so a read racing a write can store the old row; the
+    TTL bounds how long that can last. Size and eviction are governed by
+    the server's maxmemory policy.
+    """
+
+    def __init__(self, url: str, ttl_seconds: float, key_prefix: str = "product:", client: Any = None):
+        if client is None:
+            try:
+                import redis
+            except ImportError as error:
+                raise RuntimeError(
+                    "PRODUCT_CACHE_BACKEND=redis requires the 'redis' package"
+                ) from error
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> Optional[int]:
+        return None
+
+    def _key(self, product_id: int) -> str:
+        return f"{self.key_prefix}{product_id}"
+
+    def get(self, product_id: int) -> Optional[dict]:
+        raw = self.client.get(self._key(product_id))
+        with self._lock:
+            if raw is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(raw)
+
+    def set(self, product_id: int, data: dict, generation: Optional[int] = None) -> None:
+        self.client.set(self._key(product_id), json.dumps(data), ex=max(1, int(self.ttl_seconds)))
+
+    def delete(self, product_id: int) -> None:
+        self.client.delete(self._key(product_id))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.key_prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def _size(self) -> int:
+        # Only this cache's keys; the server may hold others in the same DB.
+        return sum(1 for _ in self.client.scan_iter(match=f"{self.key_prefix}*"))
+
+    def stats(self) -> dict:
+        size = self._size()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": size,
+                "max_size": 0,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class ProductCacheService:
+    """Caches serialized products for the product detail endpoint.
+
+    Writes mark the product on the session and the entry is dropped once
+    the transaction commits, so no reader can cache the row in between.
+    Updates then write the fresh row through to the cache.
+    """
+
+    MEMORY_BACKEND = "memory"
+    REDIS_BACKEND = "redis"
+    # Stored next to the ProductResponse fields (which ignore it) so a
+    # cache hit can answer a conditional GET.
+    VERSION_KEY = "version"
+
+    def __init__(
+        self,
+        backend: Optional[Any] = None,
+        backend_kind: str = os.getenv("PRODUCT_CACHE_BACKEND", "memory"),
+        max_size: int = int(os.getenv("PRODUCT_CACHE_MAX_SIZE", "10000")),
+        ttl_seconds: float = float(os.getenv("PRODUCT_CACHE_TTL_SECONDS", "300")),
+        redis_url: str = os.getenv("PRODUCT_CACHE_REDIS_URL", "redis://localhost:6379/0")
+    ):
+        if backend is None:
+            if backend_kind == self.REDIS_BACKEND:
+                backend = RedisProductCacheBackend(redis_url, ttl_seconds)
+            else:
+                backend = InProcessProductCacheBackend(max_size, ttl_seconds)
+        self.backend = backend
+
+    @property
+    def generation(self) -> Optional[int]:
+        return self.backend.generation
+
+    def get(self, product_id: int) -> Optional[dict]:
+        return self.backend.get(product_id)
+
+    def set(self, product: ProductModel, generation: Optional[int] = None) -> dict:
+        data = self.serialize(product)
+        self.backend.set(product.id, data, generation)
+        return data
+
+    def invalidate(self, *product_ids: int) -> None:
+        for product_id in product_ids:
+            self.backend.delete(product_id)
+
+    def invalidate_on_commit(self, db: Session, *product_ids: int) -> None:
+        # Dropping the entry now also stops in-flight readers (through the
+        # generation check) from caching the row this transaction changes.
+        self.invalidate(*product_ids)
+        pending = db.info.setdefault(PENDING_INVALIDATIONS, {})
+        pending.setdefault(self, set()).update(product_ids)
+
+    def is_pending(self, db: Session, product_id: int) -> bool:
+        return product_id in db.info.get(PENDING_INVALIDATIONS, {}).get(self, ())
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        return self.backend.stats()
+
+    @staticmethod
+    def serialize(product: ProductModel) -> dict:
+        data = ProductResponse.model_validate(product, from_attributes=True).model_dump(mode="json")
+        data[ProductCacheService.VERSION_KEY] = product.version
+        return data
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_pending_products(session: Session) -> None:
+    # Also on rollback: a reader may have cached the row between the write
+    # and the rollback, and dropping an entry is always safe.
+    for cache, product_ids in session.info.pop(PENDING_INVALIDATIONS, {}).items():
+        cache.invalidate(*product_ids)
+
+
+product_cache = ProductCacheService()
@@ -0,0 +1,246 @@
+import csv
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.enums.import_format_enum import ImportFormatEnum
+from app.models.product_image_model import ProductImageModel
+from app.models.product_model import ProductModel
+from app.schemas.product_schema import ProductCreate
+
+Record = Tuple[int, bytes]
+
+
+class ProductImport:
+    """Progress of one import: the CSV header, the keys already seen and the report."""
+
+    def __init__(self, import_format: ImportFormatEnum, max_errors: int):
+        self.format = import_format
+        self.max_errors = max_errors
+        self.header: Optional[List[str]] = None
+        self.bar_codes: Dict[str, int] = {}
+        self.names: Dict[str, int] = {}
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+
+    def reject(self, line: int, bar_code: Optional[str], errors: List[str]) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "bar_code": bar_code, "errors": errors})
+
+    def report(self) -> dict:
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+class ProductImportService:
+    """Creates products in bulk from CSV or NDJSON rows.
+
+    Rows are validated with ``ProductCreate`` and inserted one chunk at a
+    time with a multi-row ``INSERT ... ON CONFLICT DO NOTHING RETURNING``,
+    so a chunk costs two statements and one commit however many rows it
+    has. Rows that hit an existing name or bar code come back missing from
+    RETURNING and are reported instead of failing the chunk.
+    """
+
+    UNSUPPORTED_FORMAT = "Unsupported import format. Send text/csv or application/x-ndjson."
+    INVALID_ENCODING = "Row is not valid UTF-8."
+    INVALID_JSON = "Row is not a JSON object."
+    INVALID_CSV = "Row is not valid CSV: {}"
+    COLUMN_COUNT = "Expected {} columns, got {}."
+    MISSING_IMAGES = "Product must have at least one image."
+    DUPLICATE_IN_IMPORT = "Duplicate {} (first seen on line {})."
+    ALREADY_REGISTERED = "Product with this name or bar code already registered."
+    IMAGE_SEPARATOR = "|"
+
+    CONTENT_TYPES = {
+        "text/csv": ImportFormatEnum.CSV,
+        "application/x-ndjson": ImportFormatEnum.NDJSON,
+        "application/ndjson": ImportFormatEnum.NDJSON,
+        "application/jsonl": ImportFormatEnum.NDJSON,
+    }
+
+    def __init__(
+        self,
+        product_model: ProductModel,
+        product_image_model: ProductImageModel,
+        chunk_size: int = int(os.getenv("PRODUCT_IMPORT_CHUNK_SIZE", "1000")),
+        max_errors: int = int(os.getenv("PRODUCT_IMPORT_MAX_ERRORS", "1000"))
+    ):
+        self.product_model = product_model
+        self.product_image_model = product_image_model
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+
+    def format_for(self, content_type: Optional[str]) -> ImportFormatEnum:
+        media_type = (content_type or "").split(";")[0].strip().lower()
+        if media_type not in self.CONTENT_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=self.UNSUPPORTED_FORMAT
+            )
+        return self.CONTENT_TYPES[media_type]
+
+    def start_import(self, import_format: ImportFormatEnum) -> ProductImport:
+        return ProductImport(import_format, self.max_errors)
+
+    def import_chunk(self, db: Session, product_import: ProductImport, records: List[Record]) -> None:
+        rows = []
+        for line, record in records:
+            product = self._parse(product_import, line, record)
+            if product is not None:
+                rows.append((line, product))
+
+        if rows:
+            self._insert(db, product_import, rows)
+
+    def _parse(self, product_import: ProductImport, line: int, record: bytes) -> Optional[ProductCreate]:
+        try:
+            text = record.decode("utf-8")
+        except UnicodeDecodeError:
+            product_import.reject(line, None, [self.INVALID_ENCODING])
+            return None
+
+        if product_import.format == ImportFormatEnum.CSV:
+            data = self._parse_csv(product_import, line, text)
+        else:
+            data = self._parse_ndjson(product_import, line, text)
+        if data is None:
+            return None
+
+        bar_code = data.get("bar_code") if isinstance(data.get("bar_code"), str) else None
+        try:
+            product = ProductCreate.model_validate(data)
+        except ValidationError as error:
+            product_import.reject(line, bar_code, [
+                f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+                for detail in error.errors()
+            ])
+            return None
+
+        errors = []
+        if not product.images or not all(image.image_path for image in product.images):
+            errors.append(self.MISSING_IMAGES)
+        for key, seen in (("bar_code", product_import.bar_codes), ("name", product_import.names)):
+            value = getattr(product, key)
+            if value in seen:
+                errors.append(self.DUPLICATE_IN_IMPORT.format(key, seen[value]))
+        if errors:
+            product_import.reject(line, product.bar_code, errors)
+            return None
+
+        product_import.bar_codes[product.bar_code] = line
+        product_import.names[product.name] = line
+        return product
+
+    def _parse_csv(self, product_import: ProductImport, line: int, text: str) -> Optional[dict]:
+        try:
+            values = next(csv.reader([text], strict=True))
+        except csv.Error as error:
+            product_import.reject(line, None, [self.INVALID_CSV.format(error)])
+            return None
+
+        if product_import.header is None:
+            product_import.header = [column.strip() for column in values]
+            return None
+
+        header = product_import.header
+        if len(values) != len(header):
+            product_import.reject(line, None, [self.COLUMN_COUNT.format(len(header), len(values))])
+            return None
+
+        # An empty cell means "not given", so optional columns may be blank.
+        data = {column: value for column, value in zip(header, values) if value != ""}
+        data["images"] = self._image_list(data.get("images", ""))
+        return data
+
+    def _parse_ndjson(self, product_import: ProductImport, line: int, text: str) -> Optional[dict]:
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            product_import.reject(line, None, [self.INVALID_JSON])
+            return None
+
+        images = data.get("images")
+        if isinstance(images, str):
+            data["images"] = self._image_list(images)
+        elif isinstance(images, list):
+            data["images"] = [
+                {"image_path": image} if isinstance(image, str) else image
+                for image in images
+            ]
+        return data
+
+    def _image_list(self, paths: str) -> List[dict]:
+        return [
+            {"image_path": path.strip()}
+            for path in paths.split(self.IMAGE_SEPARATOR)
+            if path.strip()
+        ]
+
+    def _insert(self, db: Session, product_import: ProductImport, rows: List[Tuple[int, ProductCreate]]) -> None:
+        refused = {}
+        try:
+            inserted = self._insert_rows(db, rows)
+            db.commit()
+        except SQLAlchemyError:
+            # A row the database refuses (e.g. a value too long for its
+            # column) fails the whole statement; retry one row at a time so
+            # only that row is rejected.
+            db.rollback()
+            inserted = set()
+            for line, product in rows:
+                try:
+                    inserted |= self._insert_rows(db, [(line, product)])
+                    db.commit()
+                except SQLAlchemyError as error:
+                    db.rollback()
+                    refused[line] = str(getattr(error, "orig", None) or error).strip()
+
+        for line, product in rows:
+            if product.bar_code in inserted:
+                product_import.imported += 1
+            elif line in refused:
+                product_import.reject(line, product.bar_code, [refused[line]])
+            else:
+                product_import.reject(line, product.bar_code, [self.ALREADY_REGISTERED])
+
+    def _insert_rows(self, db: Session, rows: List[Tuple[int, ProductCreate]]) -> set:
+        statement = self._insert_ignoring_conflicts(db).returning(
+            self.product_model.id, self.product_model.bar_code
+        )
+        created = db.execute(statement, [
+            product.model_dump(exclude={"images"}) for _, product in rows
+        ]).all()
+
+        product_ids = {bar_code: product_id for product_id, bar_code in created}
+        images = [
+            {"product_id": product_ids[product.bar_code], "image_path": image.image_path}
+            for _, product in rows
+            if product.bar_code in product_ids
+            for image in product.images
+        ]
+        if images:
+            db.execute(insert(self.product_image_model), images)
+        return set(product_ids)
+
+    def _insert_ignoring_conflicts(self, db: Session):
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(self.product_model).on_conflict_do_nothing()
+        if dialect == "sqlite":
+            return sqlite.insert(self.product_model).on_conflict_do_nothing()
+        return insert(self.product_model)
@@ -1,28 +1,46 @@
 import os
-import shutil
+from decimal import Decimal
 from fastapi import HTTPException, status
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import case, func, select, tuple_, update
+from sqlalchemy.orm import Session, selectinload
+from app.database.replica import is_replica_session
+from app.enums.product_sort_enum import ProductSortEnum
+from app.enums.stock_reservation_enum import StockReservationEnum
+from app.models.order_item_model import OrderItemModel
 from app.models.order_model import OrderModel
 from app.models.product_image_model import ProductImageModel
 from app.models.product_model import ProductModel
 from app.schemas.product_schema import ProductCreate, ProductUpdate
 from app.services.file_service import FileService
+from app.services.product_cache_service import ProductCacheService, product_cache
 from app.utils.db_exceptions import handle_db_exceptions
+from app.utils.pagination import CURSOR_WITH_SKIP, INVALID_CURSOR, decode_cursor
+from app.utils.search import text_search
 
 
 class ProductService:
     BAR_CODE_REGISTERED = "Bar code already registered."
     PRODUCT_NOT_FOUND = "Product not found."
     INSUFFICIENT_STOCK = "Insufficient stock. Available: {}"
+    INSUFFICIENT_STOCK_FOR_PRODUCT = "Insufficient stock for product {}. Available: {}"
+    STOCK_CHANGED = "Stock changed while the order was being placed. Please try again."
 
     def __init__(
         self,
         product_model: ProductModel,
-        product_image_model: ProductImageModel
+        product_image_model: ProductImageModel,
+        order_items_model: OrderItemModel = OrderItemModel,
+        product_cache: ProductCacheService = product_cache,
+        reservation_strategy: StockReservationEnum = StockReservationEnum(
+            os.getenv("STOCK_RESERVATION_STRATEGY", StockReservationEnum.LOCK.value)
+        )
     ):
         self.product_model = product_model
         self.product_image_model = product_image_model
+        self.order_items_model = order_items_model
+        self.product_cache = product_cache
+        self.reservation_strategy = reservation_strategy
 
     @handle_db_exceptions
     def list_products(
@@ -33,16 +51,37 @@ class ProductService:
         stock: Optional[bool] = None,
         category: Optional[str] = None,
         min_price: Optional[float] = None,
-        max_price: Optional[float] = None
+        max_price: Optional[float] = None,
+        cursor: Optional[str] = None,
+        sort_by: ProductSortEnum = ProductSortEnum.ID,
+        search: Optional[str] = None
     ) -> List[ProductModel]:
+        if cursor and skip:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=CURSOR_WITH_SKIP
+            )
+
         query = db.query(self.product_model)
         filters = []
+        sort_by = ProductSortEnum(sort_by)
+        sort_columns = [self.product_model.id]
+        if sort_by != ProductSortEnum.ID:
+            sort_columns.insert(0, getattr(self.product_model, sort_by.value))
 
         if stock is not None:
             filters.append(self.product_model.stock > 0 if stock else self.product_model.stock == 0)
 
         if category:
-            filters.append(self.product_model.category.ilike(f"%{category}%"))
+            filters.append(text_search(category, self.product_model.category))
+
+        if search:
+            filters.append(text_search(
+                search,
+                self.product_model.name,
+                self.product_model.description,
+                self.product_model.category
+            ))
 
         if min_price is not None:
             filters.append(self.product_model.sale_price >= min_price)
@@ -50,11 +89,37 @@ class ProductService:
         if max_price is not None:
             filters.append(self.product_model.sale_price <= max_price)
 
+        if cursor:
+            # Keyset pagination: seek past the last (sort key, id) of the
+            # previous page instead of scanning and discarding skip rows.
+            filters.append(tuple_(*sort_columns) > self._cursor_position(cursor, sort_by))
+
         if filters:
             query = query.filter(*filters)
 
+        query = query.order_by(*sort_columns)
+        query = query.options(selectinload(self.product_model.images))
+        if cursor:
+            return query.limit(limit).all()
         return query.offset(skip).limit(limit).all()
     
+    def _cursor_position(self, cursor: str, sort_by: ProductSortEnum) -> tuple:
+        last_value, last_id = decode_cursor(cursor, sort_by.value)
+        if sort_by == ProductSortEnum.ID:
+            return (last_id,)
+
+        try:
+            if sort_by == ProductSortEnum.SALE_PRICE:
+                last_value = Decimal(str(last_value))
+            elif not isinstance(last_value, str):
+                raise ValueError(last_value)
+        except (ArithmeticError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=INVALID_CURSOR
+            )
+        return (last_value, last_id)
+
     def _check_bar_code_unique(
         self,
         db: Session,
@@ -114,11 +179,13 @@ class ProductService:
         self._create_images(db, new_product.id, image_paths)
         db.commit()
 
+        self.product_cache.set(new_product)
         return new_product
     
     @handle_db_exceptions
     def get_product_by_id(self, db: Session, product_id: int) -> ProductModel:
         product = db.query(self.product_model)\
+                    .options(selectinload(self.product_model.images))\
                     .filter(self.product_model.id == product_id)\
                     .first()
         
@@ -130,6 +197,22 @@ class ProductService:
         
         return product
 
+    @handle_db_exceptions
+    def get_cached_product(self, db: Session, product_id: int) -> dict:
+        """Product detail as ProductResponse data, served from the cache."""
+        cached = self.product_cache.get(product_id)
+        if cached is not None:
+            return cached
+
+        generation = self.product_cache.generation
+        product = self.get_product_by_id(db, product_id)
+        # Not cached when changed by this session's open transaction (not
+        # committed yet), nor when read from a replica: a lagging replica
+        # could put back the row a write just invalidated.
+        if self.product_cache.is_pending(db, product_id) or is_replica_session(db):
+            return self.product_cache.serialize(product)
+        return self.product_cache.set(product, generation)
+
     @handle_db_exceptions
     def update_product(
         self,
@@ -138,8 +221,14 @@ class ProductService:
         product_data: ProductUpdate,
         new_image_paths: Optional[List[str]] = None,
         file_service: Optional[FileService] = None
-    ) -> ProductModel:
+    ) -> Tuple[ProductModel, List[str]]:
+        """Returns the product and the upload paths it no longer uses.
+
+        Nothing is removed from disk here: the caller deletes the stale paths
+        once the commit has gone through, outside the database call.
+        """
         product = self.get_product_by_id(db, product_id)
+        self.product_cache.invalidate_on_commit(db, product.id)
         updated_data = product_data.model_dump(exclude_unset=True)
 
         new_bar_code = updated_data.get("bar_code")
@@ -161,25 +250,27 @@ class ProductService:
             ) if file_service else None
         )
 
+        stale_paths = []
         if old_folder and new_folder and old_folder != new_folder:
-            if old_folder.exists():
-                shutil.rmtree(old_folder)
-            new_folder.mkdir(parents=True, exist_ok=True)
+            stale_paths.append(str(old_folder))
 
         if new_image_paths is not None:
-            self._update_product_images(db, product.id, new_image_paths, file_service)
+            stale_paths.extend(self._update_product_images(db, product.id, new_image_paths))
 
+        # Image changes do not touch the product row, so bump its version
+        # explicitly to change the ETag.
+        product.version = self.product_model.version + 1
         db.commit()
         db.refresh(product)
-        return product
+        self.product_cache.set(product)
+        return product, stale_paths
 
     def _update_product_images(
         self,
         db: Session,
         product_id: int,
-        new_image_paths: List[str],
-        file_service: Optional[FileService] = None
-    ) -> None:
+        new_image_paths: List[str]
+    ) -> List[str]:
         old_images = db.query(self.product_image_model).filter(
             self.product_image_model.product_id == product_id
         ).all()
@@ -190,25 +281,25 @@ class ProductService:
             db.delete(img)
         db.commit()
 
-        if file_service:
-            file_service.delete_files(old_image_paths)
-
         self._create_images(db, product_id, new_image_paths)
+        return old_image_paths
 
 
     @handle_db_exceptions
-    def delete_product(self, db: Session, product_id: int):
+    def delete_product(self, db: Session, product_id: int) -> List[str]:
+        """Deletes the product and returns its image folders for the caller to remove."""
         product = self.get_product_by_id(db, product_id)
 
+        image_folders = []
         for image in product.images:
-            full_image_path = os.path.join(os.getcwd(), image.image_path)
-            folder_path = os.path.dirname(full_image_path)
-
-            if os.path.exists(folder_path):
-                shutil.rmtree(folder_path)
+            folder_path = os.path.dirname(os.path.join(os.getcwd(), image.image_path))
+            if folder_path not in image_folders:
+                image_folders.append(folder_path)
 
+        self.product_cache.invalidate_on_commit(db, product.id)
         db.delete(product)
         db.commit()
+        return image_folders
 
     @handle_db_exceptions
     def validate_and_decrease_stock(
@@ -235,15 +326,155 @@ class ProductService:
 
         product.stock -= quantity
         db.add(product)
+        self.product_cache.invalidate_on_commit(db, product.id)
         return product
     
+    @handle_db_exceptions
+    def reserve_stock(self, db: Session, quantities: Dict[int, int]) -> Dict[int, ProductModel]:
+        """Decrements stock for a whole order, returning the products by id.
+
+        The returned objects carry at least ``sale_price`` and ``stock``.
+        The strategy is chosen by STOCK_RESERVATION_STRATEGY.
+        """
+        if self.reservation_strategy == StockReservationEnum.CONDITIONAL:
+            products = self._reserve_with_conditional_update(db, quantities)
+        else:
+            products = self._reserve_with_row_locks(db, quantities)
+
+        self.product_cache.invalidate_on_commit(db, *quantities)
+        return products
+
+    def _reserve_with_row_locks(self, db: Session, quantities: Dict[int, int]) -> Dict[int, ProductModel]:
+        # Every row is locked by one SELECT ... FOR UPDATE in id order, so
+        # two orders sharing products always lock them in the same order and
+        # cannot deadlock. Stock is checked in memory, then one UPDATE.
+        product_ids = sorted(quantities)
+        products = db.query(self.product_model)\
+                     .filter(self.product_model.id.in_(product_ids))\
+                     .order_by(self.product_model.id)\
+                     .with_for_update().all()
+        products_by_id = {product.id: product for product in products}
+
+        for product_id in product_ids:
+            product = products_by_id.get(product_id)
+            if product is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=self.PRODUCT_NOT_FOUND
+                )
+            if product.stock < quantities[product_id]:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=self.INSUFFICIENT_STOCK_FOR_PRODUCT.format(product_id, product.stock)
+                )
+
+        # The stock condition repeats the check for databases without row
+        # locks (SQLite), where another writer may have got in first.
+        result = db.execute(self._decrement_stock(quantities))
+        if result.rowcount != len(product_ids):
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=self.STOCK_CHANGED
+            )
+        return products_by_id
+
+    def _reserve_with_conditional_update(self, db: Session, quantities: Dict[int, int]) -> Dict[int, ProductModel]:
+        # No lock is taken up front: the UPDATE itself only matches rows that
+        # still have enough stock, so concurrent orders for a hot product
+        # queue only for the duration of the row update, not the request.
+        rows = db.execute(
+            self._decrement_stock(quantities).returning(
+                self.product_model.id,
+                self.product_model.sale_price,
+                self.product_model.stock,
+                self.product_model.name,
+                self.product_model.bar_code,
+                self.product_model.category
+            )
+        ).all()
+        reserved = {row.id: row for row in rows}
+        if len(reserved) == len(quantities):
+            return reserved
+
+        # Undo the lines that did match, then explain the first that did not.
+        db.rollback()
+        missing = sorted(set(quantities) - set(reserved))
+        available = dict(
+            db.query(self.product_model.id, self.product_model.stock)
+              .filter(self.product_model.id.in_(missing))
+              .all()
+        )
+        product_id = missing[0]
+        if product_id not in available:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=self.PRODUCT_NOT_FOUND
+            )
+        if available[product_id] >= quantities[product_id]:
+            # Stock was restored between the UPDATE and this SELECT.
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=self.STOCK_CHANGED
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=self.INSUFFICIENT_STOCK_FOR_PRODUCT.format(product_id, available[product_id])
+        )
+
+    def primary_image_paths(self, db: Session, product_ids: List[int]) -> Dict[int, str]:
+        """Path of the first image of each product, in one query."""
+        first_images = select(func.min(self.product_image_model.id))\
+            .where(self.product_image_model.product_id.in_(product_ids))\
+            .group_by(self.product_image_model.product_id)
+        return dict(
+            db.query(self.product_image_model.product_id, self.product_image_model.image_path)
+              .filter(self.product_image_model.id.in_(first_images))
+              .all()
+        )
+
+    def _decrement_stock(self, quantities: Dict[int, int]):
+        decrement = case(quantities, value=self.product_model.id)
+        return update(self.product_model)\
+            .where(
+                self.product_model.id.in_(sorted(quantities)),
+                self.product_model.stock >= decrement
+            )\
+            .values(stock=self.product_model.stock - decrement)\
+            .execution_options(synchronize_session=False)
+
     @handle_db_exceptions
     def restore_product_stock(self, db: Session, order: OrderModel):
-        for item in order.order_items:
-            product = db.query(self.product_model)\
-                        .filter(self.product_model.id == item.product_id)\
-                        .first()
-            
-            if product:
-                product.stock += item.quantity
-                db.add(product)
\ No newline at end of file
+        self.restore_stock_for_orders(db, [order.id])
+
+    @handle_db_exceptions
+    def restore_stock_for_orders(self, db: Session, order_ids: List[int]) -> List[int]:
+        """Returns the items of the given orders to stock, in one statement.
+
+        The quantities are summed per product straight from the order items
+        (UPDATE ... FROM (SELECT ... GROUP BY product_id)), so neither the
+        items nor the products are loaded. Returns the restocked product ids.
+        Callers decide which orders qualify (e.g. not already cancelled).
+        """
+        if not order_ids:
+            return []
+
+        restock = select(
+            self.order_items_model.product_id,
+            func.sum(self.order_items_model.quantity).label("quantity")
+        ).where(
+            self.order_items_model.order_id.in_(order_ids)
+        ).group_by(
+            self.order_items_model.product_id
+        ).subquery("restock")
+
+        product_ids = db.execute(
+            update(self.product_model)
+                .where(self.product_model.id == restock.c.product_id)
+                .values(stock=self.product_model.stock + restock.c.quantity)
+                .returning(self.product_model.id)
+                .execution_options(synchronize_session=False)
+        ).scalars().all()
+
+        self.product_cache.invalidate_on_commit(db, *product_ids)
+        return product_ids
@@ -0,0 +1,47 @@
+import os
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.client_model import ClientModel
+from app.utils.ttl_cache import TTLCache
+
+
+class TokenVersionService:
+    """Per-user token versions used to revoke stateless access tokens.
+
+    A token is accepted only while the version it carries matches the
+    ``token_version`` column of its user, so a revocation holds for every
+    worker and survives restarts. Versions are cached per process for
+    ``ttl_seconds``: a bump made by this worker is seen at once, one made
+    by another worker within the TTL. A deleted user has no version, so
+    their tokens are always rejected.
+    """
+
+    def __init__(
+        self,
+        max_size: int = int(os.getenv("TOKEN_VERSION_CACHE_MAX_SIZE", "10000")),
+        ttl_seconds: float = float(os.getenv("TOKEN_VERSION_CACHE_TTL_SECONDS", "5"))
+    ):
+        self.cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    def get_cached(self, user_id: int) -> Optional[int]:
+        return self.cache.get(user_id)
+
+    def load(self, db: Session, user_id: int) -> Optional[int]:
+        generation = self.cache.generation
+        version = db.scalar(select(ClientModel.token_version).where(ClientModel.id == user_id))
+        if version is not None:
+            self.cache.set(user_id, version, generation=generation)
+        return version
+
+    def bump(self, user: ClientModel) -> None:
+        # Incremented in SQL when the caller's transaction flushes, so
+        # concurrent bumps from different workers all count.
+        user.token_version = ClientModel.token_version + 1
+
+    def invalidate(self, user_id: int) -> None:
+        # Called once the bump or the deletion is committed.
+        self.cache.invalidate(user_id)
+
+
+token_versions = TokenVersionService()
@@ -1,10 +1,13 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from typing import Optional
-from passlib.context import CryptContext
 from app.models.client_model import ClientModel
 from app.schemas.user_schema import UserBase, UserCreate, UserUpdate
+from app.services.password_service import pwd_context
+from app.services.principal_cache_service import PrincipalCacheService, principal_cache
+from app.services.token_version_service import TokenVersionService, token_versions
 from app.utils.db_exceptions import handle_db_exceptions
+from app.utils.search import text_search
 
 class UserService:
     ACCESS_DENIED = "Access denied."
@@ -15,10 +18,18 @@ class UserService:
     EMAIL_ALREADY_REGISTERED = "Email already registered."
     CPF_ALREADY_REGISTERED = "CPF already registered."
     CANNOT_DELETE_OWN_USER = "You cannot delete your own user."
+    TOKEN_BOUND_FIELDS = ("email", "password", "role")
 
-    def __init__(self, client_model: ClientModel):
+    def __init__(
+        self,
+        client_model: ClientModel,
+        principal_cache: PrincipalCacheService = principal_cache,
+        token_version_service: TokenVersionService = token_versions
+    ):
         self.client_model = client_model
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.principal_cache = principal_cache
+        self.token_version_service = token_version_service
+        self.pwd_context = pwd_context
 
     @handle_db_exceptions
     def list_users(
@@ -27,14 +38,17 @@ class UserService:
         skip: int = 0,
         limit: int = 10,
         name: Optional[str] = None,
-        email: Optional[str] = None
+        email: Optional[str] = None,
+        search: Optional[str] = None
     ) -> list[UserBase]:
         query = db.query(self.client_model)
 
         if name:
-            query = query.filter(self.client_model.name.ilike(f"%{name}%"))
+            query = query.filter(text_search(name, self.client_model.name))
         if email:
-            query = query.filter(self.client_model.email.ilike(f"%{email}%"))
+            query = query.filter(text_search(email, self.client_model.email))
+        if search:
+            query = query.filter(text_search(search, self.client_model.name, self.client_model.email))
 
         return query.offset(skip).limit(limit).all()
 
@@ -76,11 +90,16 @@ class UserService:
                  .first()
         
     @handle_db_exceptions
-    def create_user(self, db: Session, user_data: UserCreate) -> ClientModel:
-        self.check_unique_email(db, user_data.email)
-        self.check_unique_cpf(db, user_data.cpf)
+    def create_user(
+        self,
+        db: Session,
+        user_data: UserCreate,
+        hashed_password: Optional[str] = None
+    ) -> ClientModel:
+        self.validate_new_user(db, user_data)
 
-        hashed_password = self.hash_password(user_data.password)
+        if hashed_password is None:
+            hashed_password = self.hash_password(user_data.password)
 
         new_user = self.client_model(
             name=user_data.name,
@@ -96,13 +115,20 @@ class UserService:
         return new_user
 
     @handle_db_exceptions
-    def update_user(
+    def validate_new_user(self, db: Session, user_data: UserCreate) -> None:
+        """The checks of create_user, run before the password is hashed."""
+        self.check_unique_email(db, user_data.email)
+        self.check_unique_cpf(db, user_data.cpf)
+
+    @handle_db_exceptions
+    def validate_user_update(
         self,
         db: Session,
         user_id: int,
         user_data: UserUpdate,
         current_user: ClientModel
     ) -> ClientModel:
+        """The checks of update_user, run before the password is hashed."""
         if current_user.id != user_id and current_user.role != 'admin':
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -122,14 +148,35 @@ class UserService:
             self.check_unique_email(db, update_fields["email"], exclude_user_id=user_id)
         if "cpf" in update_fields:
             self.check_unique_cpf(db, update_fields["cpf"], exclude_user_id=user_id)
+        return user
+
+    @handle_db_exceptions
+    def update_user(
+        self,
+        db: Session,
+        user_id: int,
+        user_data: UserUpdate,
+        current_user: ClientModel,
+        hashed_password: Optional[str] = None
+    ) -> ClientModel:
+        user = self.validate_user_update(db, user_id, user_data, current_user)
+        previous_email = user.email
+        update_fields = user_data.model_dump(exclude_unset=True)
 
         for field, value in update_fields.items():
             if field == "password" and value is not None:
-                user.password = self.hash_password(value)
+                user.password = hashed_password or self.hash_password(value)
             elif hasattr(user, field):
                 setattr(user, field, value)
 
+        revoke_tokens = any(field in update_fields for field in self.TOKEN_BOUND_FIELDS)
+        if revoke_tokens:
+            self.token_version_service.bump(user)
+
         db.commit()
+        self.principal_cache.invalidate(previous_email, update_fields.get("email"))
+        if revoke_tokens:
+            self.token_version_service.invalidate(user_id)
         db.refresh(user)
         return user
 
@@ -143,8 +190,11 @@ class UserService:
         
         user = self.get_user_by_id(db, user_id, current_user)
         
+        email = user.email
         db.delete(user)
         db.commit()
+        self.principal_cache.invalidate(email)
+        self.token_version_service.invalidate(user_id)
 
 
     @handle_db_exceptions
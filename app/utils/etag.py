@@ -0,0 +1,42 @@
+import hashlib
+import os
+from typing import Any, Iterable, NamedTuple, Optional
+from fastapi import Response, status
+
+ETAG_HEADER = "ETag"
+CACHE_CONTROL_HEADER = "Cache-Control"
+# Responses depend on the caller's token, so only the client may store
+# them, and it must revalidate (cheaply, with If-None-Match) before reuse.
+CACHE_CONTROL = os.getenv("HTTP_CACHE_CONTROL", "private, no-cache")
+
+
+class Tagged(NamedTuple):
+    """A response body and its ETag. ``body`` is None when the client's copy is current."""
+    etag: str
+    body: Any
+
+
+def entity_tag(versions: Iterable[tuple]) -> str:
+    """Strong ETag over the (kind, id, version) tuples of every row in a response."""
+    digest = hashlib.sha256(repr(tuple(versions)).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/"x" matches "x".
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_response(response: Response, tagged: Tagged):
+    headers = {ETAG_HEADER: tagged.etag, CACHE_CONTROL_HEADER: CACHE_CONTROL}
+    if tagged.body is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return tagged.body
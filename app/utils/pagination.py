@@ -0,0 +1,40 @@
+import base64
+import binascii
+import json
+from typing import Any, Optional, Sequence, Tuple
+from fastapi import HTTPException, status
+
+INVALID_CURSOR = "Invalid pagination cursor."
+CURSOR_WITH_SKIP = "Use either skip or cursor, not both."
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_by: str, value: Any, row_id: int) -> str:
+    payload = json.dumps({"s": sort_by, "v": value, "id": row_id}, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str) -> Tuple[Any, int]:
+    """Returns the (sort value, id) of the last row of the previous page.
+
+    A cursor is only valid for the sort order it was issued for.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != sort_by or not isinstance(payload["id"], int):
+            raise ValueError(cursor)
+        return payload["v"], payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=INVALID_CURSOR
+        )
+
+
+def next_cursor(items: Sequence[Any], limit: int, sort_by: str) -> Optional[str]:
+    # A short page is the last one.
+    if limit <= 0 or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(sort_by, getattr(last, sort_by), last.id)
@@ -0,0 +1,30 @@
+from sqlalchemy import Index, or_
+from sqlalchemy.sql import ColumnElement
+
+LIKE_ESCAPE = "\\"
+
+
+def contains_pattern(term: str) -> str:
+    # User input must not be able to inject its own LIKE wildcards.
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def text_search(term: str, *columns) -> ColumnElement:
+    """Case-insensitive substring match of ``term`` on any of ``columns``.
+
+    On PostgreSQL the pg_trgm GIN indexes on these columns serve the ILIKE
+    (for terms of three or more characters); SQLite falls back to a scan.
+    """
+    pattern = contains_pattern(term.strip())
+    return or_(*(column.ilike(pattern, escape=LIKE_ESCAPE) for column in columns))
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """GIN trigram index, only emitted on PostgreSQL."""
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql")
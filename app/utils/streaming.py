@@ -0,0 +1,66 @@
+from typing import AsyncIterator, List, Tuple
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class RecordSplitter:
+    """Splits a byte stream into newline-terminated records.
+
+    Records are kept as bytes so a bad encoding only fails its own row.
+    With ``quoted=True`` (CSV) a newline inside double quotes does not end
+    the record: a record is complete once it holds an even number of quotes.
+    """
+
+    def __init__(self, quoted: bool = False):
+        self.quoted = quoted
+        self.line_number = 0
+        self._buffer = b""
+        self._record: List[bytes] = []
+        self._record_line = 0
+        self._quotes = 0
+
+    def feed(self, chunk: bytes) -> List[Tuple[int, bytes]]:
+        if self.line_number == 0 and not self._buffer:
+            chunk = chunk.removeprefix(UTF8_BOM)
+        *lines, self._buffer = (self._buffer + chunk).split(b"\n")
+        return self._split(lines)
+
+    def close(self) -> List[Tuple[int, bytes]]:
+        lines = [self._buffer] if self._buffer else []
+        self._buffer = b""
+        records = self._split(lines)
+        if self._record:
+            # Unbalanced quotes: hand the rest over as one record so the
+            # parser reports it instead of silently dropping it.
+            records.append((self._record_line, b"\n".join(self._record)))
+            self._record = []
+        return records
+
+    def _split(self, lines: List[bytes]) -> List[Tuple[int, bytes]]:
+        records = []
+        for line in lines:
+            self.line_number += 1
+            line = line.removesuffix(b"\r")
+            if not self._record:
+                if not line.strip():
+                    continue
+                self._record_line = self.line_number
+            self._record.append(line)
+            if self.quoted:
+                self._quotes += line.count(b'"')
+                if self._quotes % 2:
+                    continue
+            records.append((self._record_line, b"\n".join(self._record)))
+            self._record = []
+            self._quotes = 0
+        return records
+
+
+async def iter_records(chunks: AsyncIterator[bytes], quoted: bool = False) -> AsyncIterator[Tuple[int, bytes]]:
+    """Yields (line number, record) pairs while the body is still arriving."""
+    splitter = RecordSplitter(quoted)
+    async for chunk in chunks:
+        for record in splitter.feed(chunk):
+            yield record
+    for record in splitter.close():
+        yield record
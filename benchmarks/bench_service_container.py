@@ -0,0 +1,58 @@
+"""Per-request cost of building services vs. reading them from the container.
+
+Run from the project root:
+
+    python -m benchmarks.bench_service_container
+"""
+import os
+import timeit
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.container import ServiceContainer
+from app.models.client_model import ClientModel
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_image_model import ProductImageModel
+from app.models.product_model import ProductModel
+from app.services.auth_service import AuthService
+from app.services.jwt_service import JWTService
+from app.services.order_service import OrderService
+from app.services.product_service import ProductService
+from app.services.user_service import UserService
+
+ITERATIONS = 2000
+
+
+def build_per_request():
+    # What the get_*_service dependencies did before the container existed.
+    user_service = UserService(ClientModel)
+    AuthService(user_service=user_service, jwt_service=JWTService())
+    OrderService(
+        OrderModel,
+        OrderItemModel,
+        ProductService(ProductModel, None),
+        UserService(ClientModel)
+    )
+    ProductService(ProductModel, ProductImageModel)
+
+
+def main():
+    container = ServiceContainer()
+
+    def read_from_container():
+        container.auth_service
+        container.order_service
+        container.product_service
+        container.user_service
+
+    per_request = timeit.timeit(build_per_request, number=ITERATIONS) / ITERATIONS
+    shared = timeit.timeit(read_from_container, number=ITERATIONS) / ITERATIONS
+
+    print(f"build per request : {per_request * 1e6:10.2f} us/request")
+    print(f"shared container  : {shared * 1e6:10.2f} us/request")
+    print(f"saved             : {(per_request - shared) * 1e6:10.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
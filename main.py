@@ -1,6 +1,36 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
-from app.routes import auth_routes, order_routes, product_routes, user_routes
-from app.database.database import Base, engine
+from app.container import ServiceContainer
+from app.database.async_database import dispose_async_engine
+from app.database.partitions import ORDER_PARTITIONING, ensure_future_partitions
+from app.middleware.query_timing import QueryTimingMiddleware
+from app.routes import auth_routes, metrics_routes, order_routes, product_routes, user_routes
+from app.database.database import Base, SessionLocal, engine
+
+ORDER_ARCHIVE_INTERVAL_SECONDS = float(os.getenv("ORDER_ARCHIVE_INTERVAL_SECONDS", "0"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.services = ServiceContainer()
+    if ORDER_PARTITIONING:
+        with engine.begin() as connection:
+            ensure_future_partitions(connection)
+    archival = None
+    if ORDER_ARCHIVE_INTERVAL_SECONDS > 0:
+        archival = asyncio.create_task(
+            app.state.services.order_archive_service.run_periodically(
+                SessionLocal, ORDER_ARCHIVE_INTERVAL_SECONDS
+            )
+        )
+    yield
+    if archival is not None:
+        archival.cancel()
+        with suppress(asyncio.CancelledError):
+            await archival
+    app.state.services.shutdown()
+    await dispose_async_engine()
 
 app = FastAPI(
     title="FastAPI - Lu Estilo",
@@ -9,12 +39,16 @@ app = FastAPI(
     order processing, and user administration. Designed to streamline
     sales operations and improve management efficiency.
     """,
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 Base.metadata.create_all(bind=engine)
 
+app.add_middleware(QueryTimingMiddleware)
+
 app.include_router(user_routes.router)
 app.include_router(auth_routes.router)
 app.include_router(product_routes.router)
-app.include_router(order_routes.router)
\ No newline at end of file
+app.include_router(order_routes.router)
+app.include_router(metrics_routes.router)
\ No newline at end of file
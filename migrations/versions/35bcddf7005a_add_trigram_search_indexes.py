@@ -0,0 +1,52 @@
+"""add trigram search indexes
+
+Revision ID: 35bcddf7005a
+Revises: c6e1b4f7a923
+Create Date: 2026-10-16 21:05:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '35bcddf7005a'
+down_revision: Union[str, None] = 'c6e1b4f7a923'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ('ix_tb_products_name_trgm', 'tb_products', 'name'),
+    ('ix_tb_products_description_trgm', 'tb_products', 'description'),
+    ('ix_tb_products_category_trgm', 'tb_products', 'category'),
+    ('ix_tb_clients_name_trgm', 'tb_clients', 'name'),
+    ('ix_tb_clients_email_trgm', 'tb_clients', 'email'),
+)
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes let ILIKE '%term%' searches use an index on
+    # PostgreSQL. Other databases keep scanning, so there is nothing to do.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column_name: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for index_name, table_name, _ in TRIGRAM_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,53 @@
+"""add product snapshot to order items
+
+Revision ID: a5d3e9f08b61
+Revises: f4c9d27a5e18
+Create Date: 2026-10-17 19:25:44.071362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5d3e9f08b61'
+down_revision: Union[str, None] = 'f4c9d27a5e18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SNAPSHOT_COLUMNS = (
+    ('product_name', sa.String(length=120)),
+    ('product_bar_code', sa.String(length=80)),
+    ('product_category', sa.String(length=50)),
+    ('product_image_path', sa.String(length=255)),
+)
+
+
+def upgrade() -> None:
+    for table_name in ('tb_order_items', 'tb_order_items_archive'):
+        for column_name, column_type in SNAPSHOT_COLUMNS:
+            op.add_column(table_name, sa.Column(column_name, column_type, nullable=True))
+
+    # Existing items get the product as it is now; later ones are captured
+    # when the order is placed.
+    for table_name in ('tb_order_items', 'tb_order_items_archive'):
+        op.execute(
+            f'UPDATE {table_name} SET '
+            'product_name = tb_products.name, '
+            'product_bar_code = tb_products.bar_code, '
+            'product_category = tb_products.category, '
+            'product_image_path = ('
+            '    SELECT image_path FROM tb_product_images '
+            '    WHERE tb_product_images.product_id = tb_products.id '
+            '    ORDER BY tb_product_images.id LIMIT 1'
+            ') '
+            f'FROM tb_products WHERE tb_products.id = {table_name}.product_id'
+        )
+
+
+def downgrade() -> None:
+    for table_name in ('tb_order_items_archive', 'tb_order_items'):
+        for column_name, _ in reversed(SNAPSHOT_COLUMNS):
+            op.drop_column(table_name, column_name)
@@ -0,0 +1,28 @@
+"""add row version to products and orders
+
+Revision ID: b71e0c4d9a26
+Revises: 35bcddf7005a
+Create Date: 2026-10-16 23:12:40.915230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e0c4d9a26'
+down_revision: Union[str, None] = '35bcddf7005a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tb_products', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('tb_orders', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('tb_orders', 'version')
+    op.drop_column('tb_products', 'version')
@@ -0,0 +1,57 @@
+"""add order access pattern indexes
+
+Revision ID: c3f5a8e21d07
+Revises: b71e0c4d9a26
+Create Date: 2026-10-17 09:41:27.530118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f5a8e21d07'
+down_revision: Union[str, None] = 'b71e0c4d9a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ORDER_INDEXES = (
+    ('ix_tb_orders_client_id_created_at', 'tb_orders', ['client_id', 'created_at', 'id']),
+    ('ix_tb_orders_status_created_at', 'tb_orders', ['status', 'created_at', 'id']),
+    ('ix_tb_orders_created_at', 'tb_orders', ['created_at', 'id']),
+    ('ix_tb_order_items_order_id', 'tb_order_items', ['order_id']),
+    ('ix_tb_order_items_product_id', 'tb_order_items', ['product_id']),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        for index_name, table_name, columns in ORDER_INDEXES:
+            op.create_index(index_name, table_name, columns, unique=False)
+        return
+
+    # CONCURRENTLY builds without blocking writes to the tables, but cannot
+    # run inside a transaction. If a build fails it leaves an INVALID index
+    # behind; drop it and run the upgrade again.
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns in ORDER_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=False,
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        for index_name, table_name, _ in reversed(ORDER_INDEXES):
+            op.drop_index(index_name, table_name=table_name)
+        return
+
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in reversed(ORDER_INDEXES):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
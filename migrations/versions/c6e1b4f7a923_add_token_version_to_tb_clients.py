@@ -0,0 +1,26 @@
+"""add token version to tb_clients
+
+Revision ID: c6e1b4f7a923
+Revises: e7267dd2023e
+Create Date: 2026-10-16 20:31:52.417690
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e1b4f7a923'
+down_revision: Union[str, None] = 'e7267dd2023e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tb_clients', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('tb_clients', 'token_version')
@@ -0,0 +1,120 @@
+"""partition orders by month
+
+Revision ID: d8a2f61c4b95
+Revises: c3f5a8e21d07
+Create Date: 2026-10-17 14:02:51.208734
+
+"""
+import datetime
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.partitions import (
+    PARTITION_MONTHS_AHEAD,
+    PARTITIONED_TABLES,
+    add_months,
+    create_month_partitions,
+    is_partitioned,
+    month_start
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a2f61c4b95'
+down_revision: Union[str, None] = 'c3f5a8e21d07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitioning is opt-in: run the upgrade with ORDER_PARTITIONING=true.
+ORDER_PARTITIONING = os.getenv('ORDER_PARTITIONING', 'false').lower() == 'true'
+
+SECONDARY_INDEXES = (
+    ('ix_tb_orders_id', 'tb_orders', ['id']),
+    ('ix_tb_orders_client_id_created_at', 'tb_orders', ['client_id', 'created_at', 'id']),
+    ('ix_tb_orders_status_created_at', 'tb_orders', ['status', 'created_at', 'id']),
+    ('ix_tb_orders_created_at', 'tb_orders', ['created_at', 'id']),
+    ('ix_tb_order_items_id', 'tb_order_items', ['id']),
+    ('ix_tb_order_items_order_id', 'tb_order_items', ['order_id']),
+    ('ix_tb_order_items_product_id', 'tb_order_items', ['product_id']),
+)
+
+
+def upgrade() -> None:
+    # Items carry their order's created_at so they can be partitioned (and
+    # looked up) by the same month as the order.
+    op.add_column(
+        'tb_order_items',
+        sa.Column('order_created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False)
+    )
+    op.execute('UPDATE tb_orders SET created_at = now() WHERE created_at IS NULL')
+    op.alter_column('tb_orders', 'created_at', nullable=False)
+    op.execute(
+        'UPDATE tb_order_items SET order_created_at = tb_orders.created_at '
+        'FROM tb_orders WHERE tb_orders.id = tb_order_items.order_id'
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or not ORDER_PARTITIONING:
+        return
+
+    # A table cannot be turned into a partitioned one in place: build the
+    # partitioned tables beside the old ones, copy the rows and swap. This
+    # locks and rewrites both tables, so run it in a maintenance window.
+    oldest, newest = bind.execute(sa.text('SELECT min(created_at), max(created_at) FROM tb_orders')).one()
+    today = datetime.datetime.now(datetime.timezone.utc)
+    _rebuild_tables(
+        partitioned=True,
+        first_month=min(oldest or today, today),
+        last_month=add_months(month_start(max(newest or today, today)), PARTITION_MONTHS_AHEAD)
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql' and is_partitioned(bind):
+        _rebuild_tables(partitioned=False)
+
+    op.alter_column('tb_orders', 'created_at', nullable=True)
+    op.drop_column('tb_order_items', 'order_created_at')
+
+
+def _rebuild_tables(partitioned: bool, first_month=None, last_month=None) -> None:
+    for table, key in PARTITIONED_TABLES:
+        op.execute(f'ALTER TABLE {table} RENAME TO {table}_old')
+        op.execute(
+            f'CREATE TABLE {table} (LIKE {table}_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+            + (f' PARTITION BY RANGE ({key})' if partitioned else '')
+        )
+        # The id sequence belongs to the old table and would be dropped
+        # with it.
+        op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+
+    if partitioned:
+        create_month_partitions(op.get_bind(), first_month, last_month)
+
+    for table, _ in PARTITIONED_TABLES:
+        op.execute(f'INSERT INTO {table} SELECT * FROM {table}_old')
+    for table, _ in reversed(PARTITIONED_TABLES):
+        op.execute(f'DROP TABLE {table}_old')
+
+    # A primary key or unique constraint on a partitioned table has to
+    # include the partition key, so the items reference (id, created_at).
+    for table, key in PARTITIONED_TABLES:
+        op.create_primary_key(f'{table}_pkey', table, ['id', key] if partitioned else ['id'])
+    for index_name, table_name, columns in SECONDARY_INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False)
+
+    op.create_foreign_key('tb_orders_client_id_fkey', 'tb_orders', 'tb_clients', ['client_id'], ['id'])
+    op.create_foreign_key(
+        'tb_order_items_product_id_fkey', 'tb_order_items', 'tb_products', ['product_id'], ['id']
+    )
+    op.create_foreign_key(
+        'tb_order_items_order_id_fkey',
+        'tb_order_items',
+        'tb_orders',
+        ['order_id', 'order_created_at'] if partitioned else ['order_id'],
+        ['id', 'created_at'] if partitioned else ['id']
+    )
@@ -0,0 +1,60 @@
+"""add order archive tables
+
+Revision ID: f4c9d27a5e18
+Revises: d8a2f61c4b95
+Create Date: 2026-10-17 16:47:03.615902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c9d27a5e18'
+down_revision: Union[str, None] = 'd8a2f61c4b95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tb_orders_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('client_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'PROCESSING', 'COMPLETED', 'CANCELED', name='order_status_enum', native_enum=False), nullable=False),
+        sa.Column('payment_method', sa.Enum('PIX', 'BANK_SLIP', 'DEBIT_CARD', 'CREDIT_CARD', 'BANK_TRANSFER', name='order_payment_method_enum', native_enum=False), nullable=True),
+        sa.Column('payment_status', sa.Enum('PENDING', 'PAID', 'FAILED', 'CANCELED', 'REFUNDED', name='payment_status_enum', native_enum=False), nullable=False),
+        sa.Column('total_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['client_id'], ['tb_clients.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tb_orders_archive_client_id_created_at', 'tb_orders_archive', ['client_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tb_orders_archive_created_at', 'tb_orders_archive', ['created_at', 'id'], unique=False)
+
+    op.create_table(
+        'tb_order_items_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('price_at_moment', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('order_created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['order_id'], ['tb_orders_archive.id']),
+        sa.ForeignKeyConstraint(['product_id'], ['tb_products.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tb_order_items_archive_order_id', 'tb_order_items_archive', ['order_id'], unique=False)
+    op.create_index('ix_tb_order_items_archive_product_id', 'tb_order_items_archive', ['product_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tb_order_items_archive_product_id', table_name='tb_order_items_archive')
+    op.drop_index('ix_tb_order_items_archive_order_id', table_name='tb_order_items_archive')
+    op.drop_table('tb_order_items_archive')
+    op.drop_index('ix_tb_orders_archive_created_at', table_name='tb_orders_archive')
+    op.drop_index('ix_tb_orders_archive_client_id_created_at', table_name='tb_orders_archive')
+    op.drop_table('tb_orders_archive')
@@ -1,8 +1,12 @@
 import os
 import pytest
+from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.database.database import Base, get_db
+from app.database.instrumentation import count_queries
+from app.services.principal_cache_service import principal_cache
+from app.services.product_cache_service import product_cache
 from fastapi.testclient import TestClient
 from main import app
 
@@ -35,6 +39,29 @@ def client(db):
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    # The caches are process-wide; start every test from an empty one.
+    principal_cache.clear()
+    product_cache.clear()
 
     with TestClient(app) as client:
-        yield client
\ No newline at end of file
+        yield client
+
+@pytest.fixture
+def max_queries():
+    """Fails the test when the block runs more SQL statements than declared.
+
+        with max_queries(3):
+            client.get("/api/v1/products/")
+    """
+    @contextmanager
+    def assert_max_queries(limit: int):
+        with count_queries(engine) as stats:
+            yield stats
+
+        if stats.statements > limit:
+            pytest.fail(
+                f"Expected at most {limit} SQL statements, ran {stats.statements}:\n"
+                + "\n".join(stats.captured)
+            )
+
+    return assert_max_queries
@@ -0,0 +1,55 @@
+import pytest
+from decimal import Decimal
+
+from app.dependencies import get_current_user
+from app.models.client_model import ClientModel
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_image_model import ProductImageModel
+from app.models.product_model import ProductModel
+from main import app
+
+@pytest.fixture
+def admin(db):
+    user = ClientModel(name="Admin", cpf="000.000.000-00", email="admin@example.com", password="x", role="admin")
+    db.add(user)
+    db.commit()
+    # A detached copy, like the principal cache hands out, so the route's
+    # session lifecycle cannot expire it.
+    principal = ClientModel(id=user.id, name=user.name, email=user.email, role=user.role)
+    app.dependency_overrides[get_current_user] = lambda: principal
+    yield principal
+    app.dependency_overrides.pop(get_current_user, None)
+
+@pytest.fixture
+def seed_catalog(db, admin):
+    """Products with two images each, and orders of consecutive products."""
+    def seed(products=6, orders=4, items_per_order=2):
+        items = []
+        for index in range(products):
+            product = ProductModel(
+                name=f"Product {index}",
+                sale_price=Decimal("10.00") + index,
+                description="Budget test product",
+                stock=50,
+                bar_code=f"BUDGET{index:06d}",
+                category="Budget",
+                images=[ProductImageModel(image_path=f"/img/{index}-{n}.png") for n in range(2)]
+            )
+            items.append(product)
+        db.add_all(items)
+        db.flush()
+
+        for index in range(orders):
+            db.add(OrderModel(
+                client_id=admin.id,
+                total_amount=Decimal("20.00"),
+                order_items=[
+                    OrderItemModel(product_id=product.id, quantity=1, price_at_moment=product.sale_price)
+                    for product in items[index:index + items_per_order]
+                ]
+            ))
+        db.commit()
+        db.expire_all()
+
+    return seed
@@ -0,0 +1,74 @@
+import pytest
+
+def place_order(client, client_id, product_id, quantity=1):
+    response = client.post("/api/v1/orders/", json={
+        "client_id": client_id,
+        "status": "pending",
+        "payment_method": "pix",
+        "payment_status": "pending",
+        "order_items": [{"product_id": product_id, "quantity": quantity}]
+    })
+    assert response.status_code == 201
+    return response.json()
+
+@pytest.mark.parametrize("url", [
+    "/api/v1/products/",
+    "/api/v1/products/1",
+    "/api/v1/orders/",
+    "/api/v1/orders/1",
+])
+def test_matching_etag_returns_304(client, seed_catalog, url):
+    seed_catalog()
+    first = client.get(url)
+
+    second = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["cache-control"] == "private, no-cache"
+
+def test_stale_etag_returns_the_new_body(client, seed_catalog):
+    seed_catalog()
+    etag = client.get("/api/v1/products/1").headers["etag"]
+
+    response = client.get("/api/v1/products/1", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == etag
+    assert response.json()["id"] == 1
+
+def test_stock_change_changes_product_and_order_etags(client, seed_catalog, admin):
+    seed_catalog()
+    product = client.get("/api/v1/products/1")
+    products = client.get("/api/v1/products/")
+    order = client.get("/api/v1/orders/1")
+
+    place_order(client, admin.id, product_id=1, quantity=3)
+
+    changed = client.get("/api/v1/products/1", headers={"If-None-Match": product.headers["etag"]})
+    assert changed.status_code == 200
+    assert changed.json()["stock"] == product.json()["stock"] - 3
+    assert "version" not in changed.json()
+    for url, previous in (("/api/v1/products/", products), ("/api/v1/orders/1", order)):
+        response = client.get(url, headers={"If-None-Match": previous.headers["etag"]})
+        assert response.status_code == 200
+
+def test_order_update_changes_its_etag(client, seed_catalog):
+    seed_catalog()
+    etag = client.get("/api/v1/orders/1").headers["etag"]
+
+    assert client.put("/api/v1/orders/1", json={"payment_method": "credit_card"}).status_code == 200
+
+    response = client.get("/api/v1/orders/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["payment_method"] == "credit_card"
+
+def test_pages_have_distinct_etags(client, seed_catalog):
+    seed_catalog(products=10, orders=0)
+    first = client.get("/api/v1/products/", params={"limit": 5})
+    second = client.get("/api/v1/products/", params={"limit": 5, "cursor": first.headers["x-next-cursor"]})
+
+    assert first.headers["etag"] != second.headers["etag"]
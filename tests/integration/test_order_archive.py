@@ -0,0 +1,102 @@
+import datetime
+import pytest
+from decimal import Decimal
+from sqlalchemy.orm import sessionmaker
+
+from app.enums.order_status_enum import OrderStatusEnum
+from app.models.archived_order_item_model import ArchivedOrderItemModel
+from app.models.archived_order_model import ArchivedOrderModel
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_model import ProductModel
+from app.services.order_archive_service import OrderArchiveService
+
+UTC = datetime.timezone.utc
+NOW = datetime.datetime(2025, 6, 15, tzinfo=UTC)
+
+@pytest.fixture
+def service():
+    return OrderArchiveService(
+        OrderModel, OrderItemModel, ArchivedOrderModel, ArchivedOrderItemModel,
+        batch_size=2, after_months=12, pause_seconds=0.5
+    )
+
+@pytest.fixture
+def session_factory(db):
+    return sessionmaker(bind=db.get_bind(), autoflush=False)
+
+@pytest.fixture
+def orders(db, admin):
+    product = ProductModel(
+        name="Archived Dress", sale_price=Decimal("50.00"), description="Archive test product",
+        stock=10, bar_code="ARCHIVE000001", category="Dresses"
+    )
+    db.add(product)
+    db.flush()
+
+    def order(status, created_at):
+        return OrderModel(
+            client_id=admin.id,
+            status=status,
+            total_amount=Decimal("50.00"),
+            created_at=created_at,
+            order_items=[OrderItemModel(
+                product_id=product.id, quantity=1, price_at_moment=Decimal("50.00"), order_created_at=created_at
+            )]
+        )
+
+    old = datetime.datetime(2024, 1, 10, tzinfo=UTC)
+    db.add_all([
+        order(OrderStatusEnum.COMPLETED, old),
+        order(OrderStatusEnum.CANCELED, old + datetime.timedelta(days=1)),
+        order(OrderStatusEnum.COMPLETED, old + datetime.timedelta(days=2)),
+        order(OrderStatusEnum.PENDING, old + datetime.timedelta(days=3)),
+        order(OrderStatusEnum.COMPLETED, datetime.datetime(2025, 6, 1, tzinfo=UTC)),
+    ])
+    db.commit()
+
+def test_cutoff_is_whole_months_back(service):
+    assert service.cutoff(NOW) == datetime.datetime(2024, 6, 1, tzinfo=UTC)
+
+def test_archive_moves_old_finished_orders_in_batches(db, service, session_factory, orders):
+    pauses = []
+
+    archived = service.archive(session_factory, service.cutoff(NOW), sleep=pauses.append)
+
+    assert archived == 3
+    # Batches of two: a full one, then a short one that ends the run.
+    assert pauses == [0.5]
+    db.expire_all()
+    assert sorted(order.id for order in db.query(OrderModel)) == [4, 5]
+    assert sorted(item.order_id for item in db.query(OrderItemModel)) == [4, 5]
+    assert sorted(order.id for order in db.query(ArchivedOrderModel)) == [1, 2, 3]
+    assert sorted(item.order_id for item in db.query(ArchivedOrderItemModel)) == [1, 2, 3]
+    assert db.get(ArchivedOrderModel, 2).status == OrderStatusEnum.CANCELED
+
+def test_max_batches_stops_the_run(db, service, session_factory, orders):
+    assert service.archive(session_factory, service.cutoff(NOW), max_batches=1, sleep=lambda _: None) == 2
+    assert service.archive(session_factory, service.cutoff(NOW), sleep=lambda _: None) == 1
+
+def test_listing_includes_archived_orders_only_on_request(client, service, session_factory, orders):
+    service.archive(session_factory, service.cutoff(NOW), sleep=lambda _: None)
+
+    live = client.get("/api/v1/orders/").json()
+    everything = client.get("/api/v1/orders/", params={"include_archived": True}).json()
+
+    assert [order["id"] for order in live] == [5, 4]
+    assert [order["id"] for order in everything] == [5, 4, 3, 2, 1]
+    assert everything[2]["order_items"][0]["product"]["name"] == "Archived Dress"
+
+def test_archived_listing_pages_across_both_tables(client, service, session_factory, orders):
+    service.archive(session_factory, service.cutoff(NOW), sleep=lambda _: None)
+
+    ids, cursor = [], None
+    while True:
+        params = {"include_archived": True, "limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/orders/", params=params)
+        ids += [order["id"] for order in response.json()]
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert ids == [5, 4, 3, 2, 1]
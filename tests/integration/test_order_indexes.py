@@ -0,0 +1,85 @@
+import datetime
+import pytest
+from sqlalchemy import event
+
+from app.enums.order_status_enum import OrderStatusEnum
+from app.models.client_model import ClientModel
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_image_model import ProductImageModel
+from app.models.product_model import ProductModel
+from app.services.order_service import OrderService
+from app.services.product_service import ProductService
+from app.services.user_service import UserService
+
+ADMIN = ClientModel(id=1, role="ADMIN")
+USER = ClientModel(id=1, role="user")
+SINCE = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+@pytest.fixture
+def service():
+    return OrderService(
+        OrderModel,
+        OrderItemModel,
+        ProductService(ProductModel, ProductImageModel),
+        UserService(ClientModel)
+    )
+
+def query_plans(db, call):
+    """EXPLAIN every statement ``call`` issues, in order."""
+    engine = db.get_bind()
+    issued = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        issued.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    return [
+        " | ".join(
+            str(row[-1]).strip()
+            for row in db.connection().exec_driver_sql(prefix + statement, parameters).fetchall()
+        )
+        for statement, parameters in issued
+    ]
+
+@pytest.mark.parametrize("user, filters, index", [
+    (USER, {}, "ix_tb_orders_client_id_created_at"),
+    (USER, {"start_date": SINCE}, "ix_tb_orders_client_id_created_at"),
+    (ADMIN, {"client_id": 1}, "ix_tb_orders_client_id_created_at"),
+    (ADMIN, {"client_id": 1, "start_date": SINCE, "end_date": SINCE}, "ix_tb_orders_client_id_created_at"),
+    (ADMIN, {"status": OrderStatusEnum.PENDING}, "ix_tb_orders_status_created_at"),
+    (ADMIN, {"status": OrderStatusEnum.PENDING, "start_date": SINCE}, "ix_tb_orders_status_created_at"),
+    (ADMIN, {}, "ix_tb_orders_created_at"),
+    (ADMIN, {"start_date": SINCE, "end_date": SINCE}, "ix_tb_orders_created_at"),
+    (ADMIN, {"category": "Dresses"}, "ix_tb_orders_created_at"),
+])
+def test_list_orders_reads_the_page_from_an_index(db, service, user, filters, index):
+    plans = query_plans(db, lambda: service.list_orders(db, user, **filters))
+
+    assert index in plans[0]
+    # The index already yields (created_at, id) order, so no sort step.
+    assert "TEMP B-TREE" not in plans[0]
+
+def test_list_orders_with_category_probes_items_by_order(db, service):
+    plans = query_plans(db, lambda: service.list_orders(db, ADMIN, category="Dresses"))
+
+    assert "ix_tb_order_items_order_id" in plans[0]
+
+def test_order_items_are_loaded_by_order_id(db, service):
+    db.add(OrderModel(client_id=1, total_amount=0))
+    db.commit()
+
+    plans = query_plans(db, lambda: service.list_orders(db, ADMIN))
+
+    assert "ix_tb_order_items_order_id" in plans[1]
+
+def test_stock_restoration_finds_items_by_order_id(db, service):
+    plans = query_plans(db, lambda: service.product_service.restore_stock_for_orders(db, [1, 2]))
+
+    assert "ix_tb_order_items_order_id" in plans[0]
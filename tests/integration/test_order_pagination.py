@@ -0,0 +1,61 @@
+import datetime
+import pytest
+from decimal import Decimal
+
+from app.models.order_model import OrderModel
+
+@pytest.fixture
+def orders(db, admin):
+    # Pairs of orders share a timestamp, so the id tie-breaker matters.
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    db.add_all(
+        OrderModel(
+            client_id=admin.id,
+            total_amount=Decimal("10.00"),
+            created_at=start + datetime.timedelta(hours=index // 2)
+        )
+        for index in range(23)
+    )
+    db.commit()
+    return db.query(OrderModel).all()
+
+def walk(client, **params):
+    pages = []
+    cursor = None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/orders/", params=query)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            return pages
+
+def test_cursor_walks_every_order_once_newest_first(client, orders):
+    pages = walk(client, limit=5)
+
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    walked = [order["id"] for page in pages for order in page]
+    expected = sorted(orders, key=lambda order: (order.created_at, order.id), reverse=True)
+    assert walked == [order.id for order in expected]
+
+def test_default_page_is_bounded(client, orders):
+    response = client.get("/api/v1/orders/")
+
+    assert len(response.json()) == 20
+    assert "x-next-cursor" in response.headers
+
+def test_last_page_has_no_cursor(client, orders):
+    response = client.get("/api/v1/orders/", params={"limit": 100})
+
+    assert len(response.json()) == 23
+    assert "x-next-cursor" not in response.headers
+
+def test_limit_above_maximum_is_rejected(client, orders):
+    assert client.get("/api/v1/orders/", params={"limit": 101}).status_code == 422
+
+def test_invalid_cursor_returns_400(client, orders):
+    response = client.get("/api/v1/orders/", params={"cursor": "garbage"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid pagination cursor."}
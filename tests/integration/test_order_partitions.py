@@ -0,0 +1,110 @@
+import datetime
+import pytest
+from decimal import Decimal
+
+from app.database.instrumentation import count_queries
+from app.models.client_model import ClientModel
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_image_model import ProductImageModel
+from app.models.product_model import ProductModel
+from app.services.order_service import OrderService
+from app.services.product_service import ProductService
+from app.services.user_service import UserService
+from app.utils.pagination import encode_cursor
+
+ADMIN = ClientModel(id=1, role="ADMIN")
+UTC = datetime.timezone.utc
+
+def order_service(partitioned):
+    return OrderService(
+        OrderModel,
+        OrderItemModel,
+        ProductService(ProductModel, ProductImageModel),
+        UserService(ClientModel),
+        partitioned=partitioned
+    )
+
+@pytest.fixture
+def orders(db):
+    # Three orders a month over six months, with an empty month between.
+    start = datetime.datetime(2024, 1, 10, tzinfo=UTC)
+    db.add_all(
+        OrderModel(
+            client_id=1,
+            total_amount=Decimal("10.00"),
+            created_at=start + datetime.timedelta(days=31 * month + day)
+        )
+        for month in (0, 1, 2, 4, 5)
+        for day in range(3)
+    )
+    db.commit()
+
+def walk(db, service, limit, **filters):
+    ids, cursor = [], None
+    while True:
+        page = service.list_orders(db, ADMIN, limit=limit, cursor=cursor, **filters)
+        ids += [order.id for order in page]
+        if len(page) < limit:
+            return ids
+        last = page[-1]
+        cursor = encode_cursor(OrderService.CURSOR_SORT_KEY, last.created_at.isoformat(), last.id)
+
+@pytest.mark.parametrize("limit", [1, 2, 4, 20])
+def test_month_by_month_listing_matches_the_unbounded_one(db, orders, limit):
+    assert walk(db, order_service(True), limit) == walk(db, order_service(False), limit)
+
+def test_end_date_starts_the_walk_in_its_month(db, orders):
+    end_date = datetime.datetime(2024, 3, 1, tzinfo=UTC)
+
+    assert (
+        [order.id for order in order_service(True).list_orders(db, ADMIN, end_date=end_date)]
+        == [order.id for order in order_service(False).list_orders(db, ADMIN, end_date=end_date)]
+    )
+
+def test_every_page_query_carries_a_month_bound(db, orders):
+    with count_queries(db.get_bind()) as stats:
+        page = order_service(True).list_orders(db, ADMIN, limit=4)
+
+    assert len(page) == 4
+    order_queries = [
+        statement for statement in stats.captured
+        if statement.lstrip().startswith("SELECT tb_orders.")
+    ]
+    # Three orders in the newest month, the fourth from the one before.
+    assert len(order_queries) == 2
+    assert all(
+        "tb_orders.created_at >= ?" in statement and "tb_orders.created_at < ?" in statement
+        for statement in order_queries
+    )
+
+def test_a_full_first_month_stops_the_walk(db, orders):
+    with count_queries(db.get_bind()) as stats:
+        order_service(True).list_orders(db, ADMIN, limit=3)
+
+    assert sum(statement.lstrip().startswith("SELECT tb_orders.") for statement in stats.captured) == 1
+
+@pytest.mark.parametrize("created_at, max_statements", [
+    # Years apart: twelve monthly statements, then one for the rest.
+    ((datetime.datetime(2019, 1, 15, tzinfo=UTC), datetime.datetime(2024, 6, 15, tzinfo=UTC)), 20),
+    # One old month: the bounds come from the client's orders, not everyone's.
+    ((datetime.datetime(2019, 3, 5, tzinfo=UTC), datetime.datetime(2019, 3, 6, tzinfo=UTC)), 5),
+], ids=["years-apart", "one-old-month"])
+def test_sparse_client_listing_stays_within_a_query_budget(db, orders, max_queries, created_at, max_statements):
+    db.add_all(
+        OrderModel(client_id=2, total_amount=Decimal("10.00"), created_at=moment)
+        for moment in created_at
+    )
+    db.commit()
+    client = ClientModel(id=2, role="CLIENT")
+
+    with max_queries(max_statements):
+        page = order_service(True).list_orders(db, client)
+
+    assert [order.id for order in page] == [
+        order.id for order in order_service(False).list_orders(db, client)
+    ]
+    assert len(page) == 2
+
+def test_no_orders_returns_an_empty_page(db):
+    assert order_service(True).list_orders(db, ADMIN) == []
@@ -0,0 +1,55 @@
+import json
+
+CSV_BODY = (
+    "name,sale_price,description,stock,bar_code,category,images\n"
+    "Summer Floral Dress,129.90,\"Light dress,\nfloral print\",18,1002003004001,Dresses,/img/dress.png\n"
+    "Skinny Jeans,not-a-price,Dark jeans,3,1002003004002,Pants,/img/jeans.png\n"
+)
+
+def chunked(body: bytes, size: int = 7):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+def test_csv_import_streams_and_reports(client, admin):
+    response = client.post(
+        "/api/v1/products/import",
+        content=chunked(CSV_BODY.encode()),
+        headers={"Content-Type": "text/csv"}
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 1
+    assert report["failed"] == 1
+    assert report["errors"][0]["line"] == 4
+    assert report["errors"][0]["bar_code"] == "1002003004002"
+
+    products = client.get("/api/v1/products/").json()
+    assert [product["description"] for product in products] == ["Light dress,\nfloral print"]
+    assert products[0]["images"][0]["image_path"] == "/img/dress.png"
+
+def test_ndjson_import_with_format_parameter(client, admin):
+    body = "\n".join(json.dumps({
+        "name": f"Product {index}",
+        "sale_price": 10 + index,
+        "description": "Imported",
+        "stock": index,
+        "bar_code": f"NDJSON{index:03d}",
+        "category": "Imports",
+        "images": [f"/img/{index}.png"]
+    }) for index in range(25))
+
+    response = client.post("/api/v1/products/import?format=ndjson", content=body)
+
+    assert response.status_code == 200
+    assert response.json() == {"imported": 25, "failed": 0, "errors": [], "errors_truncated": False}
+    assert len(client.get("/api/v1/products/?limit=100").json()) == 25
+
+def test_unknown_format_returns_415(client, admin):
+    response = client.post(
+        "/api/v1/products/import",
+        content=b"{}",
+        headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 415
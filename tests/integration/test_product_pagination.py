@@ -0,0 +1,78 @@
+import pytest
+from decimal import Decimal
+
+from app.dependencies import get_current_user
+from app.models.client_model import ClientModel
+from app.models.product_model import ProductModel
+from main import app
+
+@pytest.fixture
+def products(db):
+    # Repeated prices make the id tie-breaker matter.
+    db.add_all(
+        ProductModel(
+            name=f"Product {index:02d}",
+            sale_price=Decimal("10.00") + index % 4,
+            description="Pagination product",
+            stock=index % 3,
+            bar_code=f"PAGE{index:06d}",
+            category="Pagination"
+        )
+        for index in range(23)
+    )
+    db.commit()
+    app.dependency_overrides[get_current_user] = lambda: ClientModel(id=1, email="user@example.com", role="user")
+    yield db.query(ProductModel).all()
+    app.dependency_overrides.pop(get_current_user, None)
+
+def walk(client, **params):
+    pages = []
+    cursor = None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/products/", params=query)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            return pages
+
+@pytest.mark.parametrize("sort_by", ["id", "name", "sale_price"])
+def test_cursor_walks_every_product_once_in_order(client, products, sort_by):
+    pages = walk(client, limit=5, sort_by=sort_by)
+
+    seen = [(product[sort_by], product["id"]) for page in pages for product in page]
+    assert len(pages) == 5
+    assert seen == sorted(seen)
+    assert sorted(product_id for _, product_id in seen) == sorted(product.id for product in products)
+
+def test_cursor_respects_filters(client, products):
+    pages = walk(client, limit=4, stock=True, sort_by="sale_price")
+
+    returned = [product for page in pages for product in page]
+    assert len(returned) == len([product for product in products if product.stock > 0])
+    assert all(product["stock"] > 0 for product in returned)
+
+def test_skip_pagination_still_works(client, products):
+    first = client.get("/api/v1/products/", params={"limit": 5}).json()
+    second = client.get("/api/v1/products/", params={"limit": 5, "skip": 5}).json()
+    by_cursor = client.get("/api/v1/products/", params={
+        "limit": 5,
+        "cursor": client.get("/api/v1/products/", params={"limit": 5}).headers["x-next-cursor"]
+    }).json()
+
+    assert [product["id"] for product in first] == [1, 2, 3, 4, 5]
+    assert second == by_cursor
+
+def test_invalid_cursor_returns_400(client, products):
+    response = client.get("/api/v1/products/", params={"cursor": "garbage"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid pagination cursor."}
+
+def test_cursor_with_skip_returns_400(client, products):
+    cursor = client.get("/api/v1/products/", params={"limit": 5}).headers["x-next-cursor"]
+
+    response = client.get("/api/v1/products/", params={"cursor": cursor, "skip": 5})
+
+    assert response.status_code == 400
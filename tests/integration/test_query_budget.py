@@ -0,0 +1,74 @@
+import pytest
+
+# Images, order items and their products are eager-loaded, so a listing
+# costs the same number of statements however many rows it returns.
+@pytest.mark.parametrize("products", [2, 10, 50])
+def test_list_products_query_count_is_constant(client, seed_catalog, max_queries, products):
+    seed_catalog(products=products, orders=0)
+
+    with max_queries(2):
+        response = client.get("/api/v1/products/?limit=100")
+
+    assert response.status_code == 200
+    assert len(response.json()) == products
+    assert all(len(product["images"]) == 2 for product in response.json())
+
+@pytest.mark.parametrize("orders", [1, 4, 20])
+def test_list_orders_query_count_is_constant(client, seed_catalog, max_queries, orders):
+    seed_catalog(products=orders + 1, orders=orders)
+
+    with max_queries(4):
+        response = client.get("/api/v1/orders/")
+
+    assert response.status_code == 200
+    assert len(response.json()) == orders
+    assert all(
+        len(item["product"]["images"]) == 2
+        for order in response.json()
+        for item in order["order_items"]
+    )
+
+@pytest.mark.parametrize("params", [{}, {"category": "budget"}])
+def test_order_page_statement_count_is_pinned(client, seed_catalog, max_queries, params):
+    # One statement each for orders, items, products and images.
+    seed_catalog(products=59, orders=50, items_per_order=10)
+
+    with max_queries(4) as stats:
+        response = client.get("/api/v1/orders/", params={"limit": 50, **params})
+
+    assert stats.statements == 4
+    assert response.status_code == 200
+    assert len(response.json()) == 50
+    assert all(len(order["order_items"]) == 10 for order in response.json())
+    assert all(
+        len(item["product"]["images"]) == 2
+        for order in response.json()
+        for item in order["order_items"]
+    )
+
+def test_category_filter_returns_each_order_once(client, seed_catalog):
+    seed_catalog(products=5, orders=3, items_per_order=3)
+
+    response = client.get("/api/v1/orders/", params={"category": "budget"})
+
+    assert [order["id"] for order in response.json()] == [3, 2, 1]
+    assert client.get("/api/v1/orders/", params={"category": "missing"}).json() == []
+    # LIKE wildcards in the term are matched literally.
+    assert client.get("/api/v1/orders/", params={"category": "%"}).json() == []
+    assert client.get("/api/v1/orders/", params={"category": "b_dget"}).json() == []
+
+def test_get_product_and_order_query_counts(client, seed_catalog, max_queries):
+    seed_catalog()
+
+    with max_queries(2):
+        assert client.get("/api/v1/products/1").status_code == 200
+    with max_queries(2):
+        assert client.get("/api/v1/orders/1").status_code == 200
+
+def test_responses_carry_server_timing(client, seed_catalog):
+    seed_catalog()
+
+    response = client.get("/api/v1/products/?limit=100")
+
+    assert response.headers["server-timing"].startswith('db;dur=')
+    assert 'desc="2 queries"' in response.headers["server-timing"]
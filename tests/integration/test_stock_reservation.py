@@ -0,0 +1,116 @@
+import random
+import threading
+import pytest
+from decimal import Decimal
+from fastapi import HTTPException
+from sqlalchemy.orm import sessionmaker
+
+from app.container import ServiceContainer
+from app.database.instrumentation import count_queries
+from app.enums.order_status_enum import OrderStatusEnum
+from app.enums.stock_reservation_enum import StockReservationEnum
+from app.models.client_model import ClientModel
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_model import ProductModel
+from app.schemas.order_schema import OrderCreate, OrderItemCreate
+
+STOCK = 40
+SKUS = 3
+
+@pytest.fixture(params=list(StockReservationEnum))
+def services(request):
+    container = ServiceContainer()
+    container.product_service.reservation_strategy = request.param
+    yield container
+    container.shutdown()
+
+@pytest.fixture
+def skus(db):
+    db.add_all(
+        ProductModel(
+            name=f"Hot SKU {index}",
+            sale_price=Decimal("10.00") + index,
+            description="Contended product",
+            stock=STOCK,
+            bar_code=f"HOT{index:04d}",
+            category="Hot"
+        )
+        for index in range(SKUS)
+    )
+    db.commit()
+    return [product.id for product in db.query(ProductModel).order_by(ProductModel.id)]
+
+def test_reserve_stock_runs_one_update_for_the_whole_order(db, services, skus):
+    with count_queries(db.get_bind()) as stats:
+        products = services.product_service.reserve_stock(db, {skus[2]: 5, skus[0]: 1})
+        db.commit()
+
+    assert sorted(products) == [skus[0], skus[2]]
+    assert products[skus[2]].sale_price == Decimal("12.00")
+    statements = [statement.split()[0] for statement in stats.captured]
+    # Row locks need one SELECT ... FOR UPDATE first; the conditional
+    # UPDATE needs nothing else.
+    expected_selects = 1 if services.product_service.reservation_strategy == StockReservationEnum.LOCK else 0
+    assert statements.count("SELECT") == expected_selects
+    assert statements.count("UPDATE") == 1
+    db.expire_all()
+    assert [(product.stock, product.version) for product in db.query(ProductModel).order_by(ProductModel.id)] == [
+        (STOCK - 1, 2), (STOCK, 1), (STOCK - 5, 2)
+    ]
+
+@pytest.mark.parametrize("quantities, status_code", [
+    ({1: 1, 999: 1}, 404),
+    ({1: 1, 2: STOCK + 1}, 400),
+])
+def test_failed_reservation_changes_nothing(db, services, skus, quantities, status_code):
+    with pytest.raises(HTTPException) as error:
+        services.product_service.reserve_stock(db, quantities)
+    db.rollback()
+
+    assert error.value.status_code == status_code
+    assert [product.stock for product in db.query(ProductModel)] == [STOCK] * SKUS
+    if status_code == 400:
+        assert error.value.detail == f"Insufficient stock for product 2. Available: {STOCK}"
+
+def test_parallel_orders_on_the_same_skus_never_oversell(db, services, skus):
+    client = ClientModel(name="Buyer", cpf="111.111.111-11", email="buyer@example.com", password="x", role="ADMIN")
+    db.add(client)
+    db.commit()
+    principal = ClientModel(id=client.id, role="ADMIN")
+    Session = sessionmaker(bind=db.get_bind(), autoflush=False)
+    placed, rejected, failures = [], [], []
+
+    def place_order(seed):
+        # Each order takes one unit of every SKU, listed in a random order.
+        lines = [OrderItemCreate(product_id=product_id, quantity=1) for product_id in skus]
+        random.Random(seed).shuffle(lines)
+        order = OrderCreate(
+            client_id=client.id,
+            status=OrderStatusEnum.PENDING,
+            payment_method="pix",
+            payment_status="pending",
+            order_items=lines
+        )
+        with Session() as session:
+            try:
+                services.order_service.create_order(session, order, principal)
+                placed.append(seed)
+            except HTTPException as error:
+                (rejected if error.status_code in (400, 409) else failures).append(error.detail)
+            except Exception as error:
+                failures.append(repr(error))
+
+    threads = [threading.Thread(target=place_order, args=(seed,)) for seed in range(STOCK * 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
+    assert len(placed) == STOCK
+    assert len(rejected) == STOCK
+    db.expire_all()
+    assert [product.stock for product in db.query(ProductModel)] == [0] * SKUS
+    assert db.query(OrderModel).count() == STOCK
+    assert db.query(OrderItemModel).count() == STOCK * SKUS
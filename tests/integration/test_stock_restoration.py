@@ -0,0 +1,96 @@
+import pytest
+
+from app.container import ServiceContainer
+from app.database.instrumentation import count_queries
+from app.enums.order_status_enum import OrderStatusEnum
+from app.models.archived_order_item_model import ArchivedOrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_image_model import ProductImageModel
+from app.models.product_model import ProductModel
+from app.services.product_service import ProductService
+
+@pytest.fixture
+def product_service():
+    container = ServiceContainer()
+    yield container.product_service
+    container.shutdown()
+
+def stocks(db):
+    db.expire_all()
+    return [product.stock for product in db.query(ProductModel).order_by(ProductModel.id)]
+
+# seed_catalog: 50 units of every product; order n holds one unit of
+# products n and n + 1.
+def test_restoring_one_order_is_one_statement(db, seed_catalog, product_service):
+    seed_catalog(products=3, orders=1)
+    order = db.get(OrderModel, 1)
+
+    with count_queries(db.get_bind()) as stats:
+        product_service.restore_product_stock(db, order)
+    db.commit()
+
+    assert stats.statements == 1
+    assert stats.captured[0].startswith("UPDATE tb_products")
+    assert stocks(db) == [51, 51, 50]
+
+def test_bulk_restore_sums_products_shared_by_orders(db, seed_catalog, product_service):
+    seed_catalog(products=5, orders=4)
+
+    with count_queries(db.get_bind()) as stats:
+        restocked = product_service.restore_stock_for_orders(db, [1, 2, 3])
+    db.commit()
+
+    assert stats.statements == 1
+    assert sorted(restocked) == [1, 2, 3, 4]
+    assert stocks(db) == [51, 52, 52, 51, 50]
+    assert db.get(ProductModel, 2).version == 2
+
+def test_bulk_restore_of_nothing_runs_nothing(db, product_service):
+    with count_queries(db.get_bind()) as stats:
+        assert product_service.restore_stock_for_orders(db, []) == []
+
+    assert stats.statements == 0
+
+def test_deleting_an_order_returns_its_stock(client, seed_catalog):
+    seed_catalog(products=3, orders=2)
+
+    assert client.delete("/api/v1/orders/2").status_code == 204
+
+    products = client.get("/api/v1/products/").json()
+    assert [product["stock"] for product in products] == [50, 51, 51]
+
+def test_deleting_an_order_is_set_based(db, client, seed_catalog):
+    seed_catalog(products=3, orders=2)
+
+    with count_queries(db.get_bind()) as stats:
+        assert client.delete("/api/v1/orders/1").status_code == 204
+
+    deletes = [statement for statement in stats.captured if statement.startswith("DELETE")]
+    assert [statement.split()[2] for statement in deletes] == ["tb_order_items", "tb_orders"]
+
+def test_bulk_delete_restores_stock_of_open_orders_only(db, client, seed_catalog):
+    seed_catalog(products=5, orders=4)
+    db.get(OrderModel, 4).status = OrderStatusEnum.CANCELED
+    db.commit()
+
+    response = client.delete("/api/v1/orders/", params={"client_id": 1, "batch_size": 3})
+
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 4, "restocked": 3, "batches": 2, "done": True}
+    assert db.query(OrderModel).count() == 0
+    assert stocks(db) == [51, 52, 52, 51, 50]
+
+def test_bulk_delete_requires_a_filter(client, seed_catalog):
+    seed_catalog(products=3, orders=2)
+
+    assert client.delete("/api/v1/orders/").status_code == 400
+
+def test_bulk_restore_reads_the_configured_order_item_model(db, seed_catalog):
+    seed_catalog(products=3, orders=2)
+    product_service = ProductService(ProductModel, ProductImageModel, ArchivedOrderItemModel)
+
+    with count_queries(db.get_bind()) as stats:
+        assert product_service.restore_stock_for_orders(db, [1, 2]) == []
+
+    assert "tb_order_items_archive" in stats.captured[0]
+    assert stocks(db) == [50, 50, 50]
@@ -0,0 +1,53 @@
+import pytest
+from decimal import Decimal
+
+from app.dependencies import get_current_user
+from app.models.client_model import ClientModel
+from app.models.product_model import ProductModel
+from main import app
+
+@pytest.fixture
+def admin(db):
+    principal = ClientModel(id=1, name="Admin", email="admin@example.com", role="admin")
+    app.dependency_overrides[get_current_user] = lambda: principal
+    yield principal
+    app.dependency_overrides.pop(get_current_user, None)
+
+@pytest.fixture
+def catalog(db, admin):
+    db.add_all([
+        ProductModel(name="Summer Floral Dress", sale_price=Decimal("129.90"), description="Light dress",
+                     stock=5, bar_code="S1", category="Dresses"),
+        ProductModel(name="Skinny Jeans", sale_price=Decimal("159.90"), description="Dark wash denim",
+                     stock=0, bar_code="S2", category="Pants"),
+        ProductModel(name="Linen Shirt", sale_price=Decimal("99.90"), description="Goes well with jeans",
+                     stock=3, bar_code="S3", category="Shirts"),
+    ])
+    db.add_all([
+        ClientModel(name="John Doe", cpf="1", email="john@example.com", password="x", role="user"),
+        ClientModel(name="Jane Smith", cpf="2", email="jane@shop.com", password="x", role="user"),
+    ])
+    db.commit()
+
+def names(response):
+    assert response.status_code == 200
+    return [item["name"] for item in response.json()]
+
+def test_product_search_covers_name_description_and_category(client, catalog):
+    assert names(client.get("/api/v1/products/", params={"search": "JEANS"})) == ["Skinny Jeans", "Linen Shirt"]
+    assert names(client.get("/api/v1/products/", params={"search": "dresses"})) == ["Summer Floral Dress"]
+
+def test_product_search_combines_with_filters(client, catalog):
+    response = client.get("/api/v1/products/", params={"search": "jeans", "stock": True})
+
+    assert names(response) == ["Linen Shirt"]
+
+def test_category_filter_is_case_insensitive_substring(client, catalog):
+    assert names(client.get("/api/v1/products/", params={"category": "dress"})) == ["Summer Floral Dress"]
+
+def test_wildcards_in_search_are_literal(client, catalog):
+    assert names(client.get("/api/v1/products/", params={"search": "%"})) == []
+
+def test_user_search_covers_name_and_email(client, catalog):
+    assert names(client.get("/api/v1/users/", params={"search": "shop.com"})) == ["Jane Smith"]
+    assert names(client.get("/api/v1/users/", params={"search": "doe"})) == ["John Doe"]
@@ -1,7 +1,12 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from app.enums.role_enum import RoleEnum
+from app.schemas.principal_schema import Principal
 from app.services.auth_service import AuthService
+from app.services.token_version_service import TokenVersionService
 from app.schemas.user_schema import UserCreate
 from app.schemas.token_schema import TokenSchema
 
@@ -14,10 +19,21 @@ def jwt_service_mock():
     return MagicMock()
 
 @pytest.fixture
-def auth_service(user_service_mock, jwt_service_mock):
-    return AuthService(user_service=user_service_mock, jwt_service=jwt_service_mock)
+def password_service_mock():
+    service = MagicMock()
+    service.hash_password = AsyncMock(return_value="hashedpassword")
+    service.verify_password = AsyncMock(return_value=True)
+    return service
 
-def test_register_calls_create_user(auth_service, user_service_mock):
+@pytest.fixture
+def auth_service(user_service_mock, jwt_service_mock, password_service_mock):
+    return AuthService(
+        user_service=user_service_mock,
+        jwt_service=jwt_service_mock,
+        password_service=password_service_mock
+    )
+
+def test_register_calls_create_user(auth_service, user_service_mock, password_service_mock):
     db_mock = MagicMock()
     user_data = UserCreate(
         name="John Doe",
@@ -26,10 +42,30 @@ def test_register_calls_create_user(auth_service, user_service_mock):
         password="123456"
     )
 
-    auth_service.register(db_mock, user_data)
-    user_service_mock.create_user.assert_called_once_with(db_mock, user_data)
+    asyncio.run(auth_service.register(db_mock, user_data))
+
+    password_service_mock.hash_password.assert_awaited_once_with("123456")
+    user_service_mock.create_user.assert_called_once_with(
+        db_mock, user_data, hashed_password="hashedpassword"
+    )
+
+def test_register_rejects_duplicates_before_hashing(auth_service, user_service_mock, password_service_mock):
+    user_service_mock.validate_new_user.side_effect = HTTPException(status_code=409, detail="Email already registered")
+    user_data = UserCreate(
+        name="John Doe",
+        cpf="123.456.789-00",
+        email="test@example.com",
+        password="123456"
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth_service.register(MagicMock(), user_data))
+
+    assert exc.value.status_code == 409
+    password_service_mock.hash_password.assert_not_awaited()
+    user_service_mock.create_user.assert_not_called()
 
-def test_login_success(auth_service, user_service_mock, jwt_service_mock):
+def test_login_success(auth_service, user_service_mock, jwt_service_mock, password_service_mock):
     db_mock = MagicMock()
     email = "test@example.com"
     password = "123456"
@@ -39,10 +75,11 @@ def test_login_success(auth_service, user_service_mock, jwt_service_mock):
     user_mock.password = "hashedpassword"
 
     user_service_mock.get_user_by_email.return_value = user_mock
-    user_service_mock.verify_password.return_value = True
     jwt_service_mock.create_access_token.return_value = "token123"
 
-    token = auth_service.login(db_mock, email, password)
+    token = asyncio.run(auth_service.login(db_mock, email, password))
+
+    password_service_mock.verify_password.assert_awaited_once_with(password, "hashedpassword")
 
     assert isinstance(token, TokenSchema)
     assert token.access_token == "token123"
@@ -55,18 +92,27 @@ def test_login_invalid_credentials_raises(auth_service, user_service_mock):
     user_service_mock.get_user_by_email.return_value = None
 
     with pytest.raises(HTTPException) as exc:
-        auth_service.login(db_mock, email, password)
+        asyncio.run(auth_service.login(db_mock, email, password))
 
     assert exc.value.status_code == 401
     assert "Invalid email or password" in exc.value.detail
 
+def test_login_wrong_password_raises(auth_service, user_service_mock, password_service_mock):
+    user_service_mock.get_user_by_email.return_value = MagicMock(password="hashedpassword")
+    password_service_mock.verify_password.return_value = False
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth_service.login(MagicMock(), "test@example.com", "wrongpassword"))
+
+    assert exc.value.status_code == 401
+
 def test_refresh_token_success(auth_service, jwt_service_mock):
     refresh_token = "valid_refresh_token"
 
     jwt_service_mock.decode_token.return_value = {"sub": "test@example.com"}
     jwt_service_mock.create_access_token.return_value = "new_access_token"
 
-    new_token = auth_service.refresh_token(refresh_token)
+    new_token = asyncio.run(auth_service.refresh_token(MagicMock(), refresh_token))
 
     assert new_token == "new_access_token"
 
@@ -77,7 +123,7 @@ def test_refresh_token_expired_raises(auth_service, jwt_service_mock):
     jwt_service_mock.decode_token.side_effect = ExpiredSignatureError()
 
     with pytest.raises(HTTPException) as exc:
-        auth_service.refresh_token(refresh_token)
+        asyncio.run(auth_service.refresh_token(MagicMock(), refresh_token))
 
     assert exc.value.status_code == 401
     assert "Refresh token expired" in exc.value.detail
@@ -89,7 +135,7 @@ def test_refresh_token_invalid_token_raises(auth_service, jwt_service_mock):
     jwt_service_mock.decode_token.side_effect = InvalidTokenError()
 
     with pytest.raises(HTTPException) as exc:
-        auth_service.refresh_token(refresh_token)
+        asyncio.run(auth_service.refresh_token(MagicMock(), refresh_token))
 
     assert exc.value.status_code == 401
     assert "Invalid refresh token" in exc.value.detail
@@ -100,7 +146,69 @@ def test_refresh_token_no_email_in_payload_raises(auth_service, jwt_service_mock
     jwt_service_mock.decode_token.return_value = {}
 
     with pytest.raises(HTTPException) as exc:
-        auth_service.refresh_token(refresh_token)
+        asyncio.run(auth_service.refresh_token(MagicMock(), refresh_token))
 
     assert exc.value.status_code == 401
     assert "Invalid refresh token" in exc.value.detail
+
+@pytest.fixture
+def stateless_auth_service(user_service_mock, jwt_service_mock, password_service_mock):
+    return AuthService(
+        user_service=user_service_mock,
+        jwt_service=jwt_service_mock,
+        password_service=password_service_mock,
+        token_version_service=TokenVersionService(),
+        stateless=True
+    )
+
+def stateless_db(token_version):
+    db = MagicMock(spec=Session)
+    db.scalar.return_value = token_version
+    return db
+
+def test_login_stateless_embeds_identity_claims(stateless_auth_service, user_service_mock, jwt_service_mock):
+    user_mock = MagicMock(id=7, email="test@example.com", password="hashedpassword", role="admin", token_version=1)
+    user_service_mock.get_user_by_email.return_value = user_mock
+    jwt_service_mock.create_access_token.return_value = "token123"
+
+    asyncio.run(stateless_auth_service.login(MagicMock(), "test@example.com", "123456"))
+
+    jwt_service_mock.create_access_token.assert_called_once_with(
+        data={"sub": "test@example.com", "uid": 7, "role": "admin", "ver": 1}
+    )
+
+def test_get_stateless_principal_from_claims(stateless_auth_service):
+    payload = {"sub": "test@example.com", "uid": 7, "role": "admin", "ver": 0}
+
+    principal = asyncio.run(stateless_auth_service.get_stateless_principal(stateless_db(0), payload))
+
+    assert isinstance(principal, Principal)
+    assert principal.id == 7
+    assert principal.role == RoleEnum.ADMIN
+
+def test_get_stateless_principal_caches_the_version(stateless_auth_service):
+    payload = {"sub": "test@example.com", "uid": 7, "role": "admin", "ver": 0}
+    db = stateless_db(0)
+
+    for _ in range(2):
+        asyncio.run(stateless_auth_service.get_stateless_principal(db, payload))
+
+    db.scalar.assert_called_once()
+
+@pytest.mark.parametrize("stored_version", [1, None], ids=["bumped", "deleted"])
+def test_get_stateless_principal_rejects_revoked_version(stateless_auth_service, stored_version):
+    payload = {"sub": "test@example.com", "uid": 7, "role": "admin", "ver": 0}
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(stateless_auth_service.get_stateless_principal(stateless_db(stored_version), payload))
+
+    assert exc.value.status_code == 401
+    assert "revoked" in exc.value.detail
+
+def test_get_stateless_principal_disabled_or_missing_claims(auth_service, stateless_auth_service):
+    payload = {"sub": "test@example.com", "uid": 7, "role": "admin", "ver": 0}
+    db = stateless_db(0)
+
+    assert asyncio.run(auth_service.get_stateless_principal(db, payload)) is None
+    assert asyncio.run(stateless_auth_service.get_stateless_principal(db, {"sub": "test@example.com"})) is None
+    db.scalar.assert_not_called()
@@ -0,0 +1,57 @@
+import logging
+import pytest
+from unittest import mock
+from sqlalchemy import text
+
+from app.database.pool import PoolMetrics, TimedQueuePool, create_pooled_engine
+
+@pytest.fixture
+def metrics():
+    return PoolMetrics(warn_threshold_ms=100)
+
+def test_pool_is_configured_from_environment(tmp_path, metrics, monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_POOL_MAX_OVERFLOW", "2")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "7")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "60")
+
+    engine = create_pooled_engine(f"sqlite:///{tmp_path / 'pool.db'}", metrics)
+
+    assert isinstance(engine.pool, TimedQueuePool)
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 2
+    assert engine.pool._timeout == 7
+    assert engine.pool._recycle == 60
+    assert engine.pool._pre_ping is True
+
+def test_snapshot_reports_checked_out_and_idle(tmp_path, metrics):
+    engine = create_pooled_engine(f"sqlite:///{tmp_path / 'pool.db'}", metrics)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        in_use = metrics.snapshot(engine.pool)
+
+    released = metrics.snapshot(engine.pool)
+
+    assert in_use["checked_out"] == 1
+    assert released["checked_out"] == 0
+    assert released["idle"] == 1
+    assert released["checkouts"] == 1
+
+def test_slow_checkout_logs_warning(metrics, caplog):
+    pool = mock.MagicMock()
+    pool.status.return_value = "Pool size: 5"
+
+    with caplog.at_level(logging.WARNING, logger="app.database.pool"):
+        metrics.record_checkout(250.0, pool)
+        metrics.record_checkout(1.0, pool)
+
+    assert metrics.slow_checkouts == 1
+    assert metrics.max_wait_ms == 250.0
+    assert "Slow DB pool checkout" in caplog.text
+
+def test_in_memory_sqlite_keeps_default_pool(metrics):
+    engine = create_pooled_engine("sqlite://", metrics)
+
+    assert not isinstance(engine.pool, TimedQueuePool)
+    assert metrics.snapshot(engine.pool)["pool_size"] == 0
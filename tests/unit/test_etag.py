@@ -0,0 +1,44 @@
+from fastapi import Response
+
+from app.utils.etag import Tagged, conditional_response, entity_tag, etag_matches
+
+def test_entity_tag_is_a_strong_quoted_tag():
+    etag = entity_tag([("product", 1, 1)])
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert not etag.startswith("W/")
+    assert etag == entity_tag([("product", 1, 1)])
+
+def test_entity_tag_changes_with_version_and_membership():
+    base = entity_tag([("product", 1, 1), ("product", 2, 1)])
+
+    assert entity_tag([("product", 1, 2), ("product", 2, 1)]) != base
+    assert entity_tag([("product", 1, 1)]) != base
+    assert entity_tag([("product", 2, 1), ("product", 1, 1)]) != base
+
+def test_etag_matches_lists_weak_tags_and_wildcard():
+    etag = entity_tag([("order", 7, 3)])
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+def test_conditional_response_returns_304_without_body():
+    result = conditional_response(Response(), Tagged('"abc"', None))
+
+    assert result.status_code == 304
+    assert result.body == b""
+    assert result.headers["etag"] == '"abc"'
+    assert result.headers["cache-control"] == "private, no-cache"
+
+def test_conditional_response_sets_headers_on_the_body_response():
+    response = Response()
+
+    result = conditional_response(response, Tagged('"abc"', {"id": 1}))
+
+    assert result == {"id": 1}
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["cache-control"] == "private, no-cache"
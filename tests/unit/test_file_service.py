@@ -65,4 +65,17 @@ def test_save_file_writes_file(tmp_path):
     assert saved_path.suffix == ".png"
 
     with open(saved_path, "rb") as file:
-        assert file.read() == file_content
\ No newline at end of file
+        assert file.read() == file_content
+
+def test_delete_paths_removes_folders_and_files():
+    service = FileService()
+    folder = service.build_product_folder("Dresses", "Summer Dress")
+    folder.mkdir(parents=True)
+    (folder / "front.jpg").write_bytes(b"image")
+    loose_file = service.upload_dir / "loose.jpg"
+    loose_file.write_bytes(b"image")
+
+    service.delete_paths([str(folder), str(loose_file), str(service.upload_dir / "missing.jpg")])
+
+    assert not folder.exists()
+    assert not loose_file.exists()
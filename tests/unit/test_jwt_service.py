@@ -1,4 +1,5 @@
 import pytest
+import jwt
 from fastapi import HTTPException, status
 from datetime import timedelta
 from app.services.jwt_service import JWTService
@@ -61,4 +62,53 @@ def test_decode_token_unexpected_error(monkeypatch):
     with pytest.raises(HTTPException) as exc:
         service.decode_token(token)
     assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    assert service.UNEXPECTED_ERROR in exc.value.detail
\ No newline at end of file
+    assert service.UNEXPECTED_ERROR in exc.value.detail
+def test_decode_token_reuses_verified_payload(monkeypatch):
+    service = JWTService(secret_key="test-secret")
+    token = service.create_access_token({"sub": "user123"})
+    service.decode_token(token)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("token should be served from the cache")
+
+    monkeypatch.setattr("jwt.decode", fail_decode)
+
+    decoded = service.decode_token(token)
+
+    assert decoded["sub"] == "user123"
+    assert service.token_cache.stats()["hits"] == 1
+    assert service.token_cache.stats()["misses"] == 1
+
+def test_decode_token_cached_entry_rechecks_expiry(monkeypatch):
+    service = JWTService(secret_key="test-secret")
+    token = service.create_access_token({"sub": "user123"})
+    decoded = service.decode_token(token)
+
+    monkeypatch.setattr("app.services.jwt_service.time.time", lambda: decoded["exp"] + 1)
+
+    with pytest.raises(HTTPException) as exc:
+        service.decode_token(token)
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert service.TOKEN_EXPIRED in exc.value.detail
+
+def test_decode_token_cache_is_keyed_by_secret():
+    service = JWTService(secret_key="old-secret")
+    token = service.create_access_token({"sub": "user123"})
+    service.decode_token(token)
+
+    service.secret_key = "new-secret"
+
+    with pytest.raises(HTTPException) as exc:
+        service.decode_token(token)
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert service.INVALID_TOKEN in exc.value.detail
+
+def test_decode_token_missing_sub_is_not_cached():
+    service = JWTService(secret_key="test-secret")
+    token = jwt.encode({"exp": 9999999999}, "test-secret", algorithm="HS256")
+
+    with pytest.raises(HTTPException) as exc:
+        service.decode_token(token)
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert service.INVALID_TOKEN_SUB in exc.value.detail
+    assert service.token_cache.stats()["size"] == 0
@@ -15,7 +15,9 @@ def mock_db():
 @pytest.fixture
 def product_service():
     service = MagicMock()
-    service.validate_and_decrease_stock.return_value = MagicMock(sale_price=Decimal('10.00'))
+    service.reserve_stock.side_effect = lambda db, quantities: {
+        product_id: MagicMock(sale_price=Decimal('10.00')) for product_id in quantities
+    }
     service.restore_product_stock = MagicMock()
     return service
 
@@ -76,30 +78,52 @@ def test_build_order_items_calculates_total_and_creates_items(order_service, moc
         OrderItemCreate(product_id=1, quantity=3),
         OrderItemCreate(product_id=2, quantity=1),
     ]
+    prices = {1: Decimal('5.00'), 2: Decimal('20.00')}
+    order_service.product_service.reserve_stock.side_effect = lambda db, quantities: {
+        product_id: MagicMock(sale_price=prices[product_id]) for product_id in quantities
+    }
 
-    def mock_validate_and_decrease_stock(db, product_id, quantity):
-        class FakeProduct:
-            def __init__(self, price):
-                self.sale_price = price
+    order_items, total = order_service._build_order_items(mock_db, items_data)
 
-        if product_id == 1:
-            return FakeProduct(Decimal('5.00'))
-        elif product_id == 2:
-            return FakeProduct(Decimal('20.00'))
+    assert len(order_items) == 2
+    assert total == Decimal('35.00')
 
-    order_service.product_service.validate_and_decrease_stock.side_effect = mock_validate_and_decrease_stock
+def test_build_order_items_reserves_once_and_merges_repeated_products(order_service, mock_db):
+    items_data = [
+        OrderItemCreate(product_id=2, quantity=1),
+        OrderItemCreate(product_id=1, quantity=3),
+        OrderItemCreate(product_id=2, quantity=4),
+    ]
 
     order_items, total = order_service._build_order_items(mock_db, items_data)
 
-    assert len(order_items) == 2
-    assert total == Decimal('35.00')
+    order_service.product_service.reserve_stock.assert_called_once_with(mock_db, {2: 5, 1: 3})
+    assert [(item.product_id, item.quantity) for item in order_items] == [(2, 5), (1, 3)]
+    assert total == Decimal('80.00')
+
+def test_build_order_items_stores_a_product_snapshot(order_service, mock_db):
+    product = MagicMock(sale_price=Decimal('5.00'), bar_code="7891234567890", category="Dresses")
+    product.name = "Summer Dress"
+    order_service.product_service.reserve_stock.side_effect = lambda db, quantities: {1: product}
+    order_service.product_service.primary_image_paths.return_value = {1: "/img/dress.png"}
+
+    order_items, _ = order_service._build_order_items(mock_db, [OrderItemCreate(product_id=1, quantity=1)])
+
+    order_service.product_service.primary_image_paths.assert_called_once_with(mock_db, [1])
+    assert order_items[0].product_snapshot == {
+        "id": 1,
+        "name": "Summer Dress",
+        "bar_code": "7891234567890",
+        "category": "Dresses",
+        "image_path": "/img/dress.png",
+    }
 
 def test_get_order_by_id_found_and_permission(order_service, mock_db, current_user):
     fake_order = MagicMock()
     fake_order.id = 1
-    fake_order.user_id = current_user.id
+    fake_order.client_id = current_user.id
 
-    query = mock_db.query.return_value
+    query = mock_db.query.return_value.options.return_value
     query.filter.return_value.first.return_value = fake_order
 
     result = order_service.get_order_by_id(mock_db, 1, current_user)
@@ -107,7 +131,7 @@ def test_get_order_by_id_found_and_permission(order_service, mock_db, current_us
     assert result == fake_order
 
 def test_get_order_by_id_not_found(order_service, mock_db, current_user):
-    query = mock_db.query.return_value
+    query = mock_db.query.return_value.options.return_value
     query.filter.return_value.first.return_value = None
 
     with pytest.raises(Exception) as exc_info:
@@ -139,28 +163,43 @@ def test_delete_order_no_permission(order_service, mock_db, current_user):
     fake_order = MagicMock()
     fake_order.client_id = 999
     fake_order.status = OrderStatusEnum.PENDING
-
-    order_service.get_order_by_id = MagicMock(return_value=fake_order)
+    mock_db.query.return_value.filter.return_value.first.return_value = fake_order
 
     with pytest.raises(Exception) as exc_info:
         order_service.delete_order(mock_db, 1, current_user)
 
     assert order_service.NO_PERMISSION_TO_DELETE_ORDER in str(exc_info.value)
+    mock_db.execute.assert_not_called()
 
 def test_delete_order_success(order_service, mock_db, admin_user):
     fake_order = MagicMock()
+    fake_order.id = 1
     fake_order.client_id = admin_user.id
     fake_order.status = OrderStatusEnum.PENDING
-    fake_order.order_items = [MagicMock(), MagicMock()]
-
-    order_service.get_order_by_id = MagicMock(return_value=fake_order)
+    mock_db.query.return_value.filter.return_value.first.return_value = fake_order
 
     order_service.delete_order(mock_db, 1, admin_user)
 
     order_service.product_service.restore_product_stock.assert_called_once_with(mock_db, fake_order)
+    # One DELETE for the items and one for the order, no per-row deletes.
+    assert mock_db.execute.call_count == 2
+    mock_db.delete.assert_not_called()
+    mock_db.commit.assert_called_once()
 
-    for item in fake_order.order_items:
-        mock_db.delete.assert_any_call(item)
+def test_delete_canceled_order_does_not_restore_stock_again(order_service, mock_db, admin_user):
+    fake_order = MagicMock()
+    fake_order.id = 1
+    fake_order.status = OrderStatusEnum.CANCELED
+    mock_db.query.return_value.filter.return_value.first.return_value = fake_order
 
-    mock_db.delete.assert_any_call(fake_order)
-    mock_db.commit.assert_called_once()
+    order_service.delete_order(mock_db, 1, admin_user)
+
+    order_service.product_service.restore_product_stock.assert_not_called()
+    assert mock_db.execute.call_count == 2
+
+def test_delete_order_batch_requires_a_filter(order_service, mock_db):
+    with pytest.raises(Exception) as exc_info:
+        order_service.delete_order_batch(mock_db, 100)
+
+    assert order_service.BULK_DELETE_FILTER_REQUIRED in str(exc_info.value)
+    mock_db.query.assert_not_called()
@@ -0,0 +1,35 @@
+import pytest
+from types import SimpleNamespace
+from fastapi import HTTPException, status
+
+from app.utils.pagination import decode_cursor, encode_cursor, next_cursor
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("sale_price", 129.9, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "sale_price") == (129.9, 42)
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", "W10", encode_cursor("id", 1, "x")])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, "id")
+
+    assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_cursor_is_bound_to_its_sort_order():
+    cursor = encode_cursor("name", "Dress", 3)
+
+    with pytest.raises(HTTPException):
+        decode_cursor(cursor, "id")
+
+def test_next_cursor_points_at_last_item_of_full_page():
+    items = [SimpleNamespace(id=1, name="A"), SimpleNamespace(id=2, name="B")]
+
+    assert decode_cursor(next_cursor(items, 2, "name"), "name") == ("B", 2)
+
+def test_short_page_has_no_next_cursor():
+    items = [SimpleNamespace(id=1, name="A")]
+
+    assert next_cursor(items, 2, "name") is None
+    assert next_cursor([], 0, "name") is None
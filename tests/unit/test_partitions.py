@@ -0,0 +1,84 @@
+import datetime
+
+from app.database.partitions import (
+    add_months,
+    create_month_partitions,
+    ensure_future_partitions,
+    month_start,
+    month_windows
+)
+
+UTC = datetime.timezone.utc
+
+class RecordingConnection:
+    class dialect:
+        name = "postgresql"
+
+    def __init__(self, partitioned=True):
+        self.partitioned = partitioned
+        self.statements = []
+
+    def execute(self, statement, parameters=None):
+        self.statements.append(str(statement))
+        connection = self
+
+        class Result:
+            def first(self):
+                return (1,) if connection.partitioned else None
+
+        return Result()
+
+def test_month_start_is_utc():
+    moment = datetime.datetime(2024, 3, 1, 1, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=3)))
+
+    assert month_start(moment) == datetime.datetime(2024, 2, 1, tzinfo=UTC)
+    assert month_start(datetime.datetime(2024, 3, 15)) == datetime.datetime(2024, 3, 1, tzinfo=UTC)
+
+def test_add_months_crosses_years():
+    january = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+
+    assert add_months(january, -1) == datetime.datetime(2023, 12, 1, tzinfo=UTC)
+    assert add_months(january, 13) == datetime.datetime(2025, 2, 1, tzinfo=UTC)
+
+def test_month_windows_walk_back_newest_first():
+    windows = list(month_windows(
+        datetime.datetime(2024, 2, 10, tzinfo=UTC),
+        datetime.datetime(2023, 12, 31, tzinfo=UTC)
+    ))
+
+    assert windows == [
+        (datetime.datetime(2024, 2, 1, tzinfo=UTC), datetime.datetime(2024, 3, 1, tzinfo=UTC)),
+        (datetime.datetime(2024, 1, 1, tzinfo=UTC), datetime.datetime(2024, 2, 1, tzinfo=UTC)),
+        (datetime.datetime(2023, 12, 1, tzinfo=UTC), datetime.datetime(2024, 1, 1, tzinfo=UTC)),
+    ]
+
+def test_create_month_partitions_covers_orders_and_items():
+    connection = RecordingConnection()
+
+    created = create_month_partitions(
+        connection,
+        datetime.datetime(2024, 12, 5, tzinfo=UTC),
+        datetime.datetime(2025, 1, 20, tzinfo=UTC)
+    )
+
+    assert created == [
+        "tb_orders_p2024_12", "tb_order_items_p2024_12",
+        "tb_orders_p2025_01", "tb_order_items_p2025_01",
+    ]
+    assert connection.statements[0] == (
+        "CREATE TABLE IF NOT EXISTS tb_orders_p2024_12 PARTITION OF tb_orders "
+        "FOR VALUES FROM ('2024-12-01T00:00:00+00:00') TO ('2025-01-01T00:00:00+00:00')"
+    )
+
+def test_ensure_future_partitions_runs_ahead_of_today():
+    connection = RecordingConnection()
+
+    created = ensure_future_partitions(connection, months_ahead=2, today=datetime.datetime(2024, 11, 30, tzinfo=UTC))
+
+    assert created[::2] == ["tb_orders_p2024_11", "tb_orders_p2024_12", "tb_orders_p2025_01"]
+
+def test_ensure_future_partitions_skips_unpartitioned_tables():
+    connection = RecordingConnection(partitioned=False)
+
+    assert ensure_future_partitions(connection) == []
+    assert len(connection.statements) == 1
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException, status
+
+from app.services import password_service as password_module
+from app.services.password_service import PasswordService
+
+@pytest.fixture
+def password_service():
+    service = PasswordService(executor_kind="thread", max_workers=2, max_pending=4)
+    yield service
+    service.shutdown()
+
+def test_hash_and_verify_password(password_service):
+    async def scenario():
+        hashed = await password_service.hash_password("secret123")
+        return (
+            hashed,
+            await password_service.verify_password("secret123", hashed),
+            await password_service.verify_password("wrong", hashed),
+        )
+
+    hashed, valid, invalid = asyncio.run(scenario())
+
+    assert hashed != "secret123"
+    assert valid is True
+    assert invalid is False
+    assert password_service.stats()["completed"] == 3
+    assert password_service.stats()["pending"] == 0
+
+def test_saturated_pool_rejects_with_503(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(password_module, "_hash_password", lambda password: release.wait(5))
+
+    service = PasswordService(
+        executor_kind="thread",
+        max_workers=1,
+        max_pending=1,
+        executor=ThreadPoolExecutor(max_workers=1)
+    )
+
+    async def scenario():
+        blocked = asyncio.ensure_future(service.hash_password("first"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as exc:
+            await service.hash_password("second")
+
+        release.set()
+        await blocked
+        return exc.value
+
+    error = asyncio.run(scenario())
+    service.shutdown()
+
+    assert error.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert error.headers["Retry-After"] == "1"
+    assert service.stats()["rejected"] == 1
+
+def test_failed_operations_are_not_counted_as_completed(password_service, monkeypatch):
+    def broken_hash(password):
+        raise ValueError("bad salt")
+    monkeypatch.setattr(password_module, "_hash_password", broken_hash)
+
+    with pytest.raises(ValueError):
+        asyncio.run(password_service.hash_password("secret123"))
+
+    stats = password_service.stats()
+    assert stats["failed"] == 1
+    assert stats["completed"] == 0
+    assert stats["pending"] == 0
+
+def test_stats_report_queue_depth(password_service):
+    password_service._pending = 5
+
+    stats = password_service.stats()
+
+    assert stats["pending"] == 5
+    assert stats["queued"] == 3
+    assert stats["executor"] == "thread"
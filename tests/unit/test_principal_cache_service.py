@@ -0,0 +1,72 @@
+import time
+import pytest
+from unittest import mock
+
+from app.models.client_model import ClientModel
+from app.services.principal_cache_service import PrincipalCacheService
+
+@pytest.fixture
+def principal_cache():
+    return PrincipalCacheService(max_size=2, ttl_seconds=60)
+
+@pytest.fixture
+def user():
+    return ClientModel(
+        id=1,
+        name="John Doe",
+        cpf="123.456.789-00",
+        email="john@example.com",
+        password="hashed",
+        role="user"
+    )
+
+def test_get_returns_cached_snapshot(principal_cache, user):
+    principal_cache.set(user.email, user)
+
+    cached = principal_cache.get(user.email)
+
+    assert cached is not user
+    assert cached.id == user.id
+    assert cached.role == user.role
+    assert principal_cache.stats()["hits"] == 1
+
+def test_get_miss_is_counted(principal_cache):
+    assert principal_cache.get("unknown@example.com") is None
+    assert principal_cache.stats()["misses"] == 1
+
+def test_ttl_is_capped_by_token_exp(principal_cache, user):
+    principal_cache.set(user.email, user, token_exp=time.time() - 1)
+
+    assert principal_cache.get(user.email) is None
+
+def test_entry_expires_after_ttl(principal_cache, user):
+    with mock.patch("app.utils.ttl_cache.time.monotonic", return_value=1000.0):
+        principal_cache.set(user.email, user)
+
+    with mock.patch("app.utils.ttl_cache.time.monotonic", return_value=1061.0):
+        assert principal_cache.get(user.email) is None
+
+def test_least_recently_used_entry_is_evicted(principal_cache, user):
+    principal_cache.set("a@example.com", user)
+    principal_cache.set("b@example.com", user)
+    principal_cache.get("a@example.com")
+    principal_cache.set("c@example.com", user)
+
+    assert principal_cache.get("b@example.com") is None
+    assert principal_cache.get("a@example.com") is not None
+    assert principal_cache.stats()["size"] == 2
+
+def test_invalidate_removes_entry(principal_cache, user):
+    principal_cache.set(user.email, user)
+
+    principal_cache.invalidate(user.email, None)
+
+    assert principal_cache.get(user.email) is None
+
+def test_set_after_invalidation_is_discarded(principal_cache, user):
+    generation = principal_cache.generation
+    principal_cache.invalidate(user.email)
+
+    principal_cache.set(user.email, user, generation=generation)
+
+    assert principal_cache.get(user.email) is None
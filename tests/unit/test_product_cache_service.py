@@ -0,0 +1,193 @@
+import pytest
+from decimal import Decimal
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.database import Base
+from app.database.replica import REPLICA_SESSION
+from app.database.instrumentation import count_queries
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_image_model import ProductImageModel
+from app.models.product_model import ProductModel
+from app.schemas.product_schema import ProductUpdate
+from app.services.product_cache_service import (
+    InProcessProductCacheBackend,
+    ProductCacheService,
+    RedisProductCacheBackend
+)
+from app.services.product_service import ProductService
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.expirations = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode()
+        self.expirations[key] = ex
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in self.values if key.startswith(match.rstrip("*"))]
+
+    def dbsize(self):
+        return len(self.values)
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+@pytest.fixture
+def Session(engine):
+    return sessionmaker(bind=engine, autoflush=False)
+
+@pytest.fixture
+def cache():
+    return ProductCacheService(backend=InProcessProductCacheBackend(max_size=100, ttl_seconds=60))
+
+@pytest.fixture
+def service(cache):
+    return ProductService(ProductModel, ProductImageModel, product_cache=cache)
+
+@pytest.fixture
+def product(Session):
+    with Session() as db:
+        product = ProductModel(
+            name="Summer Floral Dress",
+            sale_price=Decimal("129.90"),
+            description="Light dress",
+            stock=10,
+            bar_code="1002003004001",
+            category="Dresses",
+            images=[ProductImageModel(image_path="/img/dress.png")]
+        )
+        db.add(product)
+        db.commit()
+        return product.id
+
+def test_cached_read_skips_the_database(service, cache, Session, engine, product):
+    with Session() as db:
+        first = service.get_cached_product(db, product)
+    with Session() as db, count_queries(engine) as stats:
+        second = service.get_cached_product(db, product)
+
+    assert first == second
+    assert second["images"] == [{"id": 1, "image_path": "/img/dress.png"}]
+    assert stats.statements == 0
+    assert cache.stats()["hits"] == 1
+
+def test_replica_reads_do_not_fill_the_cache(service, cache, Session, product):
+    with Session() as db:
+        db.info[REPLICA_SESSION] = True
+        data = service.get_cached_product(db, product)
+
+    assert data["id"] == product
+    assert cache.get(product) is None
+
+def test_stock_decrease_invalidates_after_commit(service, cache, Session, product):
+    with Session() as db:
+        service.get_cached_product(db, product)
+
+    with Session() as db:
+        service.validate_and_decrease_stock(db, product, 3)
+        service.get_cached_product(db, product)
+        assert cache.get(product) is None
+        db.commit()
+
+    with Session() as db:
+        assert service.get_cached_product(db, product)["stock"] == 7
+
+def test_restore_stock_invalidates_after_commit(service, cache, Session, product):
+    with Session() as db:
+        order = OrderModel(
+            client_id=1,
+            total_amount=Decimal("129.90"),
+            order_items=[OrderItemModel(product_id=product, quantity=2, price_at_moment=Decimal("129.90"))]
+        )
+        db.add(order)
+        db.commit()
+        service.get_cached_product(db, product)
+        service.restore_product_stock(db, order)
+        db.commit()
+
+    assert cache.get(product) is None
+    with Session() as db:
+        assert service.get_cached_product(db, product)["stock"] == 12
+
+def test_rollback_clears_pending_invalidations(service, cache, Session, product):
+    with Session() as db:
+        service.validate_and_decrease_stock(db, product, 3)
+        assert service.get_cached_product(db, product)["stock"] == 7
+        db.rollback()
+        assert "product_cache_pending" not in db.info
+
+    with Session() as db:
+        assert service.get_cached_product(db, product)["stock"] == 10
+
+def test_update_writes_the_new_row_through(service, cache, Session, product):
+    with Session() as db:
+        service.get_cached_product(db, product)
+
+    with Session() as db:
+        service.update_product(db, product, ProductUpdate(sale_price=99.9, stock=4))
+
+    assert cache.get(product)["sale_price"] == 99.9
+    assert cache.get(product)["stock"] == 4
+
+def test_delete_invalidates(service, cache, Session, product, monkeypatch):
+    with Session() as db:
+        service.get_cached_product(db, product)
+        service.delete_product(db, product)
+
+    assert cache.get(product) is None
+
+def test_read_started_before_a_write_is_not_cached(cache, Session, product):
+    with Session() as db:
+        stale = db.get(ProductModel, product)
+        generation = cache.generation
+        cache.invalidate_on_commit(db, product)
+        cache.set(stale, generation)
+
+    assert cache.get(product) is None
+
+def test_redis_backend_round_trips_and_invalidates(Session, product):
+    client = FakeRedis()
+    cache = ProductCacheService(backend=RedisProductCacheBackend(
+        "redis://localhost:6379/0", ttl_seconds=300, client=client
+    ))
+
+    with Session() as db:
+        data = cache.set(db.get(ProductModel, product))
+
+    assert cache.get(product) == data
+    assert client.expirations["product:1"] == 300
+
+    client.set("session:abc", "{}")
+    assert cache.stats()["size"] == 1
+
+    cache.invalidate(product)
+    assert cache.get(product) is None
+    assert cache.stats() == {"size": 0, "max_size": 0, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+def test_redis_backend_requires_client_library(monkeypatch):
+    import builtins
+    real_import = builtins.__import__
+
+    def fail_redis(name, *args, **kwargs):
+        if name == "redis":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fail_redis)
+
+    with pytest.raises(RuntimeError):
+        ProductCacheService(backend_kind=ProductCacheService.REDIS_BACKEND)
@@ -0,0 +1,141 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.database import Base
+from app.database.instrumentation import count_queries
+from app.enums.import_format_enum import ImportFormatEnum
+from app.models.client_model import ClientModel  # noqa: F401 - registers the order mappers
+from app.models.order_item_model import OrderItemModel  # noqa: F401
+from app.models.product_image_model import ProductImageModel
+from app.models.product_model import ProductModel
+from app.services.product_import_service import ProductImportService
+
+HEADER = b"name,sale_price,description,stock,bar_code,category,expiration_date,images"
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+@pytest.fixture
+def db(engine):
+    with sessionmaker(bind=engine, autoflush=False)() as session:
+        yield session
+
+@pytest.fixture
+def service():
+    return ProductImportService(ProductModel, ProductImageModel, chunk_size=2, max_errors=10)
+
+def csv_row(index, **overrides):
+    values = {
+        "name": f"Product {index}",
+        "sale_price": "19.90",
+        "description": "Imported",
+        "stock": "5",
+        "bar_code": f"IMPORT{index:04d}",
+        "category": "Imports",
+        "expiration_date": "",
+        "images": f"/img/{index}-a.png|/img/{index}-b.png",
+        **overrides,
+    }
+    return ",".join(values.values()).encode()
+
+def run_import(service, db, import_format, records):
+    product_import = service.start_import(import_format)
+    numbered = list(enumerate(records, start=1))
+    for start in range(0, len(numbered), service.chunk_size):
+        service.import_chunk(db, product_import, numbered[start:start + service.chunk_size])
+    return product_import.report()
+
+def test_csv_rows_are_created_with_their_images(service, db):
+    report = run_import(service, db, ImportFormatEnum.CSV, [HEADER, csv_row(1), csv_row(2), csv_row(3)])
+
+    assert report == {"imported": 3, "failed": 0, "errors": [], "errors_truncated": False}
+    product = db.query(ProductModel).filter_by(bar_code="IMPORT0002").one()
+    assert product.stock == 5 and product.version == 1
+    assert [image.image_path for image in product.images] == ["/img/2-a.png", "/img/2-b.png"]
+
+def test_ndjson_accepts_image_paths_or_objects(service, db):
+    records = [
+        b'{"name": "A", "sale_price": 1, "description": "d", "stock": 1, "bar_code": "N1", '
+        b'"category": "c", "images": ["/img/a.png"]}',
+        b'{"name": "B", "sale_price": 1, "description": "d", "stock": 1, "bar_code": "N2", '
+        b'"category": "c", "expiration_date": "2027-01-31", "images": [{"image_path": "/img/b.png"}]}',
+    ]
+
+    report = run_import(service, db, ImportFormatEnum.NDJSON, records)
+
+    assert report["imported"] == 2
+    assert db.query(ProductModel).filter_by(bar_code="N2").one().expiration_date.isoformat() == "2027-01-31"
+
+def test_invalid_rows_are_reported_by_line(service, db):
+    records = [
+        HEADER,
+        csv_row(1),
+        csv_row(2, sale_price="free"),
+        csv_row(3, images=""),
+        b"too,few,columns",
+        csv_row(4, bar_code="IMPORT0001"),
+        b"\xff\xfe",
+        csv_row(5),
+    ]
+
+    report = run_import(service, db, ImportFormatEnum.CSV, records)
+
+    assert report["imported"] == 2
+    assert report["failed"] == 5
+    assert [(error["line"], error["bar_code"]) for error in report["errors"]] == [
+        (3, "IMPORT0002"), (4, "IMPORT0003"), (5, None), (6, "IMPORT0001"), (7, None)
+    ]
+    assert report["errors"][0]["errors"][0].startswith("sale_price: ")
+    assert report["errors"][1]["errors"] == [ProductImportService.MISSING_IMAGES]
+    assert report["errors"][2]["errors"] == ["Expected 8 columns, got 3."]
+    assert report["errors"][3]["errors"] == ["Duplicate bar_code (first seen on line 2)."]
+    assert report["errors"][4]["errors"] == [ProductImportService.INVALID_ENCODING]
+
+def test_existing_products_are_skipped_not_fatal(service, db):
+    run_import(service, db, ImportFormatEnum.CSV, [HEADER, csv_row(1)])
+
+    report = run_import(service, db, ImportFormatEnum.CSV, [HEADER, csv_row(1), csv_row(2)])
+
+    assert report["imported"] == 1
+    assert report["errors"] == [{
+        "line": 2, "bar_code": "IMPORT0001", "errors": [ProductImportService.ALREADY_REGISTERED]
+    }]
+    assert db.query(ProductModel).count() == 2
+
+def test_a_chunk_costs_a_constant_number_of_statements(engine, db):
+    service = ProductImportService(ProductModel, ProductImageModel, chunk_size=500)
+    records = [HEADER] + [csv_row(index) for index in range(499)]
+
+    with count_queries(engine) as stats:
+        report = run_import(service, db, ImportFormatEnum.CSV, records)
+
+    assert report["imported"] == 499
+    # INSERT products, INSERT images (one multi-row VALUES each) and COMMIT.
+    assert stats.statements <= 4
+
+def test_error_list_is_capped(service, db):
+    records = [HEADER] + [csv_row(index, stock="many") for index in range(15)]
+
+    report = run_import(service, db, ImportFormatEnum.CSV, records)
+
+    assert report["failed"] == 15
+    assert len(report["errors"]) == 10
+    assert report["errors_truncated"] is True
+
+@pytest.mark.parametrize("content_type, expected", [
+    ("text/csv; charset=utf-8", ImportFormatEnum.CSV),
+    ("application/x-ndjson", ImportFormatEnum.NDJSON),
+])
+def test_format_follows_the_content_type(service, content_type, expected):
+    assert service.format_for(content_type) == expected
+
+def test_unknown_content_type_is_rejected(service):
+    with pytest.raises(HTTPException) as error:
+        service.format_for("application/json")
+
+    assert error.value.status_code == 415
@@ -4,10 +4,13 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from datetime import date
 
+from app.enums.product_sort_enum import ProductSortEnum
 from app.models.product_image_model import ProductImageModel
+from app.services.product_cache_service import InProcessProductCacheBackend, ProductCacheService
 from app.services.product_service import ProductService
 from app.models.product_model import ProductModel
 from app.schemas.product_schema import ProductCreate, ProductUpdate
+from app.utils.pagination import encode_cursor
 
 @pytest.fixture
 def mock_db():
@@ -24,8 +27,12 @@ def mock_product_model():
     return ProductModel
 
 @pytest.fixture
-def product_service(mock_product_model, mock_product_image_model):
-    return ProductService(mock_product_model, mock_product_image_model)
+def product_cache():
+    return ProductCacheService(backend=InProcessProductCacheBackend(max_size=100, ttl_seconds=60))
+
+@pytest.fixture
+def product_service(mock_product_model, mock_product_image_model, product_cache):
+    return ProductService(mock_product_model, mock_product_image_model, product_cache=product_cache)
 
 @pytest.fixture
 def mock_products():
@@ -69,7 +76,9 @@ def mock_products():
 def test_list_products_with_filters(product_service, mock_db, mock_products):
     query = mock_db.query.return_value
     filtered_query = query.filter.return_value
-    paginated_with_offset = filtered_query.offset.return_value
+    ordered_query = filtered_query.order_by.return_value
+    with_images = ordered_query.options.return_value
+    paginated_with_offset = with_images.offset.return_value
     paginated_with_limit = paginated_with_offset.limit.return_value
 
     paginated_with_limit.all.return_value = [mock_products["summer_dress"]]
@@ -90,7 +99,9 @@ def test_list_products_with_filters(product_service, mock_db, mock_products):
 
     mock_db.query.assert_called_once_with(product_service.product_model)
     query.filter.assert_called_once()
-    filtered_query.offset.assert_called_once_with(0)
+    filtered_query.order_by.assert_called_once_with(product_service.product_model.id)
+    ordered_query.options.assert_called_once()
+    with_images.offset.assert_called_once_with(0)
     paginated_with_offset.limit.assert_called_once_with(10)
     paginated_with_limit.all.assert_called_once()
 
@@ -98,14 +109,16 @@ def test_get_product_by_id(product_service, mock_db, mock_products):
     product_found = mock_products["summer_dress"]
     
     query_products = mock_db.query.return_value
-    query_filtered_by_id = query_products.filter.return_value
+    query_with_images = query_products.options.return_value
+    query_filtered_by_id = query_with_images.filter.return_value
     query_filtered_by_id.first.return_value = product_found
 
     result = product_service.get_product_by_id(mock_db, 1)
 
     assert result == product_found
     mock_db.query.assert_called_once_with(product_service.product_model)
-    query_products.filter.assert_called_once()
+    query_products.options.assert_called_once()
+    query_with_images.filter.assert_called_once()
     query_filtered_by_id.first.assert_called_once()
 
 
@@ -199,7 +212,7 @@ def test_update_product_success(product_service, mock_db, mock_products):
         bar_code="1002003004009"
     )
 
-    updated_product = product_service.update_product(
+    updated_product, stale_paths = product_service.update_product(
         mock_db,
         product_id=product_to_update.id,
         product_data=product_update,
@@ -211,6 +224,7 @@ def test_update_product_success(product_service, mock_db, mock_products):
     assert updated_product.sale_price == 139.9
     assert updated_product.stock == 20
     assert updated_product.bar_code == "1002003004009"
+    assert stale_paths == []
     mock_db.commit.assert_called_once()
     mock_db.refresh.assert_called_once_with(product_to_update)
     product_service.get_product_by_id.assert_called_once_with(mock_db, product_to_update.id)
@@ -224,15 +238,16 @@ def test_delete_product_success(product_service, mock_db, mock_products):
 
     with mock.patch('os.path.join', return_value="/mocked/path/to/image.jpg"), \
          mock.patch('os.path.dirname', return_value="/mocked/path/to"), \
-         mock.patch('os.path.exists', return_value=True), \
          mock.patch('shutil.rmtree') as mock_rmtree:
 
-        product_service.delete_product(mock_db, product_to_delete.id)
+        image_folders = product_service.delete_product(mock_db, product_to_delete.id)
 
         mock_db.delete.assert_called_once_with(product_to_delete)
         mock_db.commit.assert_called_once()
 
-        mock_rmtree.assert_any_call("/mocked/path/to")
+        # Folders are left to the caller, to be removed after the commit.
+        assert image_folders == ["/mocked/path/to"]
+        mock_rmtree.assert_not_called()
     
     product_service.get_product_by_id.assert_called_once_with(mock_db, product_to_delete.id)
 
@@ -252,4 +267,20 @@ def test_delete_product_not_found(product_service, mock_db):
     assert exc.value.detail == product_service.PRODUCT_NOT_FOUND
     product_service.get_product_by_id.assert_called_once_with(mock_db, 999)
     mock_db.delete.assert_not_called()
-    mock_db.commit.assert_not_called()
\ No newline at end of file
+    mock_db.commit.assert_not_called()
+def test_list_products_rejects_cursor_with_skip(product_service, mock_db):
+    with pytest.raises(HTTPException) as exc:
+        product_service.list_products(mock_db, skip=10, cursor="abc")
+
+    assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert exc.value.detail == "Use either skip or cursor, not both."
+    mock_db.query.assert_not_called()
+
+def test_list_products_rejects_cursor_from_another_sort(product_service, mock_db):
+    cursor = encode_cursor("name", "Dress", 3)
+
+    with pytest.raises(HTTPException) as exc:
+        product_service.list_products(mock_db, cursor=cursor, sort_by=ProductSortEnum.SALE_PRICE)
+
+    assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert exc.value.detail == "Invalid pagination cursor."
@@ -0,0 +1,87 @@
+import logging
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.database.instrumentation import QueryStats, count_queries, current_query_stats, track_queries
+from app.middleware.query_timing import QueryTimingMiddleware
+
+def make_app(engine, statements, **options):
+    app = FastAPI()
+    app.add_middleware(QueryTimingMiddleware, **options)
+
+    @app.get("/work")
+    def work():
+        with engine.connect() as connection:
+            for _ in range(statements):
+                connection.execute(text("SELECT 1"))
+        return {"ok": True}
+
+    return app
+
+def test_track_queries_counts_statements_in_context(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'q.db'}")
+
+    with track_queries(capture_statements=True) as stats:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+    assert stats.statements == 2
+    assert stats.captured == ["SELECT 1", "SELECT 2"]
+    assert current_query_stats() is None
+
+def test_statements_outside_tracking_are_ignored(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'q.db'}")
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            pass
+
+    assert stats.statements == 0
+
+def test_count_queries_sees_statements_from_other_threads(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'q.db'}")
+    client = TestClient(make_app(engine, statements=3))
+
+    with count_queries(engine) as stats:
+        client.get("/work")
+
+    assert stats.statements == 3
+
+def test_middleware_adds_server_timing_header(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'q.db'}")
+    client = TestClient(make_app(engine, statements=3))
+
+    response = client.get("/work")
+
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="3 queries"' in timing
+    assert ", app;dur=" in timing
+
+def test_middleware_can_skip_server_timing_header(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'q.db'}")
+    client = TestClient(make_app(engine, statements=1, server_timing=False))
+
+    response = client.get("/work")
+
+    assert "server-timing" not in response.headers
+
+def test_middleware_logs_requests_over_budget(tmp_path, caplog):
+    engine = create_engine(f"sqlite:///{tmp_path / 'q.db'}")
+    client = TestClient(make_app(engine, statements=4, statement_budget=3))
+
+    with caplog.at_level(logging.WARNING, logger="app.middleware.query_timing"):
+        client.get("/work")
+
+    assert "GET /work ran 4 statements (budget 3)" in caplog.text
+
+def test_server_timing_header_format():
+    stats = QueryStats()
+    stats.record("SELECT 1", 1.234)
+
+    header = QueryTimingMiddleware.server_timing_header(stats, 10.0)
+
+    assert header == 'db;dur=1.23;desc="1 queries", app;dur=10.00'
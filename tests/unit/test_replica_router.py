@@ -0,0 +1,101 @@
+import time
+import pytest
+from unittest import mock
+from fastapi import Request
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import database
+from app.database.replica import ReplicaRouter, is_replica_session, replica_urls
+
+def make_request(token=None, host="10.0.0.1"):
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return Request({"type": "http", "headers": headers, "client": (host, 1234)})
+
+def make_sessions(path):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE marker (name TEXT)"))
+        connection.execute(text("INSERT INTO marker VALUES (:name)"), {"name": path.stem})
+    return sessionmaker(bind=engine)
+
+def read_marker(session):
+    return session.execute(text("SELECT name FROM marker")).scalar_one()
+
+@pytest.fixture
+def primary_sessions(tmp_path):
+    return make_sessions(tmp_path / "primary.db")
+
+@pytest.fixture
+def router(tmp_path):
+    return ReplicaRouter(
+        [make_sessions(tmp_path / "replica1.db"), make_sessions(tmp_path / "replica2.db")],
+        read_your_writes_seconds=0.2
+    )
+
+def test_replica_urls_are_parsed_from_comma_separated_list():
+    assert replica_urls("sqlite:///a.db, sqlite:///b.db,,") == ["sqlite:///a.db", "sqlite:///b.db"]
+    assert replica_urls("") == []
+
+def test_router_without_replicas_always_reads_from_primary():
+    router = ReplicaRouter([])
+    request = make_request("token")
+
+    router.record_write(request)
+
+    assert router.enabled is False
+    assert router.use_replica(request) is False
+    assert router.stats()["writes"] == 0
+
+def test_replica_sessions_are_handed_out_round_robin(router):
+    first, second, third = (router.replica_session() for _ in range(3))
+
+    assert [read_marker(first), read_marker(second), read_marker(third)] == [
+        "replica1", "replica2", "replica1"
+    ]
+
+def test_replica_sessions_are_marked(router, primary_sessions):
+    assert is_replica_session(router.replica_session()) is True
+    assert is_replica_session(primary_sessions()) is False
+
+def test_client_reads_its_own_writes_from_primary(router):
+    writer = make_request("writer-token")
+    other = make_request("other-token")
+
+    router.record_write(writer)
+
+    assert router.use_replica(writer) is False
+    assert router.use_replica(other) is True
+    assert router.stats()["pinned_clients"] == 1
+
+def test_read_your_writes_window_expires(router):
+    writer = make_request("writer-token")
+
+    router.record_write(writer)
+    time.sleep(0.25)
+
+    assert router.use_replica(writer) is True
+
+def test_anonymous_clients_are_keyed_by_address(router):
+    router.record_write(make_request(host="10.0.0.1"))
+
+    assert router.use_replica(make_request(host="10.0.0.1")) is False
+    assert router.use_replica(make_request(host="10.0.0.2")) is True
+
+def test_get_read_db_switches_between_replica_and_primary(router, primary_sessions):
+    request = make_request("token")
+    primary = primary_sessions()
+
+    with mock.patch.object(database, "replica_router", router):
+        reads = database.get_read_db(request, primary)
+        assert read_marker(next(reads)) == "replica1"
+        reads.close()
+
+        router.record_write(request)
+        reads = database.get_read_db(request, primary)
+        assert next(reads) is primary
+        reads.close()
+
+    stats = router.stats()
+    assert stats["replica_reads"] == 1
+    assert stats["primary_reads"] == 1
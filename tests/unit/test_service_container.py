@@ -0,0 +1,24 @@
+from unittest.mock import MagicMock
+
+from app.container import ServiceContainer, get_container
+
+def test_container_shares_service_instances():
+    container = ServiceContainer()
+
+    assert container.order_service.user_service is container.user_service
+    assert container.order_service.product_service is container.product_service
+    assert container.auth_service.user_service is container.user_service
+    assert container.auth_service.jwt_service is container.jwt_service
+    assert container.user_service.principal_cache is container.principal_cache
+
+def test_product_service_has_image_model():
+    container = ServiceContainer()
+
+    assert container.product_service.product_image_model is not None
+
+def test_get_container_reads_application_state():
+    container = ServiceContainer()
+    request = MagicMock()
+    request.app.state.services = container
+
+    assert get_container(request) is container
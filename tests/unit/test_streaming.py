@@ -0,0 +1,41 @@
+import asyncio
+
+from app.utils.streaming import RecordSplitter, iter_records
+
+def split(chunks, quoted=False):
+    splitter = RecordSplitter(quoted)
+    records = [record for chunk in chunks for record in splitter.feed(chunk)]
+    return records + splitter.close()
+
+def test_records_survive_any_chunk_boundary():
+    body = b'{"a": 1}\n{"a": 2}\r\n\n{"a": 3}'
+    expected = [(1, b'{"a": 1}'), (2, b'{"a": 2}'), (4, b'{"a": 3}')]
+
+    for size in range(1, len(body) + 1):
+        chunks = [body[start:start + size] for start in range(0, len(body), size)]
+        assert split(chunks) == expected
+
+def test_quoted_newlines_stay_in_one_csv_record():
+    body = b'name,description\n"Dress","Light\ndress"\nJeans,Dark\n'
+
+    assert split([body], quoted=True) == [
+        (1, b"name,description"),
+        (2, b'"Dress","Light\ndress"'),
+        (4, b"Jeans,Dark"),
+    ]
+
+def test_byte_order_mark_is_dropped():
+    assert split([b"\xef\xbb\xbfname\n", b"a\n"]) == [(1, b"name"), (2, b"a")]
+
+def test_unterminated_quote_is_returned_for_the_parser_to_reject():
+    assert split([b'a,"open\nb,c\n'], quoted=True) == [(1, b'a,"open\nb,c')]
+
+def test_iter_records_reads_an_async_body():
+    async def body():
+        for chunk in (b"a\nb", b"\nc"):
+            yield chunk
+
+    async def collect():
+        return [record async for record in iter_records(body())]
+
+    assert asyncio.run(collect()) == [(1, b"a"), (2, b"b"), (3, b"c")]
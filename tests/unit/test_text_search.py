@@ -0,0 +1,46 @@
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.models.product_model import ProductModel
+from app.utils.search import contains_pattern, text_search
+
+def test_contains_pattern_escapes_like_wildcards():
+    assert contains_pattern("dress") == "%dress%"
+    assert contains_pattern("50%_off\\") == "%50\\%\\_off\\\\%"
+
+def test_text_search_matches_any_column_case_insensitively():
+    metadata = MetaData()
+    table = Table(
+        "items", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("category", String)
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(insert(table), [
+            {"name": "Summer Dress", "category": "Dresses"},
+            {"name": "Skinny Jeans", "category": "Pants"},
+            {"name": "100% Cotton Tee", "category": "Shirts"},
+            {"name": "1000 Thread Sheet", "category": "Home"},
+        ])
+
+        def search(term, *columns):
+            query = select(table.c.name).where(text_search(term, *columns)).order_by(table.c.id)
+            return connection.execute(query).scalars().all()
+
+        assert search("DRESS", table.c.name) == ["Summer Dress"]
+        assert search("pants", table.c.name, table.c.category) == ["Skinny Jeans"]
+        assert search("100%", table.c.name) == ["100% Cotton Tee"]
+
+def test_trigram_indexes_are_postgresql_only():
+    indexes = {index.name: index for index in ProductModel.__table__.indexes}
+    index = indexes["ix_tb_products_name_trgm"]
+
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert ddl == "CREATE INDEX ix_tb_products_name_trgm ON tb_products USING gin (name gin_trgm_ops)"
+    assert index._ddl_if.dialect == "postgresql"
@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.database import Base
+from app.models.client_model import ClientModel
+from app.services.token_version_service import TokenVersionService
+
+@pytest.fixture
+def Session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tokens.db'}")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+@pytest.fixture
+def user_id(Session):
+    with Session() as db:
+        user = ClientModel(name="Alice", cpf="111.111.111-11", email="alice@example.com", password="x")
+        db.add(user)
+        db.commit()
+        return user.id
+
+def test_new_users_start_at_version_zero(Session, user_id):
+    with Session() as db:
+        assert TokenVersionService().load(db, user_id) == 0
+
+def test_bump_is_seen_by_other_workers_once_their_cache_expires(Session, user_id):
+    writer = TokenVersionService()
+    other_worker = TokenVersionService(ttl_seconds=0)
+    with Session() as db:
+        writer.load(db, user_id)
+
+        writer.bump(db.get(ClientModel, user_id))
+        db.commit()
+        writer.invalidate(user_id)
+
+    assert writer.get_cached(user_id) is None
+    with Session() as db:
+        assert writer.load(db, user_id) == 1
+        assert other_worker.load(db, user_id) == 1
+
+def test_bump_survives_a_restart(Session, user_id):
+    with Session() as db:
+        TokenVersionService().bump(db.get(ClientModel, user_id))
+        db.commit()
+
+    with Session() as db:
+        assert TokenVersionService().load(db, user_id) == 1
+
+def test_deleted_user_has_no_version(Session, user_id):
+    versions = TokenVersionService()
+    with Session() as db:
+        db.delete(db.get(ClientModel, user_id))
+        db.commit()
+        versions.invalidate(user_id)
+
+        assert versions.load(db, user_id) is None
+    assert versions.get_cached(user_id) is None
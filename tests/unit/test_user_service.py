@@ -177,6 +177,48 @@ def test_update_user_success(user_service):
     db_mock.commit.assert_called_once()
     db_mock.refresh.assert_called_once_with(user_to_update)
 
+def test_update_user_invalidates_cached_principal(user_service):
+    db_mock = mock.MagicMock()
+    current_user = ClientModel(id=1, role="admin")
+    user_to_update = ClientModel(id=3, email="alice@example.com", role="user")
+
+    user_service.get_user_by_id = mock.MagicMock(return_value=user_to_update)
+    user_service.check_unique_email = mock.MagicMock()
+    user_service.principal_cache = mock.MagicMock()
+
+    user_data = UserUpdate(email="alice.new@example.com")
+
+    user_service.update_user(db_mock, 3, user_data, current_user)
+
+    user_service.principal_cache.invalidate.assert_called_once_with(
+        "alice@example.com", "alice.new@example.com"
+    )
+
+def test_update_user_role_bumps_token_version(user_service):
+    db_mock = mock.MagicMock()
+    current_user = ClientModel(id=1, role="admin")
+    user_to_update = ClientModel(id=3, email="alice@example.com", role="user")
+
+    user_service.get_user_by_id = mock.MagicMock(return_value=user_to_update)
+    user_service.token_version_service = mock.MagicMock()
+
+    user_service.update_user(db_mock, 3, UserUpdate(role="admin"), current_user)
+
+    user_service.token_version_service.bump.assert_called_once_with(user_to_update)
+    user_service.token_version_service.invalidate.assert_called_once_with(3)
+
+def test_update_user_name_keeps_token_version(user_service):
+    db_mock = mock.MagicMock()
+    current_user = ClientModel(id=3, role="user")
+    user_to_update = ClientModel(id=3, email="alice@example.com", role="user")
+
+    user_service.get_user_by_id = mock.MagicMock(return_value=user_to_update)
+    user_service.token_version_service = mock.MagicMock()
+
+    user_service.update_user(db_mock, 3, UserUpdate(name="Alice W."), current_user)
+
+    user_service.token_version_service.bump.assert_not_called()
+
 def test_update_user_forbidden(user_service):
     db_mock = mock.MagicMock()
     user_id = 2
@@ -228,12 +270,17 @@ def test_delete_user_success(user_service):
     current_user = ClientModel(id=1, role="admin")
     user_id = 2
 
-    user_service.get_user_by_id = mock.MagicMock(return_value=user_id)
+    user_to_delete = ClientModel(id=user_id, email="bob@example.com", role="user")
+    user_service.get_user_by_id = mock.MagicMock(return_value=user_to_delete)
+    user_service.principal_cache = mock.MagicMock()
+    user_service.token_version_service = mock.MagicMock()
 
     user_service.delete_user(db_mock, user_id, current_user=current_user)
 
-    db_mock.delete.assert_called_once_with(user_id)
+    db_mock.delete.assert_called_once_with(user_to_delete)
     db_mock.commit.assert_called_once()
+    user_service.principal_cache.invalidate.assert_called_once_with("bob@example.com")
+    user_service.token_version_service.invalidate.assert_called_once_with(user_id)
 
 def test_delete_user_own_account_forbidden(user_service):
     db_mock = mock.MagicMock()